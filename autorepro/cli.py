@@ -4,6 +4,7 @@
 from __future__ import annotations
 
 import argparse
+import functools
 import json
 import logging
 import os
@@ -11,7 +12,8 @@ import re
 import shlex
 import subprocess
 import sys
-from collections.abc import Generator
+import time
+from collections.abc import Callable, Generator
 from contextlib import contextmanager
 from dataclasses import dataclass, field
 from datetime import datetime
@@ -24,7 +26,7 @@ from autorepro.config.exceptions import (
     FieldValidationError,
 )
 from autorepro.config.models import get_config
-from autorepro.detect import collect_evidence, detect_languages
+from autorepro.detect import collect_evidence, detect_languages, evidence_cache
 from autorepro.env import (
     DevcontainerExistsError,
     DevcontainerMisuseError,
@@ -41,6 +43,7 @@ from autorepro.planner import (
 )
 from autorepro.project_config import load_config as load_project_config
 from autorepro.project_config import resolve_profile as resolve_project_profile
+from autorepro.utils.cli_validation import validation_cache
 from autorepro.utils.decorators import handle_errors, log_operation, time_execution
 from autorepro.utils.file_ops import FileOperations
 from autorepro.utils.logging import configure_logging
@@ -51,6 +54,11 @@ from autorepro.utils.validation_helpers import (
     needs_pr_update_operation,
 )
 
+try:
+    import orjson
+except ImportError:  # Optional: faster encoding for scan --json output
+    orjson = None
+
 
 def ensure_trailing_newline(content: str) -> str:
     """Ensure content ends with exactly one newline."""
@@ -676,6 +684,78 @@ For more information, visit: https://github.com/ali90h/AutoRepro
     return parser
 
 
+@functools.lru_cache(maxsize=1)
+def build_parser() -> argparse.ArgumentParser:
+    """
+    Return the shared argument parser, constructing it on first use.
+
+    Parsing does not mutate the parser, so repeated main() calls in one process
+    (e.g. in-process tests) can reuse it instead of rebuilding every subparser.
+    """
+    return create_parser()
+
+
+def _dump_json(data: object) -> str:
+    """
+    Serialize ``data`` as JSON indented by two spaces.
+
+    Uses orjson when it is installed; its output has the same layout as
+    ``json.dumps(data, indent=2)`` except that it leaves non-ASCII text and DEL
+    unescaped, so such output goes through the stdlib instead. Floats are also
+    formatted differently, which is fine for the scan payload since it holds
+    only strings, ints and bools.
+    """
+    if orjson is not None:
+        text = orjson.dumps(data, option=orjson.OPT_INDENT_2).decode()
+        if text.isascii() and "\x7f" not in text:
+            return text
+    return json.dumps(data, indent=2)
+
+
+def run_scan(  # noqa: PLR0913
+    root: Path = Path("."),
+    *,
+    depth: int | None = None,
+    ignore_patterns: list[str] | None = None,
+    respect_gitignore: bool = False,
+    show_files_sample: int | None = None,
+    collect_evidence_fn: Callable[..., dict[str, dict[str, object]]] | None = None,
+) -> dict[str, object]:
+    """
+    Scan ``root`` and return the result that ``scan --json`` prints.
+
+    Lets callers (and tests) use scan results in-process without going through
+    argument parsing and a JSON dump/load round trip. ``collect_evidence_fn``
+    replaces the evidence collector, e.g. to simulate I/O errors.
+    """
+    if collect_evidence_fn is None:
+        collect_evidence_fn = collect_evidence
+
+    try:
+        evidence = collect_evidence_fn(
+            root,
+            depth=depth,
+            ignore_patterns=ignore_patterns or [],
+            respect_gitignore=respect_gitignore,
+            show_files_sample=show_files_sample,
+        )
+        detected_languages = sorted(evidence.keys())
+    except (OSError, PermissionError):
+        # Handle I/O errors gracefully for JSON output - return empty results
+        evidence = {}
+        detected_languages = []
+
+    # Build JSON output according to schema
+    return {
+        "schema_version": 1,
+        "tool": "autorepro",
+        "tool_version": __version__,
+        "root": str(Path(root).resolve()),
+        "detected": detected_languages,
+        "languages": evidence,
+    }
+
+
 @time_execution(log_threshold=0.5)
 @handle_errors({}, default_return=1, log_errors=True)
 @log_operation("language detection scan")
@@ -692,34 +772,15 @@ def cmd_scan(  # noqa: PLR0913
         ignore_patterns = []
 
     if json_output:
-        # Use new weighted evidence collection for JSON output
-        try:
-            evidence = collect_evidence(
-                Path("."),
-                depth=depth,
-                ignore_patterns=ignore_patterns,
-                respect_gitignore=respect_gitignore,
-                show_files_sample=show_files_sample,
-            )
-            detected_languages = sorted(evidence.keys())
-        except (OSError, PermissionError):
-            # Handle I/O errors gracefully for JSON output - return empty results
-            evidence = {}
-            detected_languages = []
-
-        # Build JSON output according to schema
-        json_result = {
-            "schema_version": 1,
-            "tool": "autorepro",
-            "tool_version": __version__,
-            "root": str(Path(".").resolve()),
-            "detected": detected_languages,
-            "languages": evidence,
-        }
-
-        import json
+        json_result = run_scan(
+            Path("."),
+            depth=depth,
+            ignore_patterns=ignore_patterns,
+            respect_gitignore=respect_gitignore,
+            show_files_sample=show_files_sample,
+        )
 
-        print(json.dumps(json_result, indent=2))
+        print(_dump_json(json_result))
         return 0
     else:
         # Use enhanced evidence collection for text output too
@@ -1034,8 +1095,6 @@ class ReplayConfig:
             raise FieldValidationError("from_path is required", field="from_path")
 
         # File existence validation
-        from pathlib import Path
-
         if not Path(self.from_path).exists():
             raise FieldValidationError(
                 f"input file does not exist: {self.from_path}", field="from_path"
@@ -1410,8 +1469,6 @@ def _output_plan_result(plan_data: PlanData, config: PlanConfig) -> int:
             ),
         )
 
-        import json
-
         content = json.dumps(json_output, indent=2)
     else:
         # Build the reproduction markdown
@@ -1511,8 +1568,6 @@ def _prepare_init_output_path(config: InitConfig) -> None:
 
 def _handle_init_stdout_output(devcontainer_config: dict) -> int:
     """Handle stdout output for init command."""
-    import json
-
     json_content = json.dumps(devcontainer_config, indent=2, sort_keys=True)
     json_content = ensure_trailing_newline(json_content)
     print(json_content, end="")
@@ -2222,8 +2277,6 @@ def cmd_exec(config: ExecConfig | None = None, **kwargs) -> int:
 
 def _parse_jsonl_file(file_path: str) -> list[dict]:
     """Parse JSONL file and return list of run records."""
-    import json
-
     log = logging.getLogger("autorepro")
     run_records = []
 
@@ -2276,10 +2329,6 @@ def _execute_replay_command(
     cmd: str, timeout: int, repo_path: Path | None = None
 ) -> dict:
     """Execute a command for replay and return results."""
-    import subprocess
-    import time
-    from datetime import datetime
-
     log = logging.getLogger("autorepro")
 
     # Determine execution directory
@@ -3006,7 +3055,7 @@ def _dispatch_command(args, parser) -> int:  # noqa: PLR0911
 
 
 def main(argv: list[str] | None = None) -> int:
-    parser = create_parser()
+    parser = build_parser()
     try:
         args = parser.parse_args(argv)
     except SystemExit as e:
@@ -3022,7 +3071,10 @@ def main(argv: list[str] | None = None) -> int:
     log = logging.getLogger("autorepro")
 
     try:
-        return _dispatch_command(args, parser)
+        # Commands do not modify the trees they scan, so e.g. report's ENV and SCAN
+        # sections can share one walk, and argument checks can share path stats
+        with evidence_cache(), validation_cache():
+            return _dispatch_command(args, parser)
     except (OSError, PermissionError) as e:
         log.error(f"Error: {e}")
         return 1
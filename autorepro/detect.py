@@ -1,8 +1,13 @@
 """Language detection logic for AutoRepro."""
 
+import contextlib
+import copy
 import fnmatch
+import functools
 import glob
 import os
+import re
+from collections.abc import Iterator
 from dataclasses import dataclass
 from pathlib import Path
 
@@ -300,8 +305,107 @@ def _process_exact_filename(
         )
 
 
-def _should_ignore_path(  # noqa: C901, PLR0912
-    path: Path, root: Path, ignore_patterns: list[str], respect_gitignore: bool
+@functools.lru_cache(maxsize=128)
+def _load_gitignore_lines(path: str, mtime_ns: int, size: int) -> tuple[str, ...]:
+    """
+    Read the pattern lines of a .gitignore file, skipping blanks and comments.
+
+    ``mtime_ns`` and ``size`` are unused in the body; they are part of the cache
+    key so that editing the file invalidates the cached patterns.
+    """
+    with open(path, encoding="utf-8") as f:
+        stripped = (line.strip() for line in f)
+        return tuple(line for line in stripped if line and not line.startswith("#"))
+
+
+def _read_gitignore(root: Path) -> tuple[str, ...] | None:
+    """
+    Return the .gitignore patterns for ``root``, parsing the file at most once.
+
+    Returns:
+        Pattern lines, or None if there is no readable .gitignore
+    """
+    gitignore_path = root / ".gitignore"
+    try:
+        stat = gitignore_path.stat()
+        return _load_gitignore_lines(
+            str(gitignore_path), stat.st_mtime_ns, stat.st_size
+        )
+    except (OSError, UnicodeDecodeError):
+        # Ignore errors reading .gitignore
+        return None
+
+
+def _gitignore_line_globs(line: str) -> tuple[bool, list[str]]:
+    """
+    Translate one .gitignore line into fnmatch globs over root-relative paths.
+
+    Returns:
+        Tuple of (whether a match ignores the path, globs that match it)
+    """
+    ignores = not line.startswith("!")
+    pattern = line if ignores else line[1:]  # Remove the ! of negations
+    if pattern.endswith("/"):
+        # Directory pattern: matches everything inside the directory
+        dir_pattern = pattern.rstrip("/")
+        globs = [dir_pattern + "/*", dir_pattern + "/**/*"]
+        if ignores:
+            # Paths whose first component is the literal directory name
+            globs.append(glob.escape(dir_pattern) + "/*")
+        return ignores, globs
+    return ignores, [pattern, "**/" + pattern]
+
+
+@functools.lru_cache(maxsize=128)
+def _compile_gitignore(
+    gitignore_lines: tuple[str, ...],
+) -> tuple[re.Pattern[str], tuple[bool, ...]]:
+    """
+    Compile .gitignore lines into one regex so each path is matched in one pass.
+
+    Every line becomes a named alternative ``p<i>``. Alternatives are listed in
+    reverse line order, so the one that matches is the *last* matching line,
+    which is the one that decides the result (later negations win).
+
+    Returns:
+        Tuple of (compiled union pattern, ignore/negate flag per line)
+    """
+    alternatives = []
+    polarity = []
+    for index, line in enumerate(gitignore_lines):
+        ignores, globs = _gitignore_line_globs(line)
+        polarity.append(ignores)
+        body = "|".join(fnmatch.translate(os.path.normcase(g)) for g in globs)
+        alternatives.append(f"(?P<p{index}>{body})")
+    return re.compile("|".join(reversed(alternatives))), tuple(polarity)
+
+
+def _is_gitignored(rel_path_str: str, gitignore_lines: tuple[str, ...]) -> bool:
+    """
+    Check a root-relative path against .gitignore pattern lines.
+
+    Later lines win, so a negation (``!pattern``) can re-include a path that an
+    earlier pattern ignored.
+
+    Args:
+        rel_path_str: Path relative to the scan root
+        gitignore_lines: Pattern lines from _read_gitignore()
+
+    Returns:
+        True if the path is ignored, False otherwise
+    """
+    pattern, polarity = _compile_gitignore(gitignore_lines)
+    match = pattern.match(os.path.normcase(rel_path_str))
+    if match is None or match.lastgroup is None:
+        return False
+    return polarity[int(match.lastgroup[1:])]
+
+
+def _should_ignore_path(
+    path: Path,
+    root: Path,
+    ignore_patterns: list[str],
+    gitignore_lines: tuple[str, ...] | None,
 ) -> bool:
     """
     Check if a path should be ignored based on ignore patterns and gitignore rules.
@@ -310,7 +414,7 @@ def _should_ignore_path(  # noqa: C901, PLR0912
         path: Path to check
         root: Root directory for relative path calculation
         ignore_patterns: List of ignore patterns (glob-style)
-        respect_gitignore: Whether to respect .gitignore rules
+        gitignore_lines: .gitignore pattern lines, or None to skip gitignore rules
 
     Returns:
         True if path should be ignored, False otherwise
@@ -330,72 +434,99 @@ def _should_ignore_path(  # noqa: C901, PLR0912
         ):
             return True
 
-    # Check .gitignore if requested
-    if respect_gitignore:
-        # Enhanced .gitignore support with negation patterns
-        gitignore_path = root / ".gitignore"
-        if gitignore_path.exists():
-            try:
-                ignored = False
-                with open(gitignore_path, encoding="utf-8") as f:
-                    for line in f:
-                        line = line.strip()
-                        if line and not line.startswith("#"):
-                            # Handle negation patterns (!)
-                            if line.startswith("!"):
-                                negation_pattern = line[1:]  # Remove the !
-                                if negation_pattern.endswith("/"):
-                                    dir_pattern = negation_pattern.rstrip("/")
-                                    # Check if file is in negated directory
-                                    if fnmatch.fnmatch(
-                                        rel_path_str, dir_pattern + "/*"
-                                    ) or fnmatch.fnmatch(
-                                        rel_path_str, dir_pattern + "/**/*"
-                                    ):
-                                        ignored = False  # Un-ignore this file
-                                else:
-                                    # Regular negation pattern
-                                    if fnmatch.fnmatch(
-                                        rel_path_str, negation_pattern
-                                    ) or fnmatch.fnmatch(
-                                        rel_path_str, "**/" + negation_pattern
-                                    ):
-                                        ignored = False  # Un-ignore this file
-                            else:
-                                # Regular ignore patterns
-                                # Handle directory patterns (ending with /)
-                                if line.endswith("/"):
-                                    dir_pattern = line.rstrip("/")
-                                    # Check if file is in ignored directory
-                                    path_parts = rel_path_str.split("/")
-                                    if (
-                                        len(path_parts) > 1
-                                        and path_parts[0] == dir_pattern
-                                    ):
-                                        ignored = True
-                                    # Also check full directory path matching
-                                    elif fnmatch.fnmatch(
-                                        rel_path_str, dir_pattern + "/*"
-                                    ) or fnmatch.fnmatch(
-                                        rel_path_str, dir_pattern + "/**/*"
-                                    ):
-                                        ignored = True
-                                else:
-                                    # Regular file pattern
-                                    if fnmatch.fnmatch(
-                                        rel_path_str, line
-                                    ) or fnmatch.fnmatch(rel_path_str, "**/" + line):
-                                        ignored = True
-
-                return ignored
-            except (OSError, UnicodeDecodeError):
-                # Ignore errors reading .gitignore
-                pass
+    # Enhanced .gitignore support with negation patterns
+    if gitignore_lines:
+        return _is_gitignored(rel_path_str, gitignore_lines)
 
     return False
 
 
-def _collect_files_with_depth(  # noqa: C901, PLR0912
+def _is_pruned_dir(
+    rel_dir: str, ignore_patterns: list[str], gitignore_lines: tuple[str, ...]
+) -> bool:
+    """
+    Check whether every file below a directory is certain to be ignored.
+
+    Only rules that provably cover the whole subtree are considered: globs ending
+    in ``*`` that already match ``rel_dir/`` (the trailing ``*`` absorbs whatever
+    follows) and gitignore directory patterns. Everything else is left to the
+    per-file check in _should_ignore_path().
+
+    Args:
+        rel_dir: Directory path relative to the scan root
+        ignore_patterns: List of ignore patterns (glob-style)
+        gitignore_lines: .gitignore pattern lines; must not contain negations
+
+    Returns:
+        True if the directory can be skipped without listing it
+    """
+    probe = rel_dir + "/"
+    for pattern in ignore_patterns:
+        if pattern.endswith("*") and fnmatch.fnmatch(probe, pattern):
+            return True
+
+    for line in gitignore_lines:
+        if line.endswith("/"):
+            dir_pattern = line.rstrip("/")
+            if probe.split("/")[0] == dir_pattern or fnmatch.fnmatch(
+                probe, dir_pattern + "/*"
+            ):
+                return True
+        elif line.endswith("*") and (
+            fnmatch.fnmatch(probe, line) or fnmatch.fnmatch(probe, "**/" + line)
+        ):
+            return True
+
+    return False
+
+
+def _walk_files(
+    root: Path,
+    depth: int | None,
+    ignore_patterns: list[str],
+    gitignore_lines: tuple[str, ...],
+) -> list[Path]:
+    """
+    List files under ``root`` in the same order as ``root.rglob("*")``.
+
+    Directories past ``depth``, or whose entire contents are ignored, are pruned
+    during the top-down walk instead of being listed and filtered afterwards.
+
+    Args:
+        root: Root directory to scan
+        depth: Maximum depth to scan (None for unlimited, 0 for root only)
+        ignore_patterns: List of glob patterns to ignore
+        gitignore_lines: .gitignore pattern lines (empty to skip gitignore rules)
+
+    Returns:
+        Files found under ``root``
+    """
+    # A negation could re-include something inside an ignored directory, so
+    # only prune on .gitignore rules when there are none
+    if any(line.startswith("!") for line in gitignore_lines):
+        gitignore_lines = ()
+
+    files: list[Path] = []
+    for dirpath, dirnames, filenames in os.walk(root):
+        current = Path(dirpath)
+        files.extend(p for p in map(current.joinpath, filenames) if p.is_file())
+
+        rel_dir = current.relative_to(root)
+        if depth is not None and len(rel_dir.parts) >= depth:
+            # Files in subdirectories would exceed the maximum depth
+            dirnames.clear()
+        elif ignore_patterns or gitignore_lines:
+            dirnames[:] = [
+                d
+                for d in dirnames
+                if not _is_pruned_dir(
+                    str(rel_dir / d), ignore_patterns, gitignore_lines
+                )
+            ]
+    return files
+
+
+def _collect_files_with_depth(
     root: Path,
     depth: int | None = None,
     ignore_patterns: list[str] | None = None,
@@ -430,33 +561,20 @@ def _collect_files_with_depth(  # noqa: C901, PLR0912
     # Organize results by pattern
     results: dict[str, list[Path]] = {pattern: [] for pattern in all_patterns.keys()}
 
-    # Use rglob to find all files
-    if depth == 0:
-        # Only scan root directory
-        scan_paths = [p for p in root.iterdir() if p.is_file()]
-    else:
-        # Use rglob for recursive scanning
-        scan_paths = list(root.rglob("*"))
-        # Filter by depth if specified
-        if depth is not None:
-            filtered_paths = []
-            for p in scan_paths:
-                if p.is_file():
-                    rel_path = p.relative_to(root)
-                    # Count directory depth (not including the filename)
-                    dir_depth = len(rel_path.parts) - 1
-                    if dir_depth <= depth:
-                        filtered_paths.append(p)
-            scan_paths = filtered_paths
-        else:
-            scan_paths = [p for p in scan_paths if p.is_file()]
+    # Read .gitignore once for the whole walk
+    gitignore_lines = _read_gitignore(root) if respect_gitignore else None
 
-    # Filter out ignored paths
-    scan_paths = [
-        p
-        for p in scan_paths
-        if not _should_ignore_path(p, root, ignore_patterns, respect_gitignore)
-    ]
+    scan_paths = _walk_files(root, depth, ignore_patterns, gitignore_lines or ())
+
+    # Pruning only drops whole directories; individual files still need checking.
+    # When nothing could match (no --ignore patterns and no .gitignore rules)
+    # skip filtering entirely
+    if ignore_patterns or gitignore_lines:
+        scan_paths = [
+            p
+            for p in scan_paths
+            if not _should_ignore_path(p, root, ignore_patterns, gitignore_lines)
+        ]
 
     # Match files against patterns
     for file_path in scan_paths:
@@ -520,7 +638,31 @@ def _collect_files_sample(
     return result
 
 
-def collect_evidence(  # noqa: C901
+# collect_evidence() results keyed by resolved root and scan options while an
+# evidence_cache() block is active; None when memoization is off
+_EVIDENCE_CACHE: dict[tuple[object, ...], dict[str, dict[str, object]]] | None = None
+
+
+@contextlib.contextmanager
+def evidence_cache() -> Iterator[None]:
+    """
+    Reuse collect_evidence() results for the same tree inside the block.
+
+    The tree is assumed not to change while the block is active, so callers
+    should keep it around a single command. Nested blocks share the outer cache.
+    """
+    global _EVIDENCE_CACHE
+    if _EVIDENCE_CACHE is not None:
+        yield
+        return
+    _EVIDENCE_CACHE = {}
+    try:
+        yield
+    finally:
+        _EVIDENCE_CACHE = None
+
+
+def collect_evidence(
     root: Path,
     depth: int | None = None,
     ignore_patterns: list[str] | None = None,
@@ -530,6 +672,9 @@ def collect_evidence(  # noqa: C901
     """
     Collect weighted evidence for language detection with enhanced filtering.
 
+    Inside an evidence_cache() block, repeated scans of the same tree with the
+    same options walk the filesystem once.
+
     Args:
         root: Directory path to scan for language indicators
         depth: Maximum depth to scan (None for unlimited, 0 for root only)
@@ -547,6 +692,37 @@ def collect_evidence(  # noqa: C901
             }
         }
     """
+    if _EVIDENCE_CACHE is None:
+        return _scan_evidence(
+            root, depth, ignore_patterns, respect_gitignore, show_files_sample
+        )
+
+    key = (
+        str(Path(root).resolve()),
+        depth,
+        tuple(ignore_patterns or ()),
+        respect_gitignore,
+        show_files_sample,
+    )
+    cached = _EVIDENCE_CACHE.get(key)
+    if cached is None:
+        cached = _scan_evidence(
+            root, depth, ignore_patterns, respect_gitignore, show_files_sample
+        )
+        _EVIDENCE_CACHE[key] = cached
+
+    # Hand out a copy so callers cannot mutate the cached evidence
+    return copy.deepcopy(cached)
+
+
+def _scan_evidence(  # noqa: C901
+    root: Path,
+    depth: int | None,
+    ignore_patterns: list[str] | None,
+    respect_gitignore: bool,
+    show_files_sample: int | None,
+) -> dict[str, dict[str, object]]:
+    """Walk ``root`` and build collect_evidence()'s result without memoization."""
     evidence: dict[str, dict[str, object]] = {}
     root_path = Path(root)
 
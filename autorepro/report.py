@@ -12,6 +12,7 @@ import logging
 import os
 import platform
 import shlex
+import shutil
 import subprocess
 import sys
 import tempfile
@@ -33,6 +34,9 @@ from .planner import (
 )
 from .utils.repro_bundle import generate_plan_content
 
+# Fixed member timestamp (the earliest a zip can encode) for reproducible bundles
+ZIP_FIXED_DATE_TIME = (1980, 1, 1, 0, 0, 0)
+
 
 @dataclass
 class ExecOutputConfig:
@@ -319,7 +323,7 @@ def _execute_command_subprocess(
 
 def _write_exec_output_logs(config: ExecOutputConfig) -> None:
     """Write execution results to log and JSONL files."""
-    # Write log file
+    # Build log file content
     log_content = (
         f"=== {config.start_iso} - {config.command_str} ===\n"
         "STDOUT:\n"
@@ -329,9 +333,8 @@ def _write_exec_output_logs(config: ExecOutputConfig) -> None:
         f"\nExit code: {config.exit_code}\n"
         "=" * 50 + "\n\n"
     )
-    FileOperations.atomic_write(config.log_path, log_content)
 
-    # Write JSONL file
+    # Build JSONL record
     stdout_preview = config.stdout_full[:2000] if config.stdout_full else ""
     stderr_preview = config.stderr_full[:2000] if config.stderr_full else ""
 
@@ -351,7 +354,10 @@ def _write_exec_output_logs(config: ExecOutputConfig) -> None:
     }
 
     jsonl_content = json.dumps(jsonl_record) + "\n"
-    FileOperations.atomic_write(config.jsonl_path, jsonl_content)
+    # Both logs usually share a directory, so it is synced once for the pair
+    FileOperations.batch_atomic_writes(
+        [(config.log_path, log_content), (config.jsonl_path, jsonl_content)]
+    )
 
 
 def maybe_exec(
@@ -445,10 +451,34 @@ def maybe_exec(
         os.chdir(original_cwd)
 
 
+def _zip_member_info(archive_name: str) -> zipfile.ZipInfo:
+    """Build a ZipInfo with a fixed timestamp so identical inputs zip identically."""
+    info = zipfile.ZipInfo(archive_name, date_time=ZIP_FIXED_DATE_TIME)
+    info.compress_type = zipfile.ZIP_DEFLATED
+    info.external_attr = 0o600 << 16
+    return info
+
+
+def _zip_write_path(zf: zipfile.ZipFile, path: Path, archive_name: str) -> None:
+    """Add ``path`` like ZipFile.write, but with the fixed timestamp."""
+    info = zipfile.ZipInfo.from_file(path, archive_name)
+    info.date_time = ZIP_FIXED_DATE_TIME
+    if info.is_dir():
+        zf.writestr(info, b"")
+        return
+    info.compress_type = zipfile.ZIP_DEFLATED
+    # Stream the file rather than reading it into memory first
+    with path.open("rb") as src, zf.open(info, "w") as dst:
+        shutil.copyfileobj(src, dst)
+
+
 def pack_zip(out_path: Path, files: dict[str, Path | str | bytes]) -> None:
     """
     Pack files into a zip archive.
 
+    Members are written in sorted order with a fixed timestamp, so the same
+    inputs always produce a byte-identical archive.
+
     Args:
         out_path: Output zip file path
         files: Dictionary mapping archive names to file paths, strings, or bytes
@@ -464,15 +494,12 @@ def pack_zip(out_path: Path, files: dict[str, Path | str | bytes]) -> None:
                 if isinstance(content, Path):
                     # Add file from path
                     if content.exists():
-                        zf.write(content, archive_name)
+                        _zip_write_path(zf, content, archive_name)
                     else:
                         log.warning(f"File not found, skipping: {content}")
-                elif isinstance(content, str):
-                    # Add string content
-                    zf.writestr(archive_name, content)
-                elif isinstance(content, bytes):
-                    # Add bytes content
-                    zf.writestr(archive_name, content)
+                elif isinstance(content, str | bytes):
+                    # Add string or bytes content
+                    zf.writestr(_zip_member_info(archive_name), content)
                 else:
                     log.warning(
                         f"Unknown content type for {archive_name}: {type(content)}"
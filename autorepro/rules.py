@@ -136,20 +136,65 @@ def _handle_plugin_loading_error(plugin_name: str, error: Exception) -> None:
         )
 
 
+# Loaded plugin rules keyed by (AUTOREPRO_PLUGINS, AUTOREPRO_PLUGINS_DEBUG)
+_PLUGIN_CACHE: dict[tuple[str, str], dict[str, list[Rule]]] = {}
+
+# provide_rules() output per plugin entry, shared across plugin combinations
+_MODULE_CACHE: dict[str, dict[str, list[Rule]]] = {}
+
+
+def _plugin_cache_key() -> tuple[str, str]:
+    """Return the environment values that determine which plugins get loaded."""
+    return (
+        os.environ.get("AUTOREPRO_PLUGINS", ""),
+        os.environ.get("AUTOREPRO_PLUGINS_DEBUG", ""),
+    )
+
+
+def clear_plugin_cache() -> None:
+    """Forget memoized plugin rules so the next lookup re-imports plugins."""
+    _PLUGIN_CACHE.clear()
+    _MODULE_CACHE.clear()
+
+
+def _load_single_plugin_rules(plugin_name: str) -> dict[str, list[Rule]]:
+    """
+    Load rules provided by one plugin, reusing earlier results for that entry.
+
+    Raises:
+        Exception: Whatever importing the plugin raised; failures are not cached
+    """
+    cached = _MODULE_CACHE.get(plugin_name)
+    if cached is None:
+        cached = {}
+        _extract_rules_from_module(_load_plugin_module(plugin_name), cached)
+        _MODULE_CACHE[plugin_name] = cached
+    return cached
+
+
 def _load_plugin_rules() -> dict[str, list[Rule]]:
-    """Load rules from plugins specified in AUTOREPRO_PLUGINS environment variable."""
-    plugin_rules: dict[str, list[Rule]] = {}
-    plugins = _get_plugin_list()
-
-    for plugin_name in plugins:
-        try:
-            plugin_module = _load_plugin_module(plugin_name)
-            _extract_rules_from_module(plugin_module, plugin_rules)
-        except Exception as e:
-            _handle_plugin_loading_error(plugin_name, e)
-            continue
-
-    return plugin_rules
+    """
+    Load rules from plugins specified in AUTOREPRO_PLUGINS environment variable.
+
+    Results are memoized per plugin environment, so repeated lookups in the
+    same process skip the import and provide_rules() calls.
+    """
+    key = _plugin_cache_key()
+    cached = _PLUGIN_CACHE.get(key)
+    if cached is None:
+        cached = {}
+        for plugin_name in _get_plugin_list():
+            try:
+                module_rules = _load_single_plugin_rules(plugin_name)
+            except Exception as e:
+                _handle_plugin_loading_error(plugin_name, e)
+                continue
+            for ecosystem, rules in module_rules.items():
+                cached.setdefault(ecosystem, []).extend(rules)
+        _PLUGIN_CACHE[key] = cached
+
+    # Hand out fresh lists so callers cannot mutate the cached rules
+    return {ecosystem: list(rules) for ecosystem, rules in cached.items()}
 
 
 def get_rules() -> dict[str, list[Rule]]:
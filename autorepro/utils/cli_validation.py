@@ -5,8 +5,59 @@ This module provides consistent CLI argument validation with clear error message
 replacing duplicate patterns found across AutoRepro CLI commands.
 """
 
+import codecs
+import contextlib
+import os
+import stat
+from collections.abc import Callable, Iterator
 from pathlib import Path
 
+# validate_file_exists only decodes this much of the file, so validation cost
+# does not grow with the size of the input
+_READ_CHECK_BYTES = 4096
+
+
+# Path checks keyed on absolute path, memoized while a validation_cache() block
+# is active; None when memoization is off
+_PATH_STAT_CACHE: dict[str, tuple[bool, bool, bool]] | None = None
+
+
+@contextlib.contextmanager
+def validation_cache() -> Iterator[None]:
+    """
+    Reuse path checks for the same path inside the block.
+
+    Paths are assumed not to appear or disappear while the block is active, so
+    callers should keep it around a single command. Nested blocks share the
+    outer cache; outside any block every check stats the path afresh.
+    """
+    global _PATH_STAT_CACHE
+    if _PATH_STAT_CACHE is not None:
+        yield
+        return
+    _PATH_STAT_CACHE = {}
+    try:
+        yield
+    finally:
+        _PATH_STAT_CACHE = None
+
+
+def _path_stat(path: str) -> tuple[bool, bool, bool]:
+    """Return ``(exists, is_dir, is_file)`` for ``path`` from a single stat()."""
+    key = os.path.abspath(path)
+    cache = _PATH_STAT_CACHE
+    if cache is not None and key in cache:
+        return cache[key]
+    try:
+        mode = os.stat(key).st_mode
+    except (FileNotFoundError, NotADirectoryError):
+        result = (False, False, False)
+    else:
+        result = (True, stat.S_ISDIR(mode), stat.S_ISREG(mode))
+    if cache is not None:
+        cache[key] = result
+    return result
+
 
 class ArgumentValidator:
     """CLI argument validation with consistent error messages."""
@@ -44,8 +95,8 @@ class ArgumentValidator:
             return None
 
         try:
-            out_path = Path(out)
-            if out_path.exists() and out_path.is_dir():
+            exists, is_dir, _ = _path_stat(os.fspath(out))
+            if exists and is_dir:
                 return f"Output path cannot be a directory: {out}"
         except (OSError, ValueError) as e:
             return f"Invalid output path '{out}': {e}"
@@ -67,10 +118,10 @@ class ArgumentValidator:
             return None
 
         try:
-            repo_path = Path(repo)
-            if not repo_path.exists():
+            exists, is_dir, _ = _path_stat(os.fspath(repo))
+            if not exists:
                 return f"Repository path does not exist: {repo}"
-            if not repo_path.is_dir():
+            if not is_dir:
                 return f"Repository path is not a directory: {repo}"
         except (OSError, ValueError) as e:
             return f"Invalid repository path '{repo}': {e}"
@@ -112,13 +163,19 @@ class ArgumentValidator:
 
         try:
             path = Path(file_path)
-            if not path.exists():
+            exists, _, is_file = _path_stat(os.fspath(file_path))
+            if not exists:
                 return f"{arg_name} does not exist: {file_path}"
-            if not path.is_file():
+            if not is_file:
                 return f"{arg_name} is not a file: {file_path}"
-            # Test readability
+            # Test readability on a prefix; a multibyte character cut off at
+            # the prefix boundary is not an error unless the file ends there
             try:
-                path.read_text(encoding="utf-8")
+                with path.open("rb") as f:
+                    head = f.read(_READ_CHECK_BYTES)
+                codecs.getincrementaldecoder("utf-8")().decode(
+                    head, final=len(head) < _READ_CHECK_BYTES
+                )
             except (OSError, UnicodeDecodeError) as e:
                 return f"Cannot read {arg_name.lower()}: {e}"
 
@@ -168,6 +225,28 @@ def validate_multiple(*validator_results: str | None, exit_code: int = 2) -> Non
             raise ValidationError(result, exit_code)
 
 
+def validate_multiple_lazy(
+    *validators: Callable[[], str | None], exit_code: int = 2
+) -> None:
+    """
+    Run validators in order and raise ValidationError on the first failure.
+
+    Unlike validate_multiple, validators after the first failing one are never
+    called, so expensive checks (e.g. validate_file_exists) can be skipped.
+
+    Args:
+        validators: Zero-argument callables returning an ArgumentValidator result
+        exit_code: Exit code to use if validation fails
+
+    Raises:
+        ValidationError: If any validator returns an error message
+    """
+    for validator in validators:
+        result = validator()
+        if result is not None:
+            raise ValidationError(result, exit_code)
+
+
 class CommonConfigValidator:
     """Common configuration validation patterns for CLI dataclasses."""
 
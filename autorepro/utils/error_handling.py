@@ -10,7 +10,7 @@ import contextlib
 import logging
 import subprocess
 from collections.abc import Generator
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 from pathlib import Path
 
 from .file_ops import FileOperations
@@ -170,8 +170,6 @@ def safe_subprocess_run_simple(
             text=subprocess_kwargs.get("text", True),
             check=subprocess_kwargs.get("check", False),
         )
-    else:
-        run_config.cmd = cmd
     return _safe_subprocess_run_impl(cmd, run_config, operation, log_command)
 
 
@@ -205,16 +203,8 @@ def _safe_subprocess_run_impl(
     if config is None:
         config = SubprocessConfig(cmd=cmd)
     else:
-        # Override command if provided explicitly
-        config = SubprocessConfig(
-            cmd=cmd,
-            cwd=config.cwd,
-            env=config.env,
-            timeout=config.timeout,
-            capture_output=config.capture_output,
-            text=config.text,
-            check=config.check,
-        )
+        # Override command if provided explicitly; configs are immutable
+        config = replace(config, cmd=cmd)
 
     # Format command for logging
     cmd_str = cmd if isinstance(cmd, str) else " ".join(cmd)
@@ -6,10 +6,33 @@ patterns found across the AutoRepro codebase.
 """
 
 import json
+import logging
+import os
 import tempfile
+from collections.abc import Iterable
 from pathlib import Path
 from typing import Any
 
+_WRITE_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0)
+
+
+def _fsync_dir(path: Path) -> None:
+    """Flush directory entries (e.g. renames) in ``path`` to disk where supported."""
+    if not hasattr(os, "O_DIRECTORY"):
+        return  # Windows cannot open a directory for fsync
+    fd = os.open(path, os.O_RDONLY | os.O_DIRECTORY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+def _write_all(fd: int, data: bytes) -> None:
+    """Write all of ``data`` to ``fd``, looping only if a write comes up short."""
+    view = memoryview(data)
+    while view:
+        view = view[os.write(fd, view) :]
+
 
 class FileOperations:
     """Centralized file operations with consistent error handling."""
@@ -43,17 +66,30 @@ class FileOperations:
         Raises:
             OSError: If file cannot be written due to permissions or I/O error
         """
-        try:
-            # Ensure parent directory exists
-            FileOperations.ensure_directory(path.parent)
+        # Encode up front so the temp file gets the whole payload in one write
+        FileOperations._atomic_write_bytes(path, content.encode(encoding))
 
+    @staticmethod
+    def _atomic_write_bytes(path: Path, data: bytes) -> None:
+        """atomic_write for an already-encoded payload."""
+        try:
             # Write to temporary file first
             temp_path = path.with_suffix(path.suffix + ".tmp")
-            with open(temp_path, "w", encoding=encoding) as f:
-                f.write(content)
-
-            # Atomic rename
-            temp_path.rename(path)
+            try:
+                fd = os.open(temp_path, _WRITE_FLAGS, 0o666)
+            except FileNotFoundError:
+                # Only create the parent once it is known to be missing, so the
+                # usual write into an existing directory skips the mkdir probe
+                FileOperations.ensure_directory(path.parent)
+                fd = os.open(temp_path, _WRITE_FLAGS, 0o666)
+            try:
+                _write_all(fd, data)
+                os.fsync(fd)
+            finally:
+                os.close(fd)
+
+            # Atomic rename, replacing any existing target
+            os.replace(temp_path, path)
 
         except (OSError, PermissionError) as e:
             # Clean up temp file if it exists
@@ -65,6 +101,38 @@ class FileOperations:
                     pass  # Best effort cleanup
             raise OSError(f"Failed to write file: {path}") from e
 
+    @staticmethod
+    def batch_atomic_writes(
+        items: Iterable[tuple[Path, str]], encoding: str = "utf-8"
+    ) -> None:
+        """
+        Atomically write several files, then sync each parent directory once.
+
+        Each file goes through the same temp file + rename as atomic_write.
+        Afterwards every distinct parent directory gets one best-effort fsync
+        so the renames survive a crash. Some filesystems (certain FUSE, network
+        and overlay mounts) reject directory fsync; the files are already in
+        place by then, so such failures are only logged at debug level.
+
+        Args:
+            items: (path, content) pairs to write, in order
+            encoding: File encoding (default: utf-8)
+
+        Raises:
+            OSError: If a file cannot be written
+        """
+        parents: dict[Path, None] = {}
+        for path, content in items:
+            FileOperations._atomic_write_bytes(path, content.encode(encoding))
+            parents.setdefault(path.parent, None)
+        for parent in parents:
+            try:
+                _fsync_dir(parent)
+            except OSError as e:
+                logging.getLogger("autorepro").debug(
+                    f"Cannot sync directory {parent}: {e}"
+                )
+
     @staticmethod
     def safe_read_text(
         path: Path, encoding: str = "utf-8", default: str | None = None
@@ -144,14 +212,19 @@ class FileOperations:
             # Ensure trailing newline for consistent formatting
             if not json_content.endswith("\n"):
                 json_content += "\n"
-
-            FileOperations.atomic_write(path, json_content)
-
+            payload = json_content.encode("utf-8")
         except (TypeError, ValueError) as e:
             raise OSError(f"Failed to serialize JSON data: {e}") from e
 
+        FileOperations._atomic_write_bytes(path, payload)
+
 
-def create_temp_file(content: str, suffix: str = "", encoding: str = "utf-8") -> Path:
+def create_temp_file(
+    content: str,
+    suffix: str = "",
+    encoding: str = "utf-8",
+    dir: str | Path | None = None,
+) -> Path:
     """
     Create a temporary file with content and return the path.
 
@@ -159,6 +232,7 @@ def create_temp_file(content: str, suffix: str = "", encoding: str = "utf-8") ->
         content: Content to write to temp file
         suffix: File suffix (default: empty)
         encoding: File encoding (default: utf-8)
+        dir: Directory to create the file in (default: system temp dir)
 
     Returns:
         Path to the created temporary file
@@ -166,8 +240,14 @@ def create_temp_file(content: str, suffix: str = "", encoding: str = "utf-8") ->
     Note:
         Caller is responsible for cleaning up the temporary file.
     """
-    with tempfile.NamedTemporaryFile(
-        mode="w", suffix=suffix, encoding=encoding, delete=False
-    ) as f:
-        f.write(content)
-        return Path(f.name)
+    data = content.encode(encoding)
+    # mkstemp already hands back an open descriptor; write to it directly
+    fd, name = tempfile.mkstemp(suffix=suffix, dir=dir)
+    try:
+        _write_all(fd, data)
+    except BaseException:
+        os.close(fd)
+        os.unlink(name)
+        raise
+    os.close(fd)
+    return Path(name)
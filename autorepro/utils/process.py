@@ -5,12 +5,28 @@ This module provides consistent subprocess execution with error handling, replac
 duplicate patterns found across the AutoRepro codebase.
 """
 
+import os
 import subprocess
 from dataclasses import dataclass
 from pathlib import Path
 
 
-@dataclass
+def _decode_output(data: bytes | str | None) -> str:
+    """Decode captured output in one pass, translating newlines like text mode."""
+    if not data:
+        return ""
+    text = data if isinstance(data, str) else data.decode("utf-8", errors="replace")
+    if "\r" in text:
+        text = text.replace("\r\n", "\n").replace("\r", "\n")
+    return text
+
+
+def _split_cmd(cmd: str | list[str]) -> list[str]:
+    """Return ``cmd`` as a fresh argument list, splitting strings on whitespace."""
+    return cmd.split() if isinstance(cmd, str) else list(cmd)
+
+
+@dataclass(slots=True, frozen=True)
 class SubprocessConfig:
     """Configuration for subprocess execution."""
 
@@ -26,6 +42,8 @@ class SubprocessConfig:
 class ProcessResult:
     """Result of a process execution."""
 
+    __slots__ = ("exit_code", "stdout", "stderr", "cmd")
+
     def __init__(self, exit_code: int, stdout: str, stderr: str, cmd: list[str]):
         self.exit_code = exit_code
         self.stdout = stdout
@@ -60,7 +78,8 @@ class ProcessRunner:
         Args:
             cmd: Command to run (string or list of strings)
             cwd: Working directory for command execution
-            env: Environment variables (merged with current env if provided)
+            env: Environment for the child, replacing the current one; passed
+                through without copying, so do not mutate it while the call runs
             timeout: Timeout in seconds (None for no timeout)
             check: If True, raise exception on non-zero exit code
 
@@ -73,45 +92,40 @@ class ProcessRunner:
             FileNotFoundError: If command executable is not found
             OSError: If command cannot be executed
         """
-        # Convert string command to list
-        if isinstance(cmd, str):
-            cmd_list = cmd.split()
-        else:
-            cmd_list = list(cmd)
+        cmd_list = _split_cmd(cmd)
 
         # Convert path objects to strings
         if cwd is not None:
-            cwd = str(cwd)
+            cwd = os.fspath(cwd)
 
         try:
+            # Capture raw bytes and decode each stream once below; undecodable
+            # output is replaced rather than raising
             result = subprocess.run(
                 cmd_list,
                 cwd=cwd,
                 env=env,
                 timeout=timeout,
                 capture_output=True,
-                text=True,
                 check=check,
             )
 
             return ProcessResult(
                 exit_code=result.returncode,
-                stdout=result.stdout,
-                stderr=result.stderr,
+                stdout=_decode_output(result.stdout),
+                stderr=_decode_output(result.stderr),
                 cmd=cmd_list,
             )
 
+        except subprocess.CalledProcessError as e:
+            # Keep the str output callers got when this ran in text mode
+            e.output = _decode_output(e.output)
+            e.stderr = _decode_output(e.stderr)
+            raise
         except subprocess.TimeoutExpired as e:
-            stdout_str = ""
-            if e.stdout:
-                stdout_str = (
-                    e.stdout.decode("utf-8")
-                    if isinstance(e.stdout, bytes)
-                    else e.stdout
-                )
             return ProcessResult(
                 exit_code=124,  # Standard timeout exit code
-                stdout=stdout_str,
+                stdout=_decode_output(e.stdout),
                 stderr=f"Command timed out after {timeout} seconds",
                 cmd=cmd_list,
             )
@@ -220,15 +234,12 @@ def safe_subprocess_run(config: SubprocessConfig) -> subprocess.CompletedProcess
         FileNotFoundError: If command is not found
         OSError: If command cannot be executed
     """
-    # Convert string command to list if needed
-    cmd = config.cmd
-    if isinstance(cmd, str):
-        cmd = cmd.split()
+    cmd = _split_cmd(config.cmd)
 
     # Convert path to string if needed
     cwd = config.cwd
     if cwd is not None:
-        cwd = str(cwd)
+        cwd = os.fspath(cwd)
 
     return subprocess.run(
         cmd,
@@ -0,0 +1,68 @@
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+_WRITE_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0)
+
+
+def _write_file(name: str | Path, data: bytes, dir_fd: int | None = None) -> None:
+    """Write ``data`` with a bare os.open/os.write, relative to ``dir_fd`` if given."""
+    fd = os.open(name, _WRITE_FLAGS, 0o644, dir_fd=dir_fd)
+    try:
+        os.write(fd, data)
+    finally:
+        os.close(fd)
+
+
+def write_tree(root: Path, files: dict[str, bytes]) -> None:
+    """Create ``root`` and write each ``{relpath: bytes}`` entry beneath it."""
+    root.mkdir(parents=True, exist_ok=True)
+    if os.open not in os.supports_dir_fd:
+        for relpath, data in files.items():
+            path = root / relpath
+            path.parent.mkdir(parents=True, exist_ok=True)
+            _write_file(path, data)
+        return
+
+    # Resolve every marker file against one open handle on root, creating each
+    # parent directory once however many files it holds
+    made_dirs = {""}
+    dir_fd = os.open(root, os.O_RDONLY | os.O_DIRECTORY)
+    try:
+        for relpath, data in files.items():
+            parent = os.path.dirname(relpath)
+            if parent not in made_dirs:
+                (root / parent).mkdir(parents=True, exist_ok=True)
+                made_dirs.add(parent)
+            _write_file(relpath, data, dir_fd)
+    finally:
+        os.close(dir_fd)
+
+
+def remove_tree(root: Path, files: dict[str, bytes]) -> None:
+    """Undo write_tree(root, files) without scanning the directories.
+
+    Only the listed entries are removed, so a file added by other means makes
+    the final rmdir fail instead of being silently deleted.
+    """
+    dirs = set()
+    for relpath in files:
+        parent = os.path.dirname(relpath)
+        while parent and parent not in dirs:
+            dirs.add(parent)
+            parent = os.path.dirname(parent)
+    if os.unlink in os.supports_dir_fd:
+        dir_fd = os.open(root, os.O_RDONLY | os.O_DIRECTORY)
+        try:
+            for relpath in files:
+                os.unlink(relpath, dir_fd=dir_fd)
+        finally:
+            os.close(dir_fd)
+    else:
+        for relpath in files:
+            os.unlink(root / relpath)
+    # Deepest directories first so each is empty when removed
+    for relpath in sorted(dirs, key=lambda d: d.count("/"), reverse=True):
+        os.rmdir(root / relpath)
+    os.rmdir(root)
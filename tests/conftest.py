@@ -1,10 +1,16 @@
 """Shared test fixtures and configuration."""
 
+import os
+import re
+import shutil
 import tempfile
 from pathlib import Path
 
 import pytest
 
+# RAM-backed filesystem used for scratch trees when the host provides one
+_SHM_DIR = Path("/dev/shm")
+
 
 @pytest.fixture
 def temp_workspace():
@@ -30,3 +36,52 @@ def isolated_environment(temp_workspace, monkeypatch):
         monkeypatch.delenv(var, raising=False)
 
     return temp_workspace
+
+
+@pytest.fixture(scope="session")
+def fast_tmp_root():
+    """Session scratch directory on /dev/shm when writable, else the system tmp."""
+    if _SHM_DIR.is_dir() and os.access(_SHM_DIR, os.W_OK | os.X_OK):
+        base = _SHM_DIR
+    else:
+        base = Path(tempfile.gettempdir())
+    root = Path(tempfile.mkdtemp(prefix=f"autorepro-tests-{os.getpid()}-", dir=base))
+    yield root
+    shutil.rmtree(root, ignore_errors=True)
+
+
+@pytest.fixture(scope="session")
+def shared_tmp(tmp_path_factory):
+    """Session directory that per-test work dirs are carved out of."""
+    return tmp_path_factory.mktemp("shared")
+
+
+@pytest.fixture
+def work_dir(shared_tmp, request):
+    """Fresh subdirectory of shared_tmp named after the test.
+
+    It is removed with its session directory.
+    """
+    # The node id is unique across modules, unlike the bare test name
+    path = shared_tmp / re.sub(r"[^\w.-]", "_", request.node.nodeid)
+    path.mkdir()
+    return path
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--runslow",
+        action="store_true",
+        default=False,
+        help="also run tests marked slow (real subprocess forks)",
+    )
+
+
+def pytest_collection_modifyitems(config, items):
+    """Skip slow tests unless --runslow is given; CI always passes it."""
+    if config.getoption("--runslow"):
+        return
+    skip_slow = pytest.mark.skip(reason="slow; pass --runslow to run")
+    for item in items:
+        if "slow" in item.keywords:
+            item.add_marker(skip_slow)
@@ -6,38 +6,38 @@ from unittest.mock import patch
 
 import pytest
 
-from autorepro.cli import main
+from autorepro.cli import build_parser, create_parser, main
 
 
 class TestCLIHelp:
     """Test CLI help functionality and exit codes."""
 
-    def test_help_flag_short_returns_zero_exit_code(self):
+    def test_help_flag_short_returns_zero_exit_code(self, monkeypatch):
         """Test that -h flag returns exit code 0."""
-        with patch("sys.argv", ["autorepro", "-h"]):
-            exit_code = main()
-            assert exit_code == 0
+        monkeypatch.setattr(sys, "argv", ["autorepro", "-h"])
+        exit_code = main()
+        assert exit_code == 0
 
-    def test_help_flag_long_returns_zero_exit_code(self):
+    def test_help_flag_long_returns_zero_exit_code(self, monkeypatch):
         """Test that --help flag returns exit code 0."""
-        with patch("sys.argv", ["autorepro", "--help"]):
-            exit_code = main()
-            assert exit_code == 0
+        monkeypatch.setattr(sys, "argv", ["autorepro", "--help"])
+        exit_code = main()
+        assert exit_code == 0
 
-    def test_no_arguments_shows_help_and_returns_zero(self):
+    def test_no_arguments_shows_help_and_returns_zero(self, monkeypatch):
         """Test that calling without commands displays help and returns exit code 0."""
-        with patch("sys.argv", ["autorepro"]):
-            exit_code = main()
-            assert exit_code == 0
+        monkeypatch.setattr(sys, "argv", ["autorepro"])
+        exit_code = main()
+        assert exit_code == 0
 
     @pytest.mark.parametrize("help_flag", ["-h", "--help"])
-    def test_help_output_contains_program_info(self, help_flag, capsys):
+    def test_help_output_contains_program_info(self, help_flag, capsys, monkeypatch):
         """Test that help output contains program name and description."""
-        with patch("sys.argv", ["autorepro", help_flag]):
-            try:
-                main()
-            except SystemExit:
-                pass  # argparse calls sys.exit for help, which is expected
+        monkeypatch.setattr(sys, "argv", ["autorepro", help_flag])
+        try:
+            main()
+        except SystemExit:
+            pass  # argparse calls sys.exit for help, which is expected
 
         captured = capsys.readouterr()
         help_output = captured.out + captured.err
@@ -50,11 +50,11 @@ class TestCLIHelp:
             for keyword in ["autorepro", "repro", "issue", "workspace", "cli"]
         )
 
-    def test_no_args_help_output_contains_program_info(self, capsys):
+    def test_no_args_help_output_contains_program_info(self, capsys, monkeypatch):
         """Test that no-args help output contains program name and description."""
-        with patch("sys.argv", ["autorepro"]):
-            exit_code = main()
-            assert exit_code == 0
+        monkeypatch.setattr(sys, "argv", ["autorepro"])
+        exit_code = main()
+        assert exit_code == 0
 
         captured = capsys.readouterr()
         help_output = captured.out + captured.err
@@ -67,6 +67,15 @@ class TestCLIHelp:
             for keyword in ["autorepro", "repro", "issue", "workspace", "cli"]
         )
 
+    def test_parser_built_once_across_main_calls(self, capsys):
+        """Test repeated in-process main() calls reuse one argument parser."""
+        build_parser.cache_clear()
+        with patch("autorepro.cli.create_parser", wraps=create_parser) as create:
+            assert main([]) == 0
+            assert main(["scan", "--help"]) == 0
+        assert create.call_count == 1
+        assert build_parser() is build_parser()
+
 
 class TestCLIIntegration:
     """Integration tests using subprocess to test the actual CLI command."""
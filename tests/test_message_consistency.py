@@ -5,12 +5,12 @@ Tests that:
 2. --out - prints only content and ignores --force
 """
 
-from tests.test_utils import run_autorepro_subprocess
+from tests.test_utils import run_autorepro_inprocess
 
 
-def run_cli_subprocess(args, cwd=None):
-    """Run autorepro CLI via subprocess."""
-    return run_autorepro_subprocess(args, cwd=cwd)
+def run_cli(args, cwd=None):
+    """Run autorepro CLI in-process; these tests only check stdout and files."""
+    return run_autorepro_inprocess(args, cwd=cwd)
 
 
 class TestMessageConsistency:
@@ -19,12 +19,12 @@ class TestMessageConsistency:
     def test_init_message_consistency(self, tmp_path):
         """Test that init messages use consistent prepositions."""
         # First write - should say "to"
-        result1 = run_cli_subprocess(["init"], cwd=tmp_path)
+        result1 = run_cli(["init"], cwd=tmp_path)
         assert result1.returncode == 0
         assert "Wrote devcontainer to" in result1.stdout
 
         # Force overwrite - should say "at" (not "to")
-        result2 = run_cli_subprocess(["init", "--force"], cwd=tmp_path)
+        result2 = run_cli(["init", "--force"], cwd=tmp_path)
         assert result2.returncode == 0
         assert "Overwrote devcontainer at" in result2.stdout
         assert "No changes." in result2.stdout
@@ -32,12 +32,12 @@ class TestMessageConsistency:
     def test_plan_message_consistency(self, tmp_path):
         """Test that plan messages use consistent format."""
         # First write - should say "to"
-        result1 = run_cli_subprocess(["plan", "--desc", "test issue"], cwd=tmp_path)
+        result1 = run_cli(["plan", "--desc", "test issue"], cwd=tmp_path)
         assert result1.returncode == 0
         assert "Wrote repro to" in result1.stdout
 
         # Already exists - should show path first
-        result2 = run_cli_subprocess(["plan", "--desc", "test issue"], cwd=tmp_path)
+        result2 = run_cli(["plan", "--desc", "test issue"], cwd=tmp_path)
         assert result2.returncode == 0
         assert "repro.md exists; use --force to overwrite" in result2.stdout
 
@@ -46,14 +46,14 @@ class TestMessageConsistency:
         custom_path = tmp_path / "custom_repro.md"
 
         # First write with custom path
-        result1 = run_cli_subprocess(
+        result1 = run_cli(
             ["plan", "--desc", "test issue", "--out", str(custom_path)], cwd=tmp_path
         )
         assert result1.returncode == 0
         assert f"Wrote repro to {custom_path}" in result1.stdout
 
         # Already exists with custom path
-        result2 = run_cli_subprocess(
+        result2 = run_cli(
             ["plan", "--desc", "test issue", "--out", str(custom_path)], cwd=tmp_path
         )
         assert result2.returncode == 0
@@ -66,10 +66,10 @@ class TestStdoutIgnoresForce:
     def test_init_stdout_ignores_force_no_write_messages(self, tmp_path):
         """Test that init --out - ignores --force and shows no write messages."""
         # Create existing devcontainer first
-        run_cli_subprocess(["init"], cwd=tmp_path)
+        run_cli(["init"], cwd=tmp_path)
 
         # Test --out - with --force - should only show JSON content
-        result = run_cli_subprocess(["init", "--out", "-", "--force"], cwd=tmp_path)
+        result = run_cli(["init", "--out", "-", "--force"], cwd=tmp_path)
 
         assert result.returncode == 0
         # Should contain JSON content
@@ -84,10 +84,10 @@ class TestStdoutIgnoresForce:
     def test_plan_stdout_ignores_force_no_write_messages(self, tmp_path):
         """Test that plan --out - ignores --force and shows no write messages."""
         # Create existing repro file first
-        run_cli_subprocess(["plan", "--desc", "test issue"], cwd=tmp_path)
+        run_cli(["plan", "--desc", "test issue"], cwd=tmp_path)
 
         # Test --out - with --force - should only show markdown content
-        result = run_cli_subprocess(
+        result = run_cli(
             ["plan", "--desc", "different issue", "--out", "-", "--force"], cwd=tmp_path
         )
 
@@ -103,7 +103,7 @@ class TestStdoutIgnoresForce:
     def test_init_stdout_no_file_modification(self, tmp_path):
         """Test that init --out - doesn't modify existing files even with --force."""
         # Create initial devcontainer
-        result1 = run_cli_subprocess(["init"], cwd=tmp_path)
+        result1 = run_cli(["init"], cwd=tmp_path)
         assert result1.returncode == 0
 
         devcontainer_file = tmp_path / ".devcontainer" / "devcontainer.json"
@@ -111,7 +111,7 @@ class TestStdoutIgnoresForce:
         original_mtime = devcontainer_file.stat().st_mtime
 
         # Use --out - with --force
-        result2 = run_cli_subprocess(["init", "--out", "-", "--force"], cwd=tmp_path)
+        result2 = run_cli(["init", "--out", "-", "--force"], cwd=tmp_path)
         assert result2.returncode == 0
 
         # File should be unchanged
@@ -121,7 +121,7 @@ class TestStdoutIgnoresForce:
     def test_plan_stdout_no_file_modification(self, tmp_path):
         """Test that plan --out - doesn't modify existing files even with --force."""
         # Create initial repro file
-        result1 = run_cli_subprocess(["plan", "--desc", "original issue"], cwd=tmp_path)
+        result1 = run_cli(["plan", "--desc", "original issue"], cwd=tmp_path)
         assert result1.returncode == 0
 
         repro_file = tmp_path / "repro.md"
@@ -129,7 +129,7 @@ class TestStdoutIgnoresForce:
         original_mtime = repro_file.stat().st_mtime
 
         # Use --out - with --force and different content
-        result2 = run_cli_subprocess(
+        result2 = run_cli(
             ["plan", "--desc", "completely different issue", "--out", "-", "--force"],
             cwd=tmp_path,
         )
@@ -144,10 +144,10 @@ class TestStdoutIgnoresForce:
     def test_dry_run_also_ignores_force(self, tmp_path):
         """Test that --dry-run also ignores --force and shows no write messages."""
         # Create existing repro file first
-        run_cli_subprocess(["plan", "--desc", "test issue"], cwd=tmp_path)
+        run_cli(["plan", "--desc", "test issue"], cwd=tmp_path)
 
         # Test --dry-run with --force - should only show markdown content
-        result = run_cli_subprocess(
+        result = run_cli(
             ["plan", "--desc", "different issue", "--dry-run", "--force"], cwd=tmp_path
         )
 
@@ -2,8 +2,19 @@
 
 import os
 
+from tests._fs_util import write_tree
 from tests.test_utils import run_autorepro_subprocess
 
+PYPROJECT_BYTES = b'[build-system]\nrequires = ["setuptools"]'
+PACKAGE_JSON_BYTES = b'{"name": "test-project", "version": "1.0.0"}'
+GO_MOD_BYTES = b"module test\n\ngo 1.19"
+
+_MARKERS = {
+    "python": ("pyproject.toml", PYPROJECT_BYTES),
+    "node": ("package.json", PACKAGE_JSON_BYTES),
+    "go": ("go.mod", GO_MOD_BYTES),
+}
+
 
 def run_cli_subprocess(args, cwd=None):
     """Helper to run autorepro CLI via subprocess."""
@@ -12,16 +23,8 @@ def run_cli_subprocess(args, cwd=None):
 
 def create_project_markers(tmp_path, project_type="python"):
     """Create minimal marker files for different project types."""
-    if project_type == "python":
-        (tmp_path / "pyproject.toml").write_text(
-            '[build-system]\nrequires = ["setuptools"]'
-        )
-    elif project_type == "node":
-        (tmp_path / "package.json").write_text(
-            '{"name": "test-project", "version": "1.0.0"}'
-        )
-    elif project_type == "go":
-        (tmp_path / "go.mod").write_text("module test\n\ngo 1.19")
+    name, data = _MARKERS[project_type]
+    write_tree(tmp_path, {name: data})
 
 
 class TestRepoPathStability:
@@ -31,7 +34,6 @@ class TestRepoPathStability:
         """Test that --repo ./dir/ and --repo dir produce same result for plan."""
         # Create a test repo directory
         repo_dir = tmp_path / "test_repo"
-        repo_dir.mkdir()
         create_project_markers(repo_dir, "python")
 
         # Test with ./dir/ format
@@ -122,7 +124,6 @@ class TestRepoPathStability:
         """Test that --repo does not change the current working directory."""
         # Create repo directory
         repo_dir = tmp_path / "test_repo"
-        repo_dir.mkdir()
         create_project_markers(repo_dir, "node")
 
         # Record original CWD
@@ -7,17 +7,19 @@ import tempfile
 import zipfile
 from pathlib import Path
 
+from tests._fs_util import write_tree
+from tests.test_utils import run_autorepro_inprocess
+
 
 class TestReportCLI:
     """Test report command functionality."""
 
     def test_report_help(self):
-        """Test --help shows report command help."""
+        """Test --help shows report command help via the module entry point."""
         result = subprocess.run(
             [sys.executable, "-m", "autorepro.cli", "report", "--help"],
             capture_output=True,
             text=True,
-            cwd=".",
         )
 
         assert result.returncode == 0
@@ -27,32 +29,21 @@ class TestReportCLI:
 
     def test_report_requires_desc_or_file(self):
         """Test report requires either --desc or --file."""
-        result = subprocess.run(
-            [sys.executable, "-m", "autorepro.cli", "report"],
-            capture_output=True,
-            text=True,
-            cwd=".",
-        )
+        result = run_autorepro_inprocess(["report"])
 
         assert result.returncode == 2
         assert "error" in result.stderr.lower()
 
     def test_report_stdout_preview(self):
         """Test --out - shows preview with schema=v2."""
-        result = subprocess.run(
+        result = run_autorepro_inprocess(
             [
-                sys.executable,
-                "-m",
-                "autorepro.cli",
                 "report",
                 "--desc",
                 "test issue",
                 "--out",
                 "-",
-            ],
-            capture_output=True,
-            text=True,
-            cwd=".",
+            ]
         )
 
         assert result.returncode == 0
@@ -65,15 +56,13 @@ class TestReportCLI:
         """Test report with scan and init includes."""
         with tempfile.TemporaryDirectory() as tmpdir:
             # Create a minimal Python environment
-            (Path(tmpdir) / "pyproject.toml").write_text(
-                "[build-system]\nrequires = ['setuptools']"
+            write_tree(
+                Path(tmpdir),
+                {"pyproject.toml": b"[build-system]\nrequires = ['setuptools']"},
             )
 
-            result = subprocess.run(
+            result = run_autorepro_inprocess(
                 [
-                    sys.executable,
-                    "-m",
-                    "autorepro.cli",
                     "report",
                     "--desc",
                     "pytest failing",
@@ -83,10 +72,7 @@ class TestReportCLI:
                     str(Path(tmpdir) / "test.zip"),
                     "--repo",
                     tmpdir,
-                ],
-                capture_output=True,
-                text=True,
-                cwd=".",
+                ]
             )
 
             assert result.returncode == 0
@@ -114,20 +100,14 @@ class TestReportCLI:
     def test_report_default_sections(self):
         """Test report includes plan and env by default."""
         with tempfile.TemporaryDirectory() as tmpdir:
-            result = subprocess.run(
+            result = run_autorepro_inprocess(
                 [
-                    sys.executable,
-                    "-m",
-                    "autorepro.cli",
                     "report",
                     "--desc",
                     "test issue",
                     "--out",
                     str(Path(tmpdir) / "test.zip"),
-                ],
-                capture_output=True,
-                text=True,
-                cwd=".",
+                ]
             )
 
             assert result.returncode == 0
@@ -148,20 +128,14 @@ class TestReportCLI:
 
     def test_report_invalid_include_sections(self):
         """Test report with invalid include sections fails."""
-        result = subprocess.run(
+        result = run_autorepro_inprocess(
             [
-                sys.executable,
-                "-m",
-                "autorepro.cli",
                 "report",
                 "--desc",
                 "test issue",
                 "--include",
                 "invalid,section",
-            ],
-            capture_output=True,
-            text=True,
-            cwd=".",
+            ]
         )
 
         assert result.returncode == 1
@@ -171,22 +145,16 @@ class TestReportCLI:
         """Test report with --file input."""
         with tempfile.TemporaryDirectory() as tmpdir:
             issue_file = Path(tmpdir) / "issue.txt"
-            issue_file.write_text("pytest is failing")
+            write_tree(Path(tmpdir), {"issue.txt": b"pytest is failing"})
 
-            result = subprocess.run(
+            result = run_autorepro_inprocess(
                 [
-                    sys.executable,
-                    "-m",
-                    "autorepro.cli",
                     "report",
                     "--file",
                     str(issue_file),
                     "--out",
                     str(Path(tmpdir) / "test.zip"),
-                ],
-                capture_output=True,
-                text=True,
-                cwd=".",
+                ]
             )
 
             assert result.returncode == 0
@@ -196,23 +164,17 @@ class TestReportCLI:
         """Test report --force overwrites existing file."""
         with tempfile.TemporaryDirectory() as tmpdir:
             zip_path = Path(tmpdir) / "test.zip"
-            zip_path.write_text("existing content")
+            write_tree(Path(tmpdir), {"test.zip": b"existing content"})
 
-            result = subprocess.run(
+            result = run_autorepro_inprocess(
                 [
-                    sys.executable,
-                    "-m",
-                    "autorepro.cli",
                     "report",
                     "--desc",
                     "test issue",
                     "--out",
                     str(zip_path),
                     "--force",
-                ],
-                capture_output=True,
-                text=True,
-                cwd=".",
+                ]
             )
 
             assert result.returncode == 0
@@ -222,22 +184,16 @@ class TestReportCLI:
         """Test report fails when file exists and no --force."""
         with tempfile.TemporaryDirectory() as tmpdir:
             zip_path = Path(tmpdir) / "test.zip"
-            zip_path.write_text("existing content")
+            write_tree(Path(tmpdir), {"test.zip": b"existing content"})
 
-            result = subprocess.run(
+            result = run_autorepro_inprocess(
                 [
-                    sys.executable,
-                    "-m",
-                    "autorepro.cli",
                     "report",
                     "--desc",
                     "test issue",
                     "--out",
                     str(zip_path),
-                ],
-                capture_output=True,
-                text=True,
-                cwd=".",
+                ]
             )
 
             assert result.returncode == 1
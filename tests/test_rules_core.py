@@ -3,8 +3,27 @@
 import os
 from unittest.mock import patch
 
+import pytest
+
 from autorepro.planner import suggest_commands
-from autorepro.rules import BUILTIN_RULES, Rule, _load_plugin_rules, get_rules
+from autorepro.rules import (
+    BUILTIN_RULES,
+    Rule,
+    _load_plugin_module,
+    _load_plugin_rules,
+    clear_plugin_cache,
+    get_rules,
+)
+
+BUILTIN_PYTHON_COUNT = len(BUILTIN_RULES["python"])
+
+
+@pytest.fixture
+def fresh_plugin_cache():
+    """Force plugins to be re-imported for tests that observe loading side effects."""
+    clear_plugin_cache()
+    yield
+    clear_plugin_cache()
 
 
 class TestRulesCore:
@@ -66,8 +85,7 @@ class TestRulesCore:
 
             # Python should have builtin + plugin rules
             python_rules = rules["python"]
-            builtin_count = len(BUILTIN_RULES["python"])
-            assert len(python_rules) == builtin_count + 1  # +1 for demo rule
+            assert len(python_rules) == BUILTIN_PYTHON_COUNT + 1  # +1 for demo rule
 
             # Find our demo rule
             demo_rules = [r for r in python_rules if "smoke" in r.keywords]
@@ -164,7 +182,7 @@ def provide_rules():
             assert file_rules[0].cmd == "pytest --file-plugin"
             assert "file" in file_rules[0].keywords
 
-    def test_plugin_debug_flag(self, capsys):
+    def test_plugin_debug_flag(self, capsys, fresh_plugin_cache):
         """Test debug flag shows plugin loading errors."""
         with patch.dict(
             os.environ,
@@ -178,9 +196,53 @@ def provide_rules():
             assert "Plugin loading failed" in captured.err
             assert "nonexistent.plugin.module" in captured.err
 
-    def test_plugin_debug_flag_off_by_default(self, capsys):
+    def test_plugin_debug_flag_off_by_default(self, capsys, fresh_plugin_cache):
         """Test plugin errors are silent by default."""
         with patch.dict(os.environ, {"AUTOREPRO_PLUGINS": "nonexistent.plugin.module"}):
             _load_plugin_rules()
             captured = capsys.readouterr()
             assert captured.err == ""  # Should be silent
+
+    def test_plugin_rules_memoized_per_environment(self, fresh_plugin_cache):
+        """Test repeated lookups reuse loaded plugins until the env changes."""
+        env = {"AUTOREPRO_PLUGINS": "tests.fixtures.demo_rules"}
+        with (
+            patch.dict(os.environ, env),
+            patch(
+                "autorepro.rules._load_plugin_module", wraps=_load_plugin_module
+            ) as load_module,
+        ):
+            first = _load_plugin_rules()
+            second = _load_plugin_rules()
+            assert first == second
+            assert load_module.call_count == 1
+
+            # Callers get their own lists and cannot corrupt the cache
+            first["python"].clear()
+            assert len(_load_plugin_rules()["python"]) == 1
+
+            clear_plugin_cache()
+            _load_plugin_rules()
+            assert load_module.call_count == 2
+
+    def test_plugin_module_rules_shared_across_combinations(self, fresh_plugin_cache):
+        """Test a plugin listed in several AUTOREPRO_PLUGINS values loads once."""
+        with patch(
+            "autorepro.rules._load_plugin_module", wraps=_load_plugin_module
+        ) as load_module:
+            with patch.dict(
+                os.environ, {"AUTOREPRO_PLUGINS": "tests.fixtures.demo_rules"}
+            ):
+                single = _load_plugin_rules()
+            with patch.dict(
+                os.environ,
+                {"AUTOREPRO_PLUGINS": "tests.fixtures.demo_rules,missing.plugin"},
+            ):
+                combined = _load_plugin_rules()
+
+        assert single == combined
+        # demo_rules imported once; the missing plugin attempted once
+        assert [c.args[0] for c in load_module.call_args_list] == [
+            "tests.fixtures.demo_rules",
+            "missing.plugin",
+        ]
@@ -1,222 +1,127 @@
 """Tests for enhanced scan functionality with golden files."""
 
-import json
-import tempfile
+import functools
 from pathlib import Path
 
 import pytest
 
 from autorepro.cli import main
 
+try:
+    from orjson import loads as _loads
+except ImportError:  # orjson is optional; the stdlib parser gives identical results
+    from json import loads as _loads
+
+GOLDEN_DIR = Path(__file__).parent / "golden" / "scan" / "enhanced"
+
+# Full scan argv, golden file and repo fixture for each golden case, built once
+_SCAN_JSON = ["scan", "--json"]
+GOLDEN_CASES = [
+    pytest.param(
+        [*_SCAN_JSON, "--depth", "0"], "SCAN.depth0.json", "test_repo", id="depth0"
+    ),
+    pytest.param(
+        [*_SCAN_JSON, "--depth", "2"], "SCAN.depth2.json", "test_repo", id="depth2"
+    ),
+    pytest.param(
+        [*_SCAN_JSON, "--depth", "2", "--ignore", "a/**"],
+        "SCAN.depth2.ignore_a.json",
+        "test_repo",
+        id="depth2_ignore_a",
+    ),
+    pytest.param(
+        [*_SCAN_JSON, "--depth", "2", "--respect-gitignore"],
+        "SCAN.depth2.gitignore.json",
+        "test_repo_with_gitignore",
+        id="depth2_gitignore",
+    ),
+]
+
+
+@functools.lru_cache(maxsize=16)
+def _load_golden_file(filename: str) -> dict:
+    """Load a golden file and return parsed JSON (parsed once per session)."""
+    return _loads((GOLDEN_DIR / filename).read_text())
+
 
 class TestScanEnhancedGolden:
     """Test enhanced scan functionality against golden files."""
 
-    @pytest.fixture
-    def test_repo(self):
+    @staticmethod
+    def _build_repo(root: Path) -> Path:
+        """Create pyproject.toml at root and package.json in a/b/."""
+        (root / "pyproject.toml").write_text("[build-system]\nrequires = []")
+        (root / "a" / "b").mkdir(parents=True)
+        (root / "a" / "b" / "package.json").write_text("{}")
+        return root
+
+    # Tests only chdir into and read these trees, so one copy per session suffices
+    @pytest.fixture(scope="session")
+    def test_repo(self, tmp_path_factory):
         """Create a test repository structure."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            tmpdir_path = Path(tmpdir)
-
-            # Create test structure: pyproject.toml at root, package.json in a/b/
-            (tmpdir_path / "pyproject.toml").write_text("[build-system]\nrequires = []")
-            (tmpdir_path / "a").mkdir()
-            (tmpdir_path / "a" / "b").mkdir()
-            (tmpdir_path / "a" / "b" / "package.json").write_text("{}")
+        return self._build_repo(tmp_path_factory.mktemp("scan_repo"))
 
-            yield tmpdir_path
-
-    @pytest.fixture
-    def test_repo_with_gitignore(self):
+    @pytest.fixture(scope="session")
+    def test_repo_with_gitignore(self, tmp_path_factory):
         """Create a test repository structure with .gitignore."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            tmpdir_path = Path(tmpdir)
+        repo = self._build_repo(tmp_path_factory.mktemp("scan_repo_gitignore"))
 
-            # Create test structure: pyproject.toml at root, package.json in a/b/
-            (tmpdir_path / "pyproject.toml").write_text("[build-system]\nrequires = []")
-            (tmpdir_path / "a").mkdir()
-            (tmpdir_path / "a" / "b").mkdir()
-            (tmpdir_path / "a" / "b" / "package.json").write_text("{}")
+        # Create .gitignore that ignores the 'a/' directory
+        (repo / ".gitignore").write_text("a/\n")
 
-            # Create .gitignore that ignores the 'a/' directory
-            (tmpdir_path / ".gitignore").write_text("a/\n")
-
-            yield tmpdir_path
+        return repo
 
     def _normalize_json_output(self, output: str, test_root: str) -> dict:
         """Normalize JSON output by replacing the actual root with '.'."""
-        result = json.loads(output)
+        result = _loads(output)
         result["root"] = "."
         return result
 
-    def _load_golden_file(self, filename: str) -> dict:
-        """Load a golden file and return parsed JSON."""
-        golden_path = Path(__file__).parent / "golden" / "scan" / "enhanced" / filename
-        with open(golden_path) as f:
-            return json.loads(f.read())
-
-    def test_scan_depth0_golden(self, test_repo, capsys):
-        """Test scan --depth 0 against golden file."""
-        import os
-
-        original_cwd = os.getcwd()
-        try:
-            os.chdir(test_repo)
-
-            # Mock sys.argv and run main
-            import sys
-
-            original_argv = sys.argv
-            sys.argv = ["autorepro", "scan", "--json", "--depth", "0"]
-
-            exit_code = main()
-            assert exit_code == 0
-
-            captured = capsys.readouterr()
-            actual = self._normalize_json_output(captured.out, str(test_repo))
-            expected = self._load_golden_file("SCAN.depth0.json")
-
-            assert actual == expected
-
-        finally:
-            sys.argv = original_argv
-            os.chdir(original_cwd)
-
-    def test_scan_depth2_golden(self, test_repo, capsys):
-        """Test scan --depth 2 against golden file."""
-        import os
-
-        original_cwd = os.getcwd()
-        try:
-            os.chdir(test_repo)
-
-            # Mock sys.argv and run main
-            import sys
-
-            original_argv = sys.argv
-            sys.argv = ["autorepro", "scan", "--json", "--depth", "2"]
-
-            exit_code = main()
-            assert exit_code == 0
-
-            captured = capsys.readouterr()
-            actual = self._normalize_json_output(captured.out, str(test_repo))
-            expected = self._load_golden_file("SCAN.depth2.json")
-
-            assert actual == expected
-
-        finally:
-            sys.argv = original_argv
-            os.chdir(original_cwd)
-
-    def test_scan_depth2_ignore_a_golden(self, test_repo, capsys):
-        """Test scan --depth 2 --ignore 'a/**' against golden file."""
-        import os
-
-        original_cwd = os.getcwd()
-        try:
-            os.chdir(test_repo)
-
-            # Mock sys.argv and run main
-            import sys
-
-            original_argv = sys.argv
-            sys.argv = [
-                "autorepro",
-                "scan",
-                "--json",
-                "--depth",
-                "2",
-                "--ignore",
-                "a/**",
-            ]
-
-            exit_code = main()
-            assert exit_code == 0
-
-            captured = capsys.readouterr()
-            actual = self._normalize_json_output(captured.out, str(test_repo))
-            expected = self._load_golden_file("SCAN.depth2.ignore_a.json")
-
-            assert actual == expected
-
-        finally:
-            sys.argv = original_argv
-            os.chdir(original_cwd)
-
-    def test_scan_depth2_gitignore_golden(self, test_repo_with_gitignore, capsys):
-        """Test scan --depth 2 --respect-gitignore against golden file."""
-        import os
-
-        original_cwd = os.getcwd()
-        try:
-            os.chdir(test_repo_with_gitignore)
-
-            # Mock sys.argv and run main
-            import sys
-
-            original_argv = sys.argv
-            sys.argv = [
-                "autorepro",
-                "scan",
-                "--json",
-                "--depth",
-                "2",
-                "--respect-gitignore",
-            ]
-
-            exit_code = main()
-            assert exit_code == 0
-
-            captured = capsys.readouterr()
-            actual = self._normalize_json_output(
-                captured.out, str(test_repo_with_gitignore)
-            )
-            expected = self._load_golden_file("SCAN.depth2.gitignore.json")
-
-            assert actual == expected
-
-        finally:
-            sys.argv = original_argv
-            os.chdir(original_cwd)
+    @pytest.fixture
+    def run_in(self, monkeypatch):
+        """Return a callable that runs the CLI from inside a repo directory."""
 
-    def test_scan_files_sample_behavior(self, test_repo, capsys):
-        """Test that files_sample appears by default and respects --show."""
-        import os
+        def _run(repo: Path, argv: list[str]) -> int:
+            # monkeypatch restores the original CWD after the test
+            monkeypatch.chdir(repo)
+            return main(argv)
 
-        original_cwd = os.getcwd()
-        try:
-            os.chdir(test_repo)
+        return _run
 
-            # Test default behavior (should include files_sample)
-            import sys
+    @pytest.mark.parametrize("argv,golden,repo_fixture", GOLDEN_CASES)
+    def test_scan_golden(  # noqa: PLR0913
+        self, request, run_in, capsys, argv, golden, repo_fixture
+    ):
+        """Test scan --json variants against their golden files."""
+        repo = request.getfixturevalue(repo_fixture)
 
-            original_argv = sys.argv
-            sys.argv = ["autorepro", "scan", "--json", "--depth", "2"]
+        exit_code = run_in(repo, argv)
+        assert exit_code == 0
 
-            exit_code = main()
-            assert exit_code == 0
+        captured = capsys.readouterr()
+        actual = self._normalize_json_output(captured.out, str(repo))
+        expected = _load_golden_file(golden)
 
-            captured = capsys.readouterr()
-            result = json.loads(captured.out)
+        assert actual == expected
 
-            # Should have files_sample for both languages
-            assert "files_sample" in result["languages"]["python"]
-            assert "files_sample" in result["languages"]["node"]
+    def test_scan_files_sample_default(self, test_repo, run_in, capsys):
+        """Test that files_sample appears by default."""
+        exit_code = run_in(test_repo, ["scan", "--json", "--depth", "2"])
+        assert exit_code == 0
 
-            # Test with --show 1 (should limit to 1 file per language)
-            sys.argv = ["autorepro", "scan", "--json", "--depth", "2", "--show", "1"]
+        result = _loads(capsys.readouterr().out)
 
-            exit_code = main()
-            assert exit_code == 0
+        # Should have files_sample for both languages
+        assert "files_sample" in result["languages"]["python"]
+        assert "files_sample" in result["languages"]["node"]
 
-            captured = capsys.readouterr()
-            result = json.loads(captured.out)
+    def test_scan_files_sample_respects_show(self, test_repo, run_in, capsys):
+        """Test that --show 1 limits files_sample to 1 file per language."""
+        exit_code = run_in(test_repo, ["scan", "--json", "--depth", "2", "--show", "1"])
+        assert exit_code == 0
 
-            # Should still have files_sample but limited to 1 file
-            assert len(result["languages"]["python"]["files_sample"]) <= 1
-            assert len(result["languages"]["node"]["files_sample"]) <= 1
+        result = _loads(capsys.readouterr().out)
 
-        finally:
-            sys.argv = original_argv
-            os.chdir(original_cwd)
+        # Should still have files_sample but limited to 1 file
+        assert len(result["languages"]["python"]["files_sample"]) <= 1
+        assert len(result["languages"]["node"]["files_sample"]) <= 1
@@ -1,312 +1,280 @@
 """Tests for --respect-gitignore functionality."""
 
-import json
-import tempfile
+import os
 from pathlib import Path
-
-from autorepro.cli import main
+from unittest.mock import patch
+
+import pytest
+
+from autorepro.cli import run_scan
+from autorepro.detect import (
+    _is_gitignored,
+    _load_gitignore_lines,
+    _should_ignore_path,
+)
+from tests._fs_util import write_tree
+
+
+@pytest.fixture(scope="module")
+def node_modules_tree(tmp_path_factory):
+    """Python project with a node_modules/ package.json, without a .gitignore."""
+    tree = tmp_path_factory.mktemp("node_modules")
+    write_tree(
+        tree,
+        {
+            "pyproject.toml": b"[build-system]\nrequires = []",
+            "node_modules/package.json": b"{}",
+        },
+    )
+    return tree
+
+
+@pytest.fixture(scope="module")
+def node_modules_ignored_tree(tmp_path_factory):
+    """Python project whose .gitignore ignores node_modules/."""
+    tree = tmp_path_factory.mktemp("node_modules_ignored")
+    write_tree(
+        tree,
+        {
+            "pyproject.toml": b"[build-system]\nrequires = []",
+            "node_modules/package.json": b"{}",
+            "src/main.py": b"print('hello')",
+            # .gitignore that ignores node_modules/
+            ".gitignore": b"node_modules/\n",
+        },
+    )
+    return tree
+
+
+@pytest.fixture(scope="module")
+def src_ignored_tree(tmp_path_factory):
+    """Node-only project whose .gitignore ignores the entire src/ directory."""
+    tree = tmp_path_factory.mktemp("src_ignored")
+    write_tree(
+        tree,
+        {
+            "src/package.json": b"{}",
+            "src/main.js": b"console.log('hello');",
+            # .gitignore that ignores the entire src/ directory
+            ".gitignore": b"src/\n",
+        },
+    )
+    return tree
+
+
+def scan_json(tree: Path, respect_gitignore: bool = False) -> dict:
+    """Return the ``scan --json`` result for ``tree`` without going through argv."""
+    # scan --json samples 5 files per language unless --show overrides it
+    return run_scan(tree, respect_gitignore=respect_gitignore, show_files_sample=5)
 
 
 class TestScanGitignore:
     """Test --respect-gitignore functionality."""
 
-    def test_gitignore_directory_exclusion(self, capsys):
+    @pytest.mark.parametrize(
+        "respect_gitignore,expected_detected",
+        [
+            # Without --respect-gitignore both python and node are found
+            pytest.param(False, ["node", "python"], id="without-flag"),
+            # With it, node_modules is ignored and only python remains
+            pytest.param(True, ["python"], id="respect-gitignore"),
+        ],
+    )
+    def test_gitignore_directory_exclusion(
+        self, node_modules_ignored_tree, respect_gitignore, expected_detected
+    ):
         """Test that .gitignore excludes directories correctly."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            tmpdir_path = Path(tmpdir)
-
-            # Create test structure
-            (tmpdir_path / "pyproject.toml").write_text("[build-system]\nrequires = []")
-            (tmpdir_path / "node_modules").mkdir()
-            (tmpdir_path / "node_modules" / "package.json").write_text("{}")
-            (tmpdir_path / "src").mkdir()
-            (tmpdir_path / "src" / "main.py").write_text("print('hello')")
-
-            # Create .gitignore that ignores node_modules/
-            (tmpdir_path / ".gitignore").write_text("node_modules/\n")
-
-            import os
-
-            original_cwd = os.getcwd()
-            try:
-                os.chdir(tmpdir_path)
-
-                # Test without --respect-gitignore (should find both python and node)
-                import sys
-
-                original_argv = sys.argv
-                sys.argv = ["autorepro", "scan", "--json"]
-
-                exit_code = main()
-                assert exit_code == 0
-
-                captured = capsys.readouterr()
-                result = json.loads(captured.out)
+        result = scan_json(node_modules_ignored_tree, respect_gitignore)
 
-                # Should detect both python and node
-                detected = set(result["detected"])
-                assert "python" in detected
-                assert "node" in detected
+        assert result["detected"] == expected_detected
 
-                # Test with --respect-gitignore (should only find python)
-                sys.argv = ["autorepro", "scan", "--json", "--respect-gitignore"]
-
-                exit_code = main()
-                assert exit_code == 0
-
-                captured = capsys.readouterr()
-                result = json.loads(captured.out)
-
-                # Should only detect python (node_modules is ignored)
-                detected = set(result["detected"])
-                assert "python" in detected
-                assert "node" not in detected
-
-            finally:
-                sys.argv = original_argv
-                os.chdir(original_cwd)
-
-    def test_gitignore_file_pattern_exclusion(self, capsys):
+    def test_gitignore_file_pattern_exclusion(self, tmp_path):
         """Test that .gitignore excludes file patterns correctly."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            tmpdir_path = Path(tmpdir)
-
-            # Create test structure
-            (tmpdir_path / "pyproject.toml").write_text("[build-system]\nrequires = []")
-            (tmpdir_path / "main.py").write_text("print('hello')")
-            (tmpdir_path / "test.py").write_text("def test(): pass")
-            (tmpdir_path / "config.py").write_text("DEBUG = True")
-
-            # Create .gitignore that ignores test.py and config.py
-            (tmpdir_path / ".gitignore").write_text("test.py\nconfig.py\n")
-
-            import os
-
-            original_cwd = os.getcwd()
-            try:
-                os.chdir(tmpdir_path)
-
-                # Test without --respect-gitignore
-                import sys
-
-                original_argv = sys.argv
-                sys.argv = ["autorepro", "scan", "--json"]
-
-                exit_code = main()
-                assert exit_code == 0
-
-                captured = capsys.readouterr()
-                result = json.loads(captured.out)
-
-                # Should detect python and have multiple files in files_sample
-                assert "python" in result["detected"]
-                python_files = result["languages"]["python"]["files_sample"]
-                assert len(python_files) >= 3  # pyproject.toml + main.py + others
-
-                # Test with --respect-gitignore
-                sys.argv = ["autorepro", "scan", "--json", "--respect-gitignore"]
-
-                exit_code = main()
-                assert exit_code == 0
-
-                captured = capsys.readouterr()
-                result = json.loads(captured.out)
-
-                # Should still detect python but with fewer files
-                assert "python" in result["detected"]
-                python_files = result["languages"]["python"]["files_sample"]
-
-                # Should not include ignored files
-                file_names = [Path(f).name for f in python_files]
-                assert "test.py" not in file_names
-                assert "config.py" not in file_names
-                assert "pyproject.toml" in file_names or "main.py" in file_names
-
-            finally:
-                sys.argv = original_argv
-                os.chdir(original_cwd)
-
-    def test_gitignore_negation_patterns(self, capsys):
+        # Create test structure
+        write_tree(
+            tmp_path,
+            {
+                "pyproject.toml": b"[build-system]\nrequires = []",
+                "main.py": b"print('hello')",
+                "test.py": b"def test(): pass",
+                "config.py": b"DEBUG = True",
+                # .gitignore that ignores test.py and config.py
+                ".gitignore": b"test.py\nconfig.py\n",
+            },
+        )
+
+        # Test without --respect-gitignore
+        result = scan_json(tmp_path)
+
+        # Should detect python and have multiple files in files_sample
+        assert "python" in result["detected"]
+        python_files = result["languages"]["python"]["files_sample"]
+        assert len(python_files) >= 3  # pyproject.toml + main.py + others
+
+        # Test with --respect-gitignore
+        result = scan_json(tmp_path, respect_gitignore=True)
+
+        # Should still detect python but with fewer files
+        assert "python" in result["detected"]
+        python_files = result["languages"]["python"]["files_sample"]
+
+        # Should not include ignored files
+        file_names = [os.path.basename(f) for f in python_files]
+        assert "test.py" not in file_names
+        assert "config.py" not in file_names
+        assert "pyproject.toml" in file_names or "main.py" in file_names
+
+    def test_gitignore_negation_patterns(self, tmp_path):
         """Test that .gitignore negation patterns (!pattern) work correctly."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            tmpdir_path = Path(tmpdir)
-
-            # Create test structure
-            (tmpdir_path / "pyproject.toml").write_text("[build-system]\nrequires = []")
-            (tmpdir_path / "dist").mkdir()
-            (tmpdir_path / "dist" / "package.json").write_text("{}")
-            (tmpdir_path / "dist" / ".keep").write_text("")
-
-            # Create .gitignore that ignores dist/ but re-includes .keep files
-            (tmpdir_path / ".gitignore").write_text("dist/\n!**/.keep\n")
-
-            import os
-
-            original_cwd = os.getcwd()
-            try:
-                os.chdir(tmpdir_path)
-
-                # Test with --respect-gitignore
-                import sys
-
-                original_argv = sys.argv
-                sys.argv = ["autorepro", "scan", "--json", "--respect-gitignore"]
-
-                exit_code = main()
-                assert exit_code == 0
-
-                captured = capsys.readouterr()
-                result = json.loads(captured.out)
-
-                # Should only detect python (package.json is ignored, .keep is not a language file)
-                detected = set(result["detected"])
-                assert "python" in detected
-                assert "node" not in detected
-
-            finally:
-                sys.argv = original_argv
-                os.chdir(original_cwd)
-
-    def test_gitignore_language_disappears_when_all_files_ignored(self, capsys):
+        # Create test structure
+        write_tree(
+            tmp_path,
+            {
+                "pyproject.toml": b"[build-system]\nrequires = []",
+                "dist/package.json": b"{}",
+                "dist/.keep": b"",
+                # .gitignore that ignores dist/ but re-includes .keep files
+                ".gitignore": b"dist/\n!**/.keep\n",
+            },
+        )
+
+        # Test with --respect-gitignore
+        result = scan_json(tmp_path, respect_gitignore=True)
+
+        # Should only detect python (package.json is ignored, .keep is not a language file)
+        detected = set(result["detected"])
+        assert "python" in detected
+        assert "node" not in detected
+
+    @pytest.mark.parametrize(
+        "respect_gitignore,expected_detected",
+        [
+            pytest.param(False, ["node"], id="without-flag"),
+            pytest.param(True, [], id="respect-gitignore"),
+        ],
+    )
+    def test_gitignore_language_disappears_when_all_files_ignored(
+        self, src_ignored_tree, respect_gitignore, expected_detected
+    ):
         """Test that languages disappear entirely when all their files are ignored."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            tmpdir_path = Path(tmpdir)
-
-            # Create test structure - only node files, no python
-            (tmpdir_path / "src").mkdir()
-            (tmpdir_path / "src" / "package.json").write_text("{}")
-            (tmpdir_path / "src" / "main.js").write_text("console.log('hello');")
-
-            # Create .gitignore that ignores the entire src/ directory
-            (tmpdir_path / ".gitignore").write_text("src/\n")
-
-            import os
-
-            original_cwd = os.getcwd()
-            try:
-                os.chdir(tmpdir_path)
-
-                # Test without --respect-gitignore (should find node)
-                import sys
-
-                original_argv = sys.argv
-                sys.argv = ["autorepro", "scan", "--json"]
-
-                exit_code = main()
-                assert exit_code == 0
-
-                captured = capsys.readouterr()
-                result = json.loads(captured.out)
-
-                # Should detect node
-                assert "node" in result["detected"]
+        result = scan_json(src_ignored_tree, respect_gitignore)
 
-                # Test with --respect-gitignore (should find nothing)
-                sys.argv = ["autorepro", "scan", "--json", "--respect-gitignore"]
+        assert result["detected"] == expected_detected
+        assert list(result["languages"]) == expected_detected
 
-                exit_code = main()
-                assert exit_code == 0
-
-                captured = capsys.readouterr()
-                result = json.loads(captured.out)
-
-                # Should detect no languages
-                assert result["detected"] == []
-                assert result["languages"] == {}
-
-            finally:
-                sys.argv = original_argv
-                os.chdir(original_cwd)
-
-    def test_gitignore_glob_patterns(self, capsys):
+    def test_gitignore_glob_patterns(self, tmp_path):
         """Test that .gitignore glob patterns work correctly."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            tmpdir_path = Path(tmpdir)
-
-            # Create test structure
-            (tmpdir_path / "pyproject.toml").write_text("[build-system]\nrequires = []")
-            (tmpdir_path / "test1.py").write_text("def test1(): pass")
-            (tmpdir_path / "test2.py").write_text("def test2(): pass")
-            (tmpdir_path / "main.py").write_text("print('hello')")
-            (tmpdir_path / "utils").mkdir()
-            (tmpdir_path / "utils" / "test_helper.py").write_text("def helper(): pass")
-
-            # Create .gitignore that ignores all test*.py files
-            (tmpdir_path / ".gitignore").write_text("test*.py\n**/test*.py\n")
-
-            import os
-
-            original_cwd = os.getcwd()
-            try:
-                os.chdir(tmpdir_path)
-
-                # Test with --respect-gitignore
-                import sys
-
-                original_argv = sys.argv
-                sys.argv = ["autorepro", "scan", "--json", "--respect-gitignore"]
-
-                exit_code = main()
-                assert exit_code == 0
-
-                captured = capsys.readouterr()
-                result = json.loads(captured.out)
-
-                # Should detect python but exclude test files
-                assert "python" in result["detected"]
-                python_files = result["languages"]["python"]["files_sample"]
-
-                # Should not include test files
-                file_names = [Path(f).name for f in python_files]
-                assert "test1.py" not in file_names
-                assert "test2.py" not in file_names
-                assert "test_helper.py" not in file_names
-                assert "pyproject.toml" in file_names or "main.py" in file_names
-
-            finally:
-                sys.argv = original_argv
-                os.chdir(original_cwd)
-
-    def test_gitignore_no_file_means_no_filtering(self, capsys):
+        # Create test structure
+        write_tree(
+            tmp_path,
+            {
+                "pyproject.toml": b"[build-system]\nrequires = []",
+                "test1.py": b"def test1(): pass",
+                "test2.py": b"def test2(): pass",
+                "main.py": b"print('hello')",
+                "utils/test_helper.py": b"def helper(): pass",
+                # .gitignore that ignores all test*.py files
+                ".gitignore": b"test*.py\n**/test*.py\n",
+            },
+        )
+
+        # Test with --respect-gitignore
+        result = scan_json(tmp_path, respect_gitignore=True)
+
+        # Should detect python but exclude test files
+        assert "python" in result["detected"]
+        python_files = result["languages"]["python"]["files_sample"]
+
+        # Should not include test files
+        file_names = [os.path.basename(f) for f in python_files]
+        assert "test1.py" not in file_names
+        assert "test2.py" not in file_names
+        assert "test_helper.py" not in file_names
+        assert "pyproject.toml" in file_names or "main.py" in file_names
+
+    @pytest.mark.parametrize("respect_gitignore", [False, True])
+    def test_gitignore_no_file_means_no_filtering(
+        self, node_modules_tree, respect_gitignore
+    ):
         """Test that missing .gitignore file means no filtering occurs."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            tmpdir_path = Path(tmpdir)
-
-            # Create test structure (no .gitignore file)
-            (tmpdir_path / "pyproject.toml").write_text("[build-system]\nrequires = []")
-            (tmpdir_path / "node_modules").mkdir()
-            (tmpdir_path / "node_modules" / "package.json").write_text("{}")
-
-            import os
-
-            original_cwd = os.getcwd()
-            try:
-                os.chdir(tmpdir_path)
-
-                # Test with --respect-gitignore (should behave same as without)
-                import sys
-
-                original_argv = sys.argv
-
-                # Without --respect-gitignore
-                sys.argv = ["autorepro", "scan", "--json"]
-                exit_code = main()
-                assert exit_code == 0
-                captured = capsys.readouterr()
-                result_without = json.loads(captured.out)
-
-                # With --respect-gitignore
-                sys.argv = ["autorepro", "scan", "--json", "--respect-gitignore"]
-                exit_code = main()
-                assert exit_code == 0
-                captured = capsys.readouterr()
-                result_with = json.loads(captured.out)
-
-                # Results should be identical (normalize root paths)
-                result_without["root"] = "."
-                result_with["root"] = "."
-                assert result_without == result_with
-
-            finally:
-                sys.argv = original_argv
-                os.chdir(original_cwd)
+        result = scan_json(node_modules_tree, respect_gitignore)
+
+        # Same result with or without --respect-gitignore: nothing is filtered
+        assert result["detected"] == ["node", "python"]
+        assert result["languages"]["node"]["files_sample"] == [
+            "./node_modules/package.json"
+        ]
+
+    def test_gitignore_missing_file_skips_path_filtering(self, node_modules_tree):
+        """Test no per-path ignore checks run when there is no .gitignore."""
+        with patch(
+            "autorepro.detect._should_ignore_path", wraps=_should_ignore_path
+        ) as should_ignore:
+            result = scan_json(node_modules_tree, respect_gitignore=True)
+
+        assert result["detected"] == ["node", "python"]
+        should_ignore.assert_not_called()
+
+    def test_gitignore_parsed_once_until_edited(self, tmp_path):
+        """Test .gitignore is read once per scan and re-read after it changes."""
+        write_tree(
+            tmp_path,
+            {
+                "pyproject.toml": b"[build-system]\nrequires = []",
+                "main.py": b"print('hello')",
+                "test.py": b"def test(): pass",
+                ".gitignore": b"test.py\n",
+            },
+        )
+
+        _load_gitignore_lines.cache_clear()
+        scan_json(tmp_path, respect_gitignore=True)
+        scan_json(tmp_path, respect_gitignore=True)
+        assert _load_gitignore_lines.cache_info().misses == 1
+
+        # Changing the file (new size/mtime) must not reuse the stale patterns
+        (tmp_path / ".gitignore").write_bytes(b"test.py\nmain.py\n")
+        result = scan_json(tmp_path, respect_gitignore=True)
+        assert _load_gitignore_lines.cache_info().misses == 2
+        assert result["languages"]["python"]["files_sample"] == ["./pyproject.toml"]
+
+    def test_gitignored_directory_not_walked(self, tmp_path, monkeypatch):
+        """Test directories ignored as a whole are pruned instead of listed."""
+        write_tree(
+            tmp_path,
+            {
+                "pyproject.toml": b"[build-system]\nrequires = []",
+                "node_modules/pkg/package.json": b"{}",
+                "src/main.py": b"print('hello')",
+                ".gitignore": b"node_modules/\n",
+            },
+        )
+        visited = []
+        real_walk = os.walk
+
+        def recording_walk(top, *args, **kwargs):
+            for entry in real_walk(top, *args, **kwargs):
+                visited.append(Path(entry[0]).relative_to(tmp_path).as_posix())
+                yield entry
+
+        monkeypatch.setattr(os, "walk", recording_walk)
+        result = scan_json(tmp_path, respect_gitignore=True)
+
+        assert result["detected"] == ["python"]
+        assert sorted(visited) == [".", "src"]
+
+    @pytest.mark.parametrize(
+        "lines,path,expected",
+        [
+            pytest.param(("dist/", "!**/.keep"), "dist/.keep", False, id="negated"),
+            pytest.param(("dist/", "!**/.keep"), "dist/app.js", True, id="ignored"),
+            # The last matching line decides, so a later rule re-ignores
+            pytest.param(
+                ("*.py", "!main.py", "main.py"), "main.py", True, id="re-ignored"
+            ),
+            pytest.param(("*.py", "!main.py"), "main.go", False, id="no-match"),
+        ],
+    )
+    def test_gitignore_last_matching_line_wins(self, lines, path, expected):
+        """Test the compiled .gitignore matcher honours line order for negations."""
+        assert _is_gitignored(path, lines) is expected
@@ -1,352 +1,319 @@
 """Tests for JSON scan functionality core logic."""
 
-import json
+import os
 import tempfile
-from io import StringIO
 from pathlib import Path
-from unittest.mock import patch
 
-from autorepro.cli import cmd_scan
+import pytest
+
+from autorepro import __version__ as _AUTOREPRO_VERSION
 from autorepro.detect import collect_evidence
+from tests._fs_util import remove_tree, write_tree
+
+# Contents of every marker file the scenarios use, as ready-to-write bytes
+_MARKERS = {
+    "pyproject.toml": b"[build-system]\nrequires = []",  # config: weight 3
+    "setup.py": b"from setuptools import setup",  # setup: weight 2
+    "requirements.txt": b"requests",  # setup: weight 2
+    "main.py": b"print('hello')",  # source: weight 1
+    "utils.py": b"def helper(): pass",
+    "file1.py": b"pass",
+    "file2.py": b"pass",
+    "file3.py": b"pass",
+    "pnpm-lock.yaml": b"lockfileVersion: 5.4",  # lock: weight 4
+    "MyApp.csproj": b"<Project></Project>",
+    "go.mod": b"module test",
+    "go.sum": b"example.com/test v1.0.0",
+    "README.md": b"# Project",
+    "LICENSE": b"MIT License",
+}
+
+
+def _scenario(*names: str) -> dict[str, bytes]:
+    """Return the write_tree() mapping for the given marker files."""
+    return {name: _MARKERS[name] for name in names}
+
+
+# Marker files for each scan scenario; every scenario directory is read-only
+SCENARIOS = {
+    "python_pyproject": _scenario("pyproject.toml"),
+    "node_pnpm_lock": _scenario("pnpm-lock.yaml"),
+    "python_config_node_lock": _scenario("pyproject.toml", "pnpm-lock.yaml"),
+    "python_sources": _scenario("main.py", "utils.py"),
+    "python_many_sources": _scenario("file1.py", "file2.py", "file3.py"),
+    "python_mixed_weights": _scenario("pyproject.toml", "setup.py", "main.py"),
+    "python_config_and_setup": _scenario("pyproject.toml", "requirements.txt"),
+    "setup_py": _scenario("setup.py"),
+    "csharp": _scenario("MyApp.csproj"),
+    "go": _scenario("go.mod", "go.sum"),
+    "empty": _scenario(),
+    "no_indicators": _scenario("README.md", "LICENSE"),
+}
+
+
+def _build_scenarios(base: Path) -> dict[str, Path]:
+    """Write every scenario tree under ``base`` and map scenario names to paths."""
+    paths = {}
+    for name, files in SCENARIOS.items():
+        paths[name] = base / name
+        write_tree(paths[name], files)
+    return paths
+
+
+@pytest.fixture(scope="module")
+def scenarios(fast_tmp_root):
+    """Build every scenario directory once per module and map names to paths."""
+    base = Path(tempfile.mkdtemp(prefix="scan_json_core-", dir=fast_tmp_root))
+    paths = _build_scenarios(base)
+    yield paths
+
+    for name, files in SCENARIOS.items():
+        remove_tree(paths[name], files)
+    os.rmdir(base)
+
+
+@pytest.fixture(scope="module")
+def scenario_evidence(scenarios):
+    """Scan every scenario once; tests only read the resulting evidence."""
+    return {name: collect_evidence(path) for name, path in scenarios.items()}
 
 
 class TestScanJsonCore:
     """Test the core JSON scanning functionality."""
 
-    def test_python_only_pyproject(self):
+    def test_python_only_pyproject(self, scenario_evidence):
         """Test Python detection with pyproject.toml only."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            tmpdir_path = Path(tmpdir)
-
-            # Create pyproject.toml
-            (tmpdir_path / "pyproject.toml").write_text("[build-system]\nrequires = []")
-
-            evidence = collect_evidence(tmpdir_path)
+        evidence = scenario_evidence["python_pyproject"]
 
-            # Should detect only python
-            assert list(evidence.keys()) == ["python"]
-            assert evidence["python"]["score"] == 3
+        # Should detect only python
+        assert list(evidence.keys()) == ["python"]
+        assert evidence["python"]["score"] == 3
 
-            reasons = evidence["python"]["reasons"]
-            assert len(reasons) == 1
-            assert reasons[0]["pattern"] == "pyproject.toml"
-            assert reasons[0]["path"] == "./pyproject.toml"
-            assert reasons[0]["kind"] == "config"
-            assert reasons[0]["weight"] == 3
+        reasons = evidence["python"]["reasons"]
+        assert len(reasons) == 1
+        assert reasons[0]["pattern"] == "pyproject.toml"
+        assert reasons[0]["path"] == "./pyproject.toml"
+        assert reasons[0]["kind"] == "config"
+        assert reasons[0]["weight"] == 3
 
-    def test_node_lockfile_only(self):
+    def test_node_lockfile_only(self, scenario_evidence):
         """Test Node.js detection with pnpm-lock.yaml only."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            tmpdir_path = Path(tmpdir)
-
-            # Create pnpm-lock.yaml
-            (tmpdir_path / "pnpm-lock.yaml").write_text("lockfileVersion: 5.4")
-
-            evidence = collect_evidence(tmpdir_path)
+        evidence = scenario_evidence["node_pnpm_lock"]
 
-            # Should detect only node
-            assert list(evidence.keys()) == ["node"]
-            assert evidence["node"]["score"] == 4
+        # Should detect only node
+        assert list(evidence.keys()) == ["node"]
+        assert evidence["node"]["score"] == 4
 
-            reasons = evidence["node"]["reasons"]
-            assert len(reasons) == 1
-            assert reasons[0]["pattern"] == "pnpm-lock.yaml"
-            assert reasons[0]["path"] == "./pnpm-lock.yaml"
-            assert reasons[0]["kind"] == "lock"
-            assert reasons[0]["weight"] == 4
+        reasons = evidence["node"]["reasons"]
+        assert len(reasons) == 1
+        assert reasons[0]["pattern"] == "pnpm-lock.yaml"
+        assert reasons[0]["path"] == "./pnpm-lock.yaml"
+        assert reasons[0]["kind"] == "lock"
+        assert reasons[0]["weight"] == 4
 
-    def test_python_config_and_node_lock(self):
+    def test_python_config_and_node_lock(self, scenario_evidence):
         """Test Python config + Node lock, node score should be higher."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            tmpdir_path = Path(tmpdir)
+        evidence = scenario_evidence["python_config_node_lock"]
 
-            # Create Python config file (weight 3)
-            (tmpdir_path / "pyproject.toml").write_text("[build-system]")
+        # Should detect both languages
+        assert set(evidence.keys()) == {"python", "node"}
 
-            # Create Node lock file (weight 4)
-            (tmpdir_path / "pnpm-lock.yaml").write_text("lockfileVersion: 5.4")
+        # Node should have higher score (4) than Python (3)
+        assert evidence["node"]["score"] == 4
+        assert evidence["python"]["score"] == 3
+        assert evidence["node"]["score"] > evidence["python"]["score"]
 
-            evidence = collect_evidence(tmpdir_path)
+        # Check node reasons
+        node_reasons = evidence["node"]["reasons"]
+        assert len(node_reasons) == 1
+        assert node_reasons[0]["kind"] == "lock"
 
-            # Should detect both languages
-            assert set(evidence.keys()) == {"python", "node"}
+        # Check python reasons
+        python_reasons = evidence["python"]["reasons"]
+        assert len(python_reasons) == 1
+        assert python_reasons[0]["kind"] == "config"
 
-            # Node should have higher score (4) than Python (3)
-            assert evidence["node"]["score"] == 4
-            assert evidence["python"]["score"] == 3
-            assert evidence["node"]["score"] > evidence["python"]["score"]
-
-            # Check node reasons
-            node_reasons = evidence["node"]["reasons"]
-            assert len(node_reasons) == 1
-            assert node_reasons[0]["kind"] == "lock"
-
-            # Check python reasons
-            python_reasons = evidence["python"]["reasons"]
-            assert len(python_reasons) == 1
-            assert python_reasons[0]["kind"] == "config"
-
-    def test_glob_source_files_only(self):
+    def test_glob_source_files_only(self, scenario_evidence):
         """Test source files detection with glob patterns."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            tmpdir_path = Path(tmpdir)
-
-            # Create only source files
-            (tmpdir_path / "main.py").write_text("print('hello')")
-            (tmpdir_path / "utils.py").write_text("def helper(): pass")
+        evidence = scenario_evidence["python_sources"]
 
-            evidence = collect_evidence(tmpdir_path)
+        # Should detect only python
+        assert list(evidence.keys()) == ["python"]
+        assert evidence["python"]["score"] == 1  # source weight
 
-            # Should detect only python
-            assert list(evidence.keys()) == ["python"]
-            assert evidence["python"]["score"] == 1  # source weight
+        reasons = evidence["python"]["reasons"]
+        assert len(reasons) == 1
+        assert reasons[0]["pattern"] == "*.py"
+        assert reasons[0]["kind"] == "source"
+        assert reasons[0]["weight"] == 1
+        # Path should be one of the .py files
+        assert reasons[0]["path"] in ["./main.py", "./utils.py"]
 
-            reasons = evidence["python"]["reasons"]
-            assert len(reasons) == 1
-            assert reasons[0]["pattern"] == "*.py"
-            assert reasons[0]["kind"] == "source"
-            assert reasons[0]["weight"] == 1
-            # Path should be one of the .py files
-            assert reasons[0]["path"] in ["./main.py", "./utils.py"]
-
-    def test_multiple_source_files_same_pattern_weight(self):
+    def test_multiple_source_files_same_pattern_weight(self, scenario_evidence):
         """Test that multiple files matching same pattern get weight only once."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            tmpdir_path = Path(tmpdir)
-
-            # Create multiple .py files
-            (tmpdir_path / "file1.py").write_text("pass")
-            (tmpdir_path / "file2.py").write_text("pass")
-            (tmpdir_path / "file3.py").write_text("pass")
-
-            evidence = collect_evidence(tmpdir_path)
+        evidence = scenario_evidence["python_many_sources"]
 
-            # Should detect python with score=1 (not 3)
-            assert evidence["python"]["score"] == 1
+        # Should detect python with score=1 (not 3)
+        assert evidence["python"]["score"] == 1
 
-            # Should have only one reason for *.py pattern
-            reasons = evidence["python"]["reasons"]
-            assert len(reasons) == 1
-            assert reasons[0]["pattern"] == "*.py"
+        # Should have only one reason for *.py pattern
+        reasons = evidence["python"]["reasons"]
+        assert len(reasons) == 1
+        assert reasons[0]["pattern"] == "*.py"
 
-    def test_mixed_weight_scoring(self):
+    def test_mixed_weight_scoring(self, scenario_evidence):
         """Test mixed file types with proper weight accumulation."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            tmpdir_path = Path(tmpdir)
-
-            # Create files with different weights for Python
-            (tmpdir_path / "pyproject.toml").write_text(
-                "[build-system]"
-            )  # config: weight 3
-            (tmpdir_path / "setup.py").write_text(
-                "from setuptools import setup"
-            )  # setup: weight 2
-            (tmpdir_path / "main.py").write_text("print('hello')")  # source: weight 1
-
-            evidence = collect_evidence(tmpdir_path)
-
-            # Should detect python with total score = 3 + 2 + 1 = 6
-            assert evidence["python"]["score"] == 6
-
-            reasons = evidence["python"]["reasons"]
-            assert len(reasons) == 3
-
-            # Check each reason type is present
-            patterns = [r["pattern"] for r in reasons]
-            assert "pyproject.toml" in patterns
-            assert "setup.py" in patterns
-            assert "*.py" in patterns
-
-    def test_empty_directory(self):
-        """Test empty directory returns empty evidence."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            tmpdir_path = Path(tmpdir)
-
-            evidence = collect_evidence(tmpdir_path)
-
-            assert evidence == {}
-
-    def test_valid_json_schema_and_types(self):
+        evidence = scenario_evidence["python_mixed_weights"]
+
+        # Should detect python with total score = 3 + 2 + 1 = 6
+        assert evidence["python"]["score"] == 6
+
+        reasons = evidence["python"]["reasons"]
+        assert len(reasons) == 3
+
+        # Check each reason type is present
+        patterns = [r["pattern"] for r in reasons]
+        assert "pyproject.toml" in patterns
+        assert "setup.py" in patterns
+        assert "*.py" in patterns
+
+    @pytest.mark.parametrize(
+        "scenario",
+        [
+            pytest.param("empty", id="empty-directory"),
+            # Only non-language files
+            pytest.param("no_indicators", id="no-indicators"),
+        ],
+    )
+    def test_no_detection_empty_result(self, scenario_evidence, scenario):
+        """Test directories without language indicators return empty evidence."""
+        evidence = scenario_evidence[scenario]
+
+        assert evidence == {}
+
+    def test_valid_json_schema_and_types(self, scenario_evidence):
         """Test that evidence structure matches expected JSON schema."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            tmpdir_path = Path(tmpdir)
-
-            # Create test files
-            (tmpdir_path / "pyproject.toml").write_text("[build-system]")
-            (tmpdir_path / "pnpm-lock.yaml").write_text("lockfileVersion: 5.4")
-
-            evidence = collect_evidence(tmpdir_path)
+        evidence = scenario_evidence["python_config_node_lock"]
 
-            # Test overall structure
-            assert isinstance(evidence, dict)
+        # Test overall structure
+        assert isinstance(evidence, dict)
 
-            for lang_name, lang_data in evidence.items():
-                # Language name should be string
-                assert isinstance(lang_name, str)
+        for lang_name, lang_data in evidence.items():
+            # Language name should be string
+            assert isinstance(lang_name, str)
 
-                # Language data should have required keys
-                assert isinstance(lang_data, dict)
-                assert "score" in lang_data
-                assert "reasons" in lang_data
+            # Language data should have required keys
+            assert isinstance(lang_data, dict)
+            assert "score" in lang_data
+            assert "reasons" in lang_data
 
-                # Score should be integer
-                assert isinstance(lang_data["score"], int)
-                assert lang_data["score"] > 0
+            # Score should be integer
+            assert isinstance(lang_data["score"], int)
+            assert lang_data["score"] > 0
 
-                # Reasons should be list
-                assert isinstance(lang_data["reasons"], list)
-                assert len(lang_data["reasons"]) > 0
+            # Reasons should be list
+            assert isinstance(lang_data["reasons"], list)
+            assert len(lang_data["reasons"]) > 0
 
-                # Each reason should have required fields with correct types
-                for reason in lang_data["reasons"]:
-                    assert isinstance(reason, dict)
-                    assert isinstance(reason["pattern"], str)
-                    assert isinstance(reason["path"], str)
-                    assert isinstance(reason["kind"], str)
-                    assert isinstance(reason["weight"], int)
+            # Each reason should have required fields with correct types
+            for reason in lang_data["reasons"]:
+                assert isinstance(reason, dict)
+                assert isinstance(reason["pattern"], str)
+                assert isinstance(reason["path"], str)
+                assert isinstance(reason["kind"], str)
+                assert isinstance(reason["weight"], int)
 
-                    # Path should start with "./"
-                    assert reason["path"].startswith("./")
+                # Path should start with "./"
+                assert reason["path"].startswith("./")
 
-                    # Kind should be valid
-                    assert reason["kind"] in ["lock", "config", "setup", "source"]
+                # Kind should be valid
+                assert reason["kind"] in ["lock", "config", "setup", "source"]
 
-                    # Weight should be positive
-                    assert reason["weight"] > 0
+                # Weight should be positive
+                assert reason["weight"] > 0
 
-    def test_csharp_detection(self):
+    def test_csharp_detection(self, scenario_evidence):
         """Test C# detection with .csproj file."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            tmpdir_path = Path(tmpdir)
+        evidence = scenario_evidence["csharp"]
 
-            # Create .csproj file
-            (tmpdir_path / "MyApp.csproj").write_text("<Project></Project>")
+        assert "csharp" in evidence
+        assert evidence["csharp"]["score"] == 3
 
-            evidence = collect_evidence(tmpdir_path)
+        reasons = evidence["csharp"]["reasons"]
+        assert len(reasons) == 1
+        assert reasons[0]["pattern"] == "*.csproj"
+        assert reasons[0]["kind"] == "config"
 
-            assert "csharp" in evidence
-            assert evidence["csharp"]["score"] == 3
-
-            reasons = evidence["csharp"]["reasons"]
-            assert len(reasons) == 1
-            assert reasons[0]["pattern"] == "*.csproj"
-            assert reasons[0]["kind"] == "config"
-
-    def test_go_detection(self):
+    def test_go_detection(self, scenario_evidence):
         """Test Go detection with go.mod and go.sum."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            tmpdir_path = Path(tmpdir)
-
-            # Create Go files
-            (tmpdir_path / "go.mod").write_text("module test")
-            (tmpdir_path / "go.sum").write_text("example.com/test v1.0.0")
-
-            evidence = collect_evidence(tmpdir_path)
+        evidence = scenario_evidence["go"]
 
-            assert "go" in evidence
-            # go.mod (config: 3) + go.sum (lock: 4) = 7
-            assert evidence["go"]["score"] == 7
+        assert "go" in evidence
+        # go.mod (config: 3) + go.sum (lock: 4) = 7
+        assert evidence["go"]["score"] == 7
 
-            reasons = evidence["go"]["reasons"]
-            assert len(reasons) == 2
-            patterns = [r["pattern"] for r in reasons]
-            assert "go.mod" in patterns
-            assert "go.sum" in patterns
+        reasons = evidence["go"]["reasons"]
+        assert len(reasons) == 2
+        patterns = [r["pattern"] for r in reasons]
+        assert "go.mod" in patterns
+        assert "go.sum" in patterns
 
-    def test_no_indicators_empty_result(self):
-        """Test that directory with no indicators returns empty results."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            tmpdir_path = Path(tmpdir)
-
-            # Create only non-language files
-            (tmpdir_path / "README.md").write_text("# Project")
-            (tmpdir_path / "LICENSE").write_text("MIT License")
-
-            evidence = collect_evidence(tmpdir_path)
-
-            # Should have no detections
-            assert evidence == {}
-
-    def test_multiple_causes_grouped_deterministic_order(self):
+    def test_multiple_causes_grouped_deterministic_order(self, scenario_evidence):
         """Test multiple causes for same language are grouped with deterministic
         order."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            tmpdir_path = Path(tmpdir)
-
-            # Create Python files with different weights
-            (tmpdir_path / "pyproject.toml").write_text(
-                "[build-system]"
-            )  # config: weight 3
-            (tmpdir_path / "requirements.txt").write_text("requests")  # setup: weight 2
+        evidence = scenario_evidence["python_config_and_setup"]
 
-            evidence = collect_evidence(tmpdir_path)
+        # Should detect only python
+        assert list(evidence.keys()) == ["python"]
 
-            # Should detect only python
-            assert list(evidence.keys()) == ["python"]
+        # Score should be sum: 3 + 2 = 5
+        assert evidence["python"]["score"] == 5
 
-            # Score should be sum: 3 + 2 = 5
-            assert evidence["python"]["score"] == 5
+        # Should have exactly 2 reasons
+        reasons = evidence["python"]["reasons"]
+        assert len(reasons) == 2
 
-            # Should have exactly 2 reasons
-            reasons = evidence["python"]["reasons"]
-            assert len(reasons) == 2
+        # Order should be deterministic (based on order of processing)
+        # pyproject.toml is processed first in WEIGHTED_PATTERNS
+        assert reasons[0]["pattern"] == "pyproject.toml"
+        assert reasons[0]["kind"] == "config"
+        assert reasons[0]["weight"] == 3
 
-            # Order should be deterministic (based on order of processing)
-            # pyproject.toml is processed first in WEIGHTED_PATTERNS
-            assert reasons[0]["pattern"] == "pyproject.toml"
-            assert reasons[0]["kind"] == "config"
-            assert reasons[0]["weight"] == 3
+        assert reasons[1]["pattern"] == "requirements.txt"
+        assert reasons[1]["kind"] == "setup"
+        assert reasons[1]["weight"] == 2
 
-            assert reasons[1]["pattern"] == "requirements.txt"
-            assert reasons[1]["kind"] == "setup"
-            assert reasons[1]["weight"] == 2
+        # Verify paths are correct
+        assert reasons[0]["path"] == "./pyproject.toml"
+        assert reasons[1]["path"] == "./requirements.txt"
 
-            # Verify paths are correct
-            assert reasons[0]["path"] == "./pyproject.toml"
-            assert reasons[1]["path"] == "./requirements.txt"
-
-    def test_scan_json_schema_versioning_fields(self):
+    def test_scan_json_schema_versioning_fields(self, scenarios, monkeypatch, capsys):
         """Test that scan --json output includes schema versioning fields."""
-        from autorepro import __version__
-
-        with tempfile.TemporaryDirectory() as tmpdir:
-            tmpdir_path = Path(tmpdir)
-
-            # Create a Python file for detection
-            (tmpdir_path / "setup.py").write_text("from setuptools import setup")
-
-            # Change to temp directory and capture JSON output
-            with patch("os.getcwd", return_value=tmpdir):
-                with patch("sys.stdout", new_callable=StringIO) as mock_stdout:
-                    exit_code = cmd_scan(json_output=True)
+        # Only this test goes through the CLI; keep its imports off module load
+        import json
 
-                    # Should succeed
-                    assert exit_code == 0
+        from autorepro.cli import cmd_scan
 
-                    # Parse JSON output
-                    json_output = mock_stdout.getvalue()
-                    result = json.loads(json_output)
+        # Change to the scenario directory and capture JSON output
+        monkeypatch.chdir(scenarios["setup_py"])
+        exit_code = cmd_scan(json_output=True)
 
-                    # Check schema versioning fields
-                    assert "schema_version" in result
-                    assert result["schema_version"] == 1
-                    assert isinstance(result["schema_version"], int)
+        # Should succeed
+        assert exit_code == 0
 
-                    assert "tool" in result
-                    assert result["tool"] == "autorepro"
-                    assert isinstance(result["tool"], str)
+        # Parse the output as ordered (key, value) pairs; order is under test
+        pairs = json.loads(capsys.readouterr().out, object_pairs_hook=list)
+        keys = [key for key, _ in pairs]
 
-                    assert "tool_version" in result
-                    assert result["tool_version"] == __version__
-                    assert isinstance(result["tool_version"], str)
+        # Schema versioning fields come first, in this order
+        assert keys[:3] == ["schema_version", "tool", "tool_version"]
 
-                    # Check key order - schema versioning fields should come first
-                    keys_list = list(result.keys())
-                    assert keys_list[0] == "schema_version"
-                    assert keys_list[1] == "tool"
-                    assert keys_list[2] == "tool_version"
+        (_, schema_version), (_, tool), (_, tool_version) = pairs[:3]
+        assert schema_version == 1
+        assert isinstance(schema_version, int)
+        assert tool == "autorepro"
+        assert tool_version == _AUTOREPRO_VERSION
+        assert isinstance(tool_version, str)
 
-                    # Check other required fields are still present
-                    assert "root" in result
-                    assert "detected" in result
-                    assert "languages" in result
+        # Check other required fields are still present
+        assert {"root", "detected", "languages"} <= set(keys)
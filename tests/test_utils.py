@@ -1,8 +1,14 @@
 """Utility functions for tests."""
 
+import logging
 import os
 import subprocess
 import sys
+from contextlib import redirect_stderr, redirect_stdout
+from io import StringIO
+from types import SimpleNamespace
+
+from autorepro.cli import main
 
 
 def get_project_root():
@@ -37,3 +43,44 @@ def run_autorepro_subprocess(args, cwd=None, **kwargs):
     kwargs.setdefault("timeout", 30)
 
     return subprocess.run(cmd, cwd=cwd, **kwargs)
+
+
+def run_autorepro_inprocess(args, cwd=None):
+    """
+    Run the autorepro CLI in this interpreter instead of spawning a new one.
+
+    Records from the ``autorepro`` logger are captured into stderr alongside
+    anything written to sys.stderr; tests needing process isolation should keep
+    using run_autorepro_subprocess.
+
+    Args:
+        args: List of arguments to pass to autorepro CLI
+        cwd: Working directory for the command
+
+    Returns:
+        Object with returncode, stdout and stderr like subprocess.CompletedProcess
+    """
+    stdout, stderr = StringIO(), StringIO()
+    # Log handlers hold the real stderr stream, so capture records explicitly
+    handler = logging.StreamHandler(stderr)
+    log = logging.getLogger("autorepro")
+    log.addHandler(handler)
+    original_cwd = os.getcwd()
+    try:
+        if cwd is not None:
+            os.chdir(cwd)
+        with redirect_stdout(stdout), redirect_stderr(stderr):
+            try:
+                returncode = main(list(args))
+            except SystemExit as e:
+                code = e.code
+                returncode = (
+                    code if isinstance(code, int) else (0 if code is None else 1)
+                )
+    finally:
+        os.chdir(original_cwd)
+        log.removeHandler(handler)
+
+    return SimpleNamespace(
+        returncode=returncode, stdout=stdout.getvalue(), stderr=stderr.getvalue()
+    )
@@ -3,6 +3,8 @@
 from pathlib import Path
 from types import SimpleNamespace
 
+import pytest
+
 from autorepro.utils.validation_helpers import (
     determine_rule_source,
     has_any_keyword_variant,
@@ -14,62 +16,84 @@ from autorepro.utils.validation_helpers import (
     should_apply_repo_relative_path,
 )
 
+# Keyword sets are frozensets shared by every case instead of per-call literals
+_NO_KEYWORDS: frozenset[str] = frozenset()
+
+# (keywords, variants, expected) for has_any_keyword_variant
+_PYTEST_KEYWORDS = frozenset({"pytest", "unittest", "coverage"})
+ANY_VARIANT_CASES = [
+    (_PYTEST_KEYWORDS, ["test", "testing", "pytest"], True),
+    (_PYTEST_KEYWORDS, ["npm", "yarn", "node"], False),
+    (_NO_KEYWORDS, ["test"], False),
+]
+
+# (checker, keywords, expected) for the per-category keyword checkers
+KW_CASES = [
+    (has_test_keywords, frozenset({"test", "python"}), True),
+    (has_test_keywords, frozenset({"tests", "framework"}), True),
+    (has_test_keywords, frozenset({"testing", "unit"}), True),
+    (has_test_keywords, frozenset({"python", "framework"}), False),
+    (has_test_keywords, _NO_KEYWORDS, False),
+    (has_installation_keywords, frozenset({"install", "dependencies"}), True),
+    (has_installation_keywords, frozenset({"setup", "configure"}), True),
+    (has_installation_keywords, frozenset({"test", "run"}), False),
+    (has_installation_keywords, _NO_KEYWORDS, False),
+    (has_ci_keywords, frozenset({"ci", "build"}), True),
+    (has_ci_keywords, frozenset({"test", "install"}), False),
+    (has_ci_keywords, _NO_KEYWORDS, False),
+]
+
+# PR config flags that each request an update of an existing PR
+PR_UPDATE_FIELDS = (
+    "update_if_exists",
+    "comment",
+    "update_pr_body",
+    "add_labels",
+    "link_issue",
+)
+
 
 class TestKeywordValidation:
     """Test keyword validation functions."""
 
-    def test_has_any_keyword_variant(self):
+    @pytest.mark.parametrize("keywords,variants,expected", ANY_VARIANT_CASES)
+    def test_has_any_keyword_variant(self, keywords, variants, expected):
         """Test generic keyword variant checking."""
-        keywords = {"pytest", "unittest", "coverage"}
-        assert has_any_keyword_variant(keywords, ["test", "testing", "pytest"])
-        assert not has_any_keyword_variant(keywords, ["npm", "yarn", "node"])
-        assert not has_any_keyword_variant(set(), ["test"])
-
-    def test_has_test_keywords(self):
-        """Test test-related keyword detection."""
-        assert has_test_keywords({"test", "python"})
-        assert has_test_keywords({"tests", "framework"})
-        assert has_test_keywords({"testing", "unit"})
-        assert not has_test_keywords({"python", "framework"})
-        assert not has_test_keywords(set())
-
-    def test_has_installation_keywords(self):
-        """Test installation-related keyword detection."""
-        assert has_installation_keywords({"install", "dependencies"})
-        assert has_installation_keywords({"setup", "configure"})
-        assert not has_installation_keywords({"test", "run"})
-        assert not has_installation_keywords(set())
-
-    def test_has_ci_keywords(self):
-        """Test CI-related keyword detection."""
-        assert has_ci_keywords({"ci", "build"})
-        assert not has_ci_keywords({"test", "install"})
-        assert not has_ci_keywords(set())
+        assert has_any_keyword_variant(keywords, variants) is expected
+
+    @pytest.mark.parametrize("func,keywords,expected", KW_CASES)
+    def test_has_category_keywords(self, func, keywords, expected):
+        """Test test-, installation- and CI-related keyword detection."""
+        assert func(keywords) is expected
+
+
+@pytest.fixture(scope="class")
+def rule_tables():
+    """Return a rule and builtin tables with, without and missing its ecosystem."""
+    rule = SimpleNamespace(cmd="pytest")
+    return rule, {"python": [rule]}, {"python": []}, {"other": []}
 
 
 class TestRuleSourceDetermination:
     """Test rule source determination logic."""
 
-    def test_determine_rule_source_builtin(self):
+    def test_determine_rule_source_builtin(self, rule_tables):
         """Test builtin rule detection."""
-        rule = SimpleNamespace(cmd="pytest")
-        builtin_rules = {"python": [rule]}
+        rule, builtin_rules, _, _ = rule_tables
 
         result = determine_rule_source("python", rule, builtin_rules)
         assert result == "builtin"
 
-    def test_determine_rule_source_plugin(self):
+    def test_determine_rule_source_plugin(self, rule_tables):
         """Test plugin rule detection."""
-        rule = SimpleNamespace(cmd="custom-test")
-        builtin_rules = {"python": []}
+        rule, _, builtin_rules, _ = rule_tables
 
         result = determine_rule_source("python", rule, builtin_rules)
         assert result == "plugin"
 
-    def test_determine_rule_source_missing_ecosystem(self):
+    def test_determine_rule_source_missing_ecosystem(self, rule_tables):
         """Test rule source when ecosystem not in builtin_rules."""
-        rule = SimpleNamespace(cmd="test")
-        builtin_rules = {"other": []}
+        rule, _, _, builtin_rules = rule_tables
 
         result = determine_rule_source("python", rule, builtin_rules)
         assert result == "plugin"
@@ -98,59 +122,16 @@ class TestPathLogic:
 class TestPROperations:
     """Test PR operation validation logic."""
 
-    def test_needs_pr_update_operation_true_cases(self):
-        """Test cases where PR update is needed."""
-        configs = [
-            {
-                "update_if_exists": True,
-                "comment": False,
-                "update_pr_body": False,
-                "add_labels": False,
-                "link_issue": False,
-            },
-            {
-                "update_if_exists": False,
-                "comment": True,
-                "update_pr_body": False,
-                "add_labels": False,
-                "link_issue": False,
-            },
-            {
-                "update_if_exists": False,
-                "comment": False,
-                "update_pr_body": True,
-                "add_labels": False,
-                "link_issue": False,
-            },
-            {
-                "update_if_exists": False,
-                "comment": False,
-                "update_pr_body": False,
-                "add_labels": True,
-                "link_issue": False,
-            },
-            {
-                "update_if_exists": False,
-                "comment": False,
-                "update_pr_body": False,
-                "add_labels": False,
-                "link_issue": True,
-            },
-        ]
-
-        for config in configs:
-            pr_config = SimpleNamespace(**config)
-            assert needs_pr_update_operation(pr_config), f"Should be True for {config}"
+    @pytest.mark.parametrize("field", PR_UPDATE_FIELDS)
+    def test_needs_pr_update_operation_true_cases(self, field):
+        """Test each PR update flag on its own makes an update necessary."""
+        pr_config = SimpleNamespace(**{f: f == field for f in PR_UPDATE_FIELDS})
+
+        assert needs_pr_update_operation(pr_config)
 
     def test_needs_pr_update_operation_false_case(self):
         """Test case where no PR update is needed."""
-        pr_config = SimpleNamespace(
-            update_if_exists=False,
-            comment=False,
-            update_pr_body=False,
-            add_labels=False,
-            link_issue=False,
-        )
+        pr_config = SimpleNamespace(**dict.fromkeys(PR_UPDATE_FIELDS, False))
 
         assert not needs_pr_update_operation(pr_config)
 
@@ -0,0 +1,11 @@
+"""Fixtures shared by the utils tests."""
+
+import pytest
+
+
+@pytest.fixture(scope="session")
+def shared_tmp(fast_tmp_root):
+    """Carve work_dir out of fast_tmp_root so file_ops I/O stays on tmpfs."""
+    path = fast_tmp_root / "utils"
+    path.mkdir()
+    return path
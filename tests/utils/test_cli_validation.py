@@ -5,9 +5,11 @@ These tests validate the CLI validation utilities that replace duplicate argumen
 validation patterns found across AutoRepro CLI commands.
 """
 
-import tempfile
+import io
+import os
 from pathlib import Path
-from unittest.mock import Mock, patch
+from types import SimpleNamespace
+from unittest.mock import patch
 
 import pytest
 
@@ -16,98 +18,122 @@ from autorepro.utils.cli_validation import (
     ValidationError,
     validate_and_exit,
     validate_multiple,
+    validate_multiple_lazy,
+    validation_cache,
 )
 
 
-class TestArgumentValidator:
-    """Test ArgumentValidator utility class."""
+@pytest.fixture(scope="module")
+def existing_dir(tmp_path_factory):
+    """Directory shared by tests that only check path kind; never written to."""
+    return tmp_path_factory.mktemp("validator_dir")
 
-    def test_validate_desc_file_exclusive_valid_desc_only(self):
-        """Test validation passes with desc argument only."""
-        result = ArgumentValidator.validate_desc_file_exclusive(
-            desc="test description", file=None
-        )
-        assert result is None
 
-    def test_validate_desc_file_exclusive_valid_file_only(self):
-        """Test validation passes with file argument only."""
-        result = ArgumentValidator.validate_desc_file_exclusive(
-            desc=None, file="test.txt"
-        )
-        assert result is None
+@pytest.fixture(scope="module")
+def existing_file(tmp_path_factory):
+    """Readable UTF-8 file shared the same way as existing_dir."""
+    path = tmp_path_factory.mktemp("validator_file") / "f.txt"
+    path.write_text("test content", encoding="utf-8")
+    return path
 
-    def test_validate_desc_file_exclusive_missing_both(self):
-        """Test validation fails when both desc and file are missing."""
-        result = ArgumentValidator.validate_desc_file_exclusive(desc=None, file=None)
-        assert result is not None
-        assert "Either --desc or --file must be specified" in result
 
-    def test_validate_desc_file_exclusive_both_provided(self):
-        """Test validation fails when both desc and file are provided."""
-        result = ArgumentValidator.validate_desc_file_exclusive(
-            desc="test description", file="test.txt"
+@pytest.fixture
+def fake_text_file(monkeypatch):
+    """Return a callable making every Path a regular file holding given bytes."""
+
+    def install(content: bytes) -> Path:
+        monkeypatch.setattr(
+            "autorepro.utils.cli_validation._path_stat",
+            lambda path: (True, False, True),
         )
-        assert result is not None
-        assert "Cannot use both --desc and --file" in result
+        monkeypatch.setattr(
+            Path, "open", lambda self, *args, **kwargs: io.BytesIO(content)
+        )
+        return Path("/fake/input.txt")
 
-    def test_validate_desc_file_exclusive_empty_string_treated_as_none(self):
-        """Test empty strings are treated as None values."""
-        result = ArgumentValidator.validate_desc_file_exclusive(desc="", file="")
-        assert result is not None
-        assert "Either --desc or --file must be specified" in result
+    return install
 
-    def test_validate_output_path_none_value(self):
-        """Test output path validation passes for None value."""
-        result = ArgumentValidator.validate_output_path(None)
-        assert result is None
 
-    def test_validate_output_path_nonexistent_file(self):
-        """Test output path validation passes for nonexistent file."""
-        result = ArgumentValidator.validate_output_path("/nonexistent/file.txt")
-        assert result is None
+class TestArgumentValidator:
+    """Test ArgumentValidator utility class."""
 
-    def test_validate_output_path_existing_file(self):
-        """Test output path validation passes for existing file."""
-        with tempfile.NamedTemporaryFile() as temp_file:
-            result = ArgumentValidator.validate_output_path(temp_file.name)
+    @pytest.mark.parametrize(
+        "desc,file,expected_substr",
+        [
+            pytest.param("test description", None, None, id="desc_only"),
+            pytest.param(None, "test.txt", None, id="file_only"),
+            pytest.param(
+                None,
+                None,
+                "Either --desc or --file must be specified",
+                id="missing_both",
+            ),
+            pytest.param(
+                "test description",
+                "test.txt",
+                "Cannot use both --desc and --file",
+                id="both_provided",
+            ),
+            # Empty strings are treated as None values
+            pytest.param(
+                "", "", "Either --desc or --file must be specified", id="both_empty"
+            ),
+        ],
+    )
+    def test_validate_desc_file_exclusive(self, desc, file, expected_substr):
+        """Test --desc/--file mutual exclusivity validation."""
+        result = ArgumentValidator.validate_desc_file_exclusive(desc=desc, file=file)
+        if expected_substr is None:
             assert result is None
+        else:
+            assert result is not None
+            assert expected_substr in result
+
+    @pytest.mark.parametrize(
+        "out",
+        [
+            pytest.param(None, id="none_value"),
+            pytest.param("/nonexistent/file.txt", id="nonexistent_file"),
+        ],
+    )
+    def test_validate_output_path_passes(self, out):
+        """Test output path validation passes when no directory is in the way."""
+        assert ArgumentValidator.validate_output_path(out) is None
+
+    def test_validate_output_path_existing_file(self, existing_file):
+        """Test output path validation passes for existing file."""
+        result = ArgumentValidator.validate_output_path(str(existing_file))
+        assert result is None
 
-    def test_validate_output_path_existing_directory_fails(self):
+    def test_validate_output_path_existing_directory_fails(self, existing_dir):
         """Test output path validation fails for existing directory."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            result = ArgumentValidator.validate_output_path(temp_dir)
-            assert result is not None
-            assert "Output path cannot be a directory" in result
-            assert temp_dir in result
+        result = ArgumentValidator.validate_output_path(str(existing_dir))
+        assert result is not None
+        assert "Output path cannot be a directory" in result
+        assert str(existing_dir) in result
 
-    def test_validate_output_path_path_object(self):
+    def test_validate_output_path_path_object(self, existing_dir):
         """Test output path validation works with Path objects."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            dir_path = Path(temp_dir)
-            result = ArgumentValidator.validate_output_path(dir_path)
-            assert result is not None
-            assert "Output path cannot be a directory" in result
+        result = ArgumentValidator.validate_output_path(existing_dir)
+        assert result is not None
+        assert "Output path cannot be a directory" in result
 
     def test_validate_output_path_invalid_path(self):
         """Test output path validation handles invalid path strings."""
-        # Mock Path() in the validation module to raise ValueError to test error handling
-        with patch("autorepro.utils.cli_validation.Path") as mock_path:
-            mock_path.side_effect = ValueError("Invalid path")
-
-            result = ArgumentValidator.validate_output_path("invalid_path")
-            assert result is not None
-            assert "Invalid output path" in result
+        # stat() rejects an embedded NUL byte with ValueError
+        result = ArgumentValidator.validate_output_path("invalid\0path")
+        assert result is not None
+        assert "Invalid output path" in result
 
     def test_validate_repo_path_none_value(self):
         """Test repo path validation passes for None value."""
         result = ArgumentValidator.validate_repo_path(None)
         assert result is None
 
-    def test_validate_repo_path_existing_directory(self):
+    def test_validate_repo_path_existing_directory(self, existing_dir):
         """Test repo path validation passes for existing directory."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            result = ArgumentValidator.validate_repo_path(temp_dir)
-            assert result is None
+        result = ArgumentValidator.validate_repo_path(str(existing_dir))
+        assert result is None
 
     def test_validate_repo_path_nonexistent_path(self):
         """Test repo path validation fails for nonexistent path."""
@@ -115,50 +141,60 @@ class TestArgumentValidator:
         assert result is not None
         assert "Repository path does not exist" in result
 
-    def test_validate_repo_path_existing_file_fails(self):
+    def test_validate_repo_path_existing_file_fails(self, existing_file):
         """Test repo path validation fails for existing file (not directory)."""
-        with tempfile.NamedTemporaryFile() as temp_file:
-            result = ArgumentValidator.validate_repo_path(temp_file.name)
-            assert result is not None
-            assert "Repository path is not a directory" in result
+        result = ArgumentValidator.validate_repo_path(str(existing_file))
+        assert result is not None
+        assert "Repository path is not a directory" in result
 
-    def test_validate_repo_path_path_object(self):
+    def test_validate_repo_path_path_object(self, existing_dir):
         """Test repo path validation works with Path objects."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            dir_path = Path(temp_dir)
-            result = ArgumentValidator.validate_repo_path(dir_path)
-            assert result is None
-
-    def test_validate_required_arg_valid_value(self):
-        """Test required argument validation passes for valid value."""
-        result = ArgumentValidator.validate_required_arg("valid_value", "--test-arg")
+        result = ArgumentValidator.validate_repo_path(existing_dir)
         assert result is None
 
-    def test_validate_required_arg_none_value(self):
-        """Test required argument validation fails for None value."""
-        result = ArgumentValidator.validate_required_arg(None, "--test-arg")
-        assert result is not None
-        assert "--test-arg must be specified" in result
-
-    def test_validate_required_arg_empty_string(self):
-        """Test required argument validation fails for empty string."""
-        result = ArgumentValidator.validate_required_arg("", "--test-arg")
-        assert result is not None
-        assert "--test-arg must be specified" in result
+    @pytest.mark.parametrize(
+        "value,expected_substr",
+        [
+            pytest.param("valid_value", None, id="valid_value"),
+            pytest.param(None, "--test-arg must be specified", id="none_value"),
+            pytest.param("", "--test-arg must be specified", id="empty_string"),
+        ],
+    )
+    def test_validate_required_arg(self, value, expected_substr):
+        """Test required argument validation."""
+        result = ArgumentValidator.validate_required_arg(value, "--test-arg")
+        if expected_substr is None:
+            assert result is None
+        else:
+            assert result is not None
+            assert expected_substr in result
 
     def test_validate_file_exists_none_value(self):
         """Test file exists validation passes for None value."""
         result = ArgumentValidator.validate_file_exists(None, "Test file")
         assert result is None
 
-    def test_validate_file_exists_existing_file(self):
-        """Test file exists validation passes for existing readable file."""
-        with tempfile.NamedTemporaryFile(mode="w", encoding="utf-8") as temp_file:
-            temp_file.write("test content")
-            temp_file.flush()
+    @pytest.mark.parametrize(
+        "content,should_pass",
+        [
+            pytest.param(b"test content", True, id="utf8"),
+            # Binary data that fails UTF-8 decoding
+            pytest.param(b"\xff\xfe\x00\x00", False, id="undecodable"),
+        ],
+    )
+    def test_validate_file_exists_readability(
+        self, fake_text_file, content, should_pass
+    ):
+        """Test file exists validation decodes the file content as UTF-8."""
+        result = ArgumentValidator.validate_file_exists(
+            fake_text_file(content), "Test file"
+        )
 
-            result = ArgumentValidator.validate_file_exists(temp_file.name, "Test file")
+        if should_pass:
             assert result is None
+        else:
+            assert result is not None
+            assert "Cannot read test file" in result
 
     def test_validate_file_exists_nonexistent_file(self):
         """Test file exists validation fails for nonexistent file."""
@@ -168,33 +204,51 @@ class TestArgumentValidator:
         assert result is not None
         assert "Test file does not exist" in result
 
-    def test_validate_file_exists_directory_fails(self):
+    def test_validate_file_exists_directory_fails(self, existing_dir):
         """Test file exists validation fails for directory."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            result = ArgumentValidator.validate_file_exists(temp_dir, "Test file")
-            assert result is not None
-            assert "Test file is not a file" in result
-
-    def test_validate_file_exists_unreadable_file(self):
-        """Test file exists validation handles unreadable files."""
-        with tempfile.NamedTemporaryFile() as temp_file:
-            # Write binary data to make it fail UTF-8 decoding
-            temp_file.write(b"\xff\xfe\x00\x00")
-            temp_file.flush()
-
-            result = ArgumentValidator.validate_file_exists(temp_file.name, "Test file")
-            assert result is not None
-            assert "Cannot read test file" in result
+        result = ArgumentValidator.validate_file_exists(str(existing_dir), "Test file")
+        assert result is not None
+        assert "Test file is not a file" in result
+
+    @pytest.mark.parametrize(
+        "content",
+        [
+            # Multibyte character split across the end of the checked prefix
+            pytest.param(b"a" * 4095 + "\u00e9".encode(), id="split_at_prefix"),
+            # Bytes past the prefix are never decoded
+            pytest.param(b"a" * 4096 + b"\xff\xfe", id="invalid_after_prefix"),
+        ],
+    )
+    def test_validate_file_exists_checks_prefix_only(self, tmp_path, content):
+        """Test file exists validation only decodes the start of the file."""
+        file_path = tmp_path / "large.txt"
+        file_path.write_bytes(content)
+
+        assert ArgumentValidator.validate_file_exists(file_path, "Test file") is None
+
+    def test_validate_file_exists_large_file(self, tmp_path):
+        """Test file exists validation of a large file reads only the prefix."""
+        file_path = tmp_path / "sparse.txt"
+        with file_path.open("wb") as f:
+            f.write(b"a" * 4096)
+            # Extend to 16 MiB without writing the rest; holes read as NUL
+            f.truncate(16 << 20)
+
+        assert ArgumentValidator.validate_file_exists(file_path, "Test file") is None
+
+    def test_validate_file_exists_truncated_multibyte_at_eof(self, tmp_path):
+        """Test a file ending mid-character inside the prefix is still rejected."""
+        file_path = tmp_path / "truncated.txt"
+        file_path.write_bytes(b"abc\xc3")
+
+        result = ArgumentValidator.validate_file_exists(file_path, "Test file")
+        assert result is not None
+        assert "Cannot read test file" in result
 
-    def test_validate_file_exists_path_object(self):
+    def test_validate_file_exists_path_object(self, existing_file):
         """Test file exists validation works with Path objects."""
-        with tempfile.NamedTemporaryFile(mode="w", encoding="utf-8") as temp_file:
-            temp_file.write("test content")
-            temp_file.flush()
-
-            file_path = Path(temp_file.name)
-            result = ArgumentValidator.validate_file_exists(file_path, "Test file")
-            assert result is None
+        result = ArgumentValidator.validate_file_exists(existing_file, "Test file")
+        assert result is None
 
     def test_validate_file_exists_default_arg_name(self):
         """Test file exists validation uses default argument name."""
@@ -206,73 +260,100 @@ class TestArgumentValidator:
 class TestValidationError:
     """Test ValidationError exception class."""
 
-    def test_validation_error_initialization(self):
-        """Test ValidationError initializes with message and exit code."""
-        error = ValidationError("Test error", 3)
+    @pytest.mark.parametrize(
+        "code_in,code_out",
+        [pytest.param(3, 3, id="explicit"), pytest.param(None, 2, id="default")],
+    )
+    def test_validation_error_fields(self, code_in, code_out):
+        """Test ValidationError keeps its message and exit code (default 2)."""
+        error = (
+            ValidationError("Test error")
+            if code_in is None
+            else ValidationError("Test error", code_in)
+        )
         assert str(error) == "Test error"
         assert error.message == "Test error"
-        assert error.exit_code == 3
-
-    def test_validation_error_default_exit_code(self):
-        """Test ValidationError uses default exit code 2."""
-        error = ValidationError("Test error")
-        assert error.exit_code == 2
+        assert error.exit_code == code_out
 
 
 class TestValidationHelpers:
     """Test validation helper functions."""
 
-    def test_validate_and_exit_no_error(self):
-        """Test validate_and_exit passes when validator returns None."""
-        # Should not raise exception
-        validate_and_exit(None)
-
-    def test_validate_and_exit_with_error(self):
-        """Test validate_and_exit raises ValidationError when validator fails."""
-        with pytest.raises(ValidationError) as exc_info:
-            validate_and_exit("Validation failed")
-
-        assert exc_info.value.message == "Validation failed"
-        assert exc_info.value.exit_code == 2
+    @pytest.mark.parametrize(
+        "helper,args,kwargs,expect_msg,exit_code",
+        [
+            pytest.param(validate_and_exit, (None,), {}, None, None, id="ok"),
+            pytest.param(
+                validate_and_exit,
+                ("Validation failed",),
+                {},
+                "Validation failed",
+                2,
+                id="error",
+            ),
+            pytest.param(
+                validate_and_exit,
+                ("Custom error",),
+                {"exit_code": 5},
+                "Custom error",
+                5,
+                id="custom_exit_code",
+            ),
+            pytest.param(
+                validate_multiple, (None, None, None), {}, None, None, id="multi_ok"
+            ),
+            pytest.param(
+                validate_multiple,
+                (None, "First error", "Second error"),
+                {},
+                "First error",
+                2,
+                id="multi_first_error",
+            ),
+            pytest.param(
+                validate_multiple,
+                ("Error message",),
+                {"exit_code": 7},
+                "Error message",
+                7,
+                id="multi_custom_exit_code",
+            ),
+        ],
+    )
+    def test_raises_on_first_error(  # noqa: PLR0913
+        self, helper, args, kwargs, expect_msg, exit_code
+    ):
+        """Test helpers pass on None results and raise the first error otherwise."""
+        if expect_msg is None:
+            helper(*args, **kwargs)
+            return
 
-    def test_validate_and_exit_custom_exit_code(self):
-        """Test validate_and_exit uses custom exit code."""
         with pytest.raises(ValidationError) as exc_info:
-            validate_and_exit("Custom error", exit_code=5)
+            helper(*args, **kwargs)
 
-        assert exc_info.value.exit_code == 5
+        assert exc_info.value.message == expect_msg
+        assert exc_info.value.exit_code == exit_code
 
-    def test_validate_multiple_no_errors(self):
-        """Test validate_multiple passes when all validators return None."""
-        # Should not raise exception
-        validate_multiple(None, None, None)
+    def test_validate_multiple_lazy(self):
+        """Test validate_multiple_lazy passes if all succeed, else raises first."""
+        validate_multiple_lazy(lambda: None, lambda: None)
 
-    def test_validate_multiple_with_error(self):
-        """Test validate_multiple raises ValidationError on first failure."""
         with pytest.raises(ValidationError) as exc_info:
-            validate_multiple(None, "First error", "Second error")
+            validate_multiple_lazy(lambda: None, lambda: "First error", exit_code=7)
 
         assert exc_info.value.message == "First error"
-
-    def test_validate_multiple_custom_exit_code(self):
-        """Test validate_multiple uses custom exit code."""
-        with pytest.raises(ValidationError) as exc_info:
-            validate_multiple("Error message", exit_code=7)
-
         assert exc_info.value.exit_code == 7
 
 
 class TestArgumentValidatorIntegration:
-    """Integration tests for ArgumentValidator with mock argument objects."""
+    """Integration tests for ArgumentValidator with stand-in argument objects."""
 
     def test_cli_args_integration_pattern(self):
-        """Test ArgumentValidator with mock args object (typical CLI usage)."""
-        # Mock argparse Namespace object
-        valid_args = Mock()
-        valid_args.desc = "test description"
-        valid_args.file = None
-        valid_args.out = "/tmp/output.txt"
-        valid_args.repo = None
+        """Test ArgumentValidator with an args namespace (typical CLI usage)."""
+        # Stand-in for an argparse Namespace
+        valid_args = SimpleNamespace(
+            desc="test description", file=None, out="/tmp/output.txt", repo=None
+        )
 
         # Test multiple validations
         desc_file_error = ArgumentValidator.validate_desc_file_exclusive(
@@ -285,14 +366,45 @@ class TestArgumentValidatorIntegration:
         assert output_error is None
         assert repo_error is None
 
+    def test_cli_args_integration_shares_path_checks(self, existing_dir):
+        """Test validators given the same path stat it once per invocation."""
+        repo = str(existing_dir)
+
+        with (
+            patch(
+                "autorepro.utils.cli_validation.os.stat", side_effect=os.stat
+            ) as stat_call,
+            validation_cache(),
+        ):
+            assert ArgumentValidator.validate_repo_path(repo) is None
+            assert "cannot be a directory" in ArgumentValidator.validate_output_path(
+                repo
+            )
+            assert "is not a file" in ArgumentValidator.validate_file_exists(repo)
+
+        assert stat_call.call_count == 1
+
+    def test_path_checks_are_live_outside_validation_cache(self, tmp_path):
+        """Test a path created after a check is seen unless inside a cache block."""
+        out = tmp_path / "out"
+
+        with validation_cache():
+            assert ArgumentValidator.validate_output_path(out) is None
+            out.mkdir()
+            # Memoized for the rest of the block
+            assert ArgumentValidator.validate_output_path(out) is None
+
+        assert "cannot be a directory" in ArgumentValidator.validate_output_path(out)
+
     def test_cli_args_integration_with_errors(self):
         """Test ArgumentValidator catches common CLI error combinations."""
-        # Mock args with multiple errors
-        invalid_args = Mock()
-        invalid_args.desc = "description"
-        invalid_args.file = "file.txt"  # Both provided
-        invalid_args.out = "/tmp"  # Directory, not file
-        invalid_args.repo_slug = None  # Required but missing
+        # Args with multiple errors
+        invalid_args = SimpleNamespace(
+            desc="description",
+            file="file.txt",  # Both provided
+            out="/tmp",  # Directory, not file
+            repo_slug=None,  # Required but missing
+        )
 
         desc_file_error = ArgumentValidator.validate_desc_file_exclusive(
             invalid_args.desc, invalid_args.file
@@ -311,3 +423,31 @@ class TestArgumentValidatorIntegration:
             validate_multiple(desc_file_error, output_error, required_error)
 
         assert "Cannot use both --desc and --file" in exc_info.value.message
+
+        # The lazy form stops at the first failure without running the rest
+        calls = []
+
+        def counted(validator, *args):
+            def run():
+                calls.append(validator.__name__)
+                return validator(*args)
+
+            return run
+
+        with pytest.raises(ValidationError) as exc_info:
+            validate_multiple_lazy(
+                counted(
+                    ArgumentValidator.validate_desc_file_exclusive,
+                    invalid_args.desc,
+                    invalid_args.file,
+                ),
+                counted(ArgumentValidator.validate_output_path, invalid_args.out),
+                counted(
+                    ArgumentValidator.validate_required_arg,
+                    invalid_args.repo_slug,
+                    "--repo-slug",
+                ),
+            )
+
+        assert "Cannot use both --desc and --file" in exc_info.value.message
+        assert calls == ["validate_desc_file_exclusive"]
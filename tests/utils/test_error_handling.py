@@ -7,7 +7,6 @@ exception handling patterns across the AutoRepro codebase.
 
 import logging
 import subprocess
-import tempfile
 from pathlib import Path
 from unittest.mock import patch
 
@@ -30,6 +29,23 @@ from autorepro.utils.error_handling import (
 from autorepro.utils.process import SubprocessConfig
 
 
+@pytest.fixture(scope="class")
+def subprocess_error():
+    """SubprocessError with every detail set; read-only, shared by its class."""
+    details = SubprocessDetails(
+        cmd=["echo", "test"], exit_code=1, stdout="output", stderr="error"
+    )
+    return SubprocessError(message="test failed", details=details, operation="test")
+
+
+@pytest.fixture(scope="class")
+def file_operation_error():
+    """FileOperationError with a Path and operation; read-only, shared by its class."""
+    return FileOperationError(
+        message="file failed", path=Path("/test/path"), operation="read"
+    )
+
+
 class TestStandardizedExceptions:
     """Test standardized exception classes."""
 
@@ -41,23 +57,23 @@ class TestStandardizedExceptions:
         assert error.operation == "test_op"
         assert error.cause is None
 
-    def test_subprocess_error_attributes(self):
-        """Test SubprocessError attributes and initialization."""
-        cmd = ["echo", "test"]
-        details = SubprocessDetails(
-            cmd=cmd, exit_code=1, stdout="output", stderr="error"
-        )
-        error = SubprocessError(
-            message="test failed",
-            details=details,
-            operation="test",
-        )
-        assert str(error) == "test failed"
-        assert error.cmd == "echo test"
-        assert error.exit_code == 1
-        assert error.stdout == "output"
-        assert error.stderr == "error"
-        assert error.operation == "test"
+    def test_subprocess_error_message(self, subprocess_error):
+        """Test SubprocessError message and operation."""
+        assert str(subprocess_error) == "test failed"
+        assert subprocess_error.operation == "test"
+
+    def test_subprocess_error_cmd_joined(self, subprocess_error):
+        """Test SubprocessError joins a list command into a string."""
+        assert subprocess_error.cmd == "echo test"
+
+    def test_subprocess_error_exit_code(self, subprocess_error):
+        """Test SubprocessError exit code."""
+        assert subprocess_error.exit_code == 1
+
+    def test_subprocess_error_streams(self, subprocess_error):
+        """Test SubprocessError stdout and stderr."""
+        assert subprocess_error.stdout == "output"
+        assert subprocess_error.stderr == "error"
 
     def test_subprocess_error_string_command(self):
         """Test SubprocessError with string command."""
@@ -65,13 +81,11 @@ class TestStandardizedExceptions:
         error = SubprocessError(message="test failed", details=details)
         assert error.cmd == "echo test"
 
-    def test_file_operation_error_attributes(self):
+    def test_file_operation_error_attributes(self, file_operation_error):
         """Test FileOperationError attributes and initialization."""
-        path = Path("/test/path")
-        error = FileOperationError(message="file failed", path=path, operation="read")
-        assert str(error) == "file failed"
-        assert error.path == path
-        assert error.operation == "read"
+        assert str(file_operation_error) == "file failed"
+        assert file_operation_error.path == Path("/test/path")
+        assert file_operation_error.operation == "read"
 
     def test_file_operation_error_string_path(self):
         """Test FileOperationError with string path."""
@@ -79,76 +93,146 @@ class TestStandardizedExceptions:
         assert error.path == Path("/test/path")
 
 
+def _assert_all_in_log(caplog, *needles):
+    """Assert each needle appears in some captured record, formatting them once."""
+    messages = [record.getMessage() for record in caplog.records]
+    missing = [n for n in needles if not any(n in m for m in messages)]
+    assert not missing, f"missing from log: {missing}"
+
+
+@pytest.fixture
+def fake_run(monkeypatch):
+    """Stub subprocess.run; return a function that sets its outcome.
+
+    ``fake_run(returncode, stdout, stderr, raises=None)`` makes the next calls
+    return a CompletedProcess (raising CalledProcessError when ``check=True``
+    and the code is non-zero) or raise ``raises``. It returns the list that
+    records each call's ``(args, kwargs)``.
+    """
+    calls = []
+
+    def configure(returncode=0, stdout="", stderr="", raises=None):
+        def run(args, **kwargs):
+            calls.append((args, kwargs))
+            if raises is not None:
+                raise raises
+            if kwargs.get("check") and returncode != 0:
+                raise subprocess.CalledProcessError(returncode, args, stdout, stderr)
+            return subprocess.CompletedProcess(args, returncode, stdout, stderr)
+
+        monkeypatch.setattr(subprocess, "run", run)
+        return calls
+
+    return configure
+
+
 class TestSafeSubprocessRun:
     """Test safe_subprocess_run wrapper function."""
 
-    def test_successful_command_execution(self):
+    def test_successful_command_execution(self, fake_run):
         """Test successful command execution."""
+        calls = fake_run(0, "hello\n")
+
         result = safe_subprocess_run(["echo", "hello"], check=False)
+
         assert result.returncode == 0
         assert result.stdout.strip() == "hello"
+        assert calls[0][0] == ["echo", "hello"]
 
-    def test_failed_command_with_check_false(self):
+    def test_failed_command_with_check_false(self, fake_run):
         """Test failed command with check=False doesn't raise."""
+        fake_run(1)
+
         result = safe_subprocess_run(["false"], check=False)
-        assert result.returncode == 1
 
-    def test_failed_command_with_check_true_raises(self):
-        """Test failed command with check=True raises SubprocessError."""
-        with pytest.raises(SubprocessError) as exc_info:
-            safe_subprocess_run(["false"], check=True, operation="test_op")
+        assert result.returncode == 1
 
-        error = exc_info.value
-        assert "test_op failed" in error.message
-        assert error.exit_code == 1
-        assert error.operation == "test_op"
-        assert isinstance(error.cause, subprocess.CalledProcessError)
+    @pytest.mark.parametrize(
+        "outcome,cmd,kwargs,exit_code,expected_substr,cause_type",
+        [
+            pytest.param(
+                {"returncode": 1},
+                ["false"],
+                {"check": True},
+                1,
+                "test_op failed",
+                subprocess.CalledProcessError,
+                id="fail_check",
+            ),
+            pytest.param(
+                {"raises": FileNotFoundError("nonexistent_command_12345")},
+                ["nonexistent_command_12345"],
+                {},
+                127,
+                "command not found",
+                FileNotFoundError,
+                id="not_found",
+            ),
+            pytest.param(
+                {"raises": subprocess.TimeoutExpired(["sleep", "10"], 0.1)},
+                ["sleep", "10"],
+                {"timeout": 0.1},
+                124,
+                "timed out",
+                subprocess.TimeoutExpired,
+                id="timeout",
+            ),
+        ],
+    )
+    def test_error_mapping(  # noqa: PLR0913
+        self, fake_run, outcome, cmd, kwargs, exit_code, expected_substr, cause_type
+    ):
+        """Test subprocess failures map to SubprocessError with standard codes."""
+        fake_run(**outcome)
 
-    def test_command_not_found_raises(self):
-        """Test command not found raises SubprocessError."""
         with pytest.raises(SubprocessError) as exc_info:
-            safe_subprocess_run(["nonexistent_command_12345"], operation="test_op")
+            safe_subprocess_run(cmd, operation="test_op", **kwargs)
 
         error = exc_info.value
-        assert "command not found" in error.message.lower()
-        assert error.exit_code == 127
+        assert expected_substr in error.message.lower()
+        assert error.exit_code == exit_code
         assert error.operation == "test_op"
-        assert isinstance(error.cause, FileNotFoundError)
-
-    def test_timeout_handling(self):
-        """Test command timeout handling."""
-        with pytest.raises(SubprocessError) as exc_info:
-            safe_subprocess_run(["sleep", "10"], timeout=0.1, operation="timeout_test")
+        assert isinstance(error.cause, cause_type)
 
-        error = exc_info.value
-        assert "timed out" in error.message.lower()
-        assert error.exit_code == 124
-        assert error.operation == "timeout_test"
-        assert isinstance(error.cause, subprocess.TimeoutExpired)
-
-    def test_string_command_conversion(self):
+    def test_string_command_conversion(self, fake_run):
         """Test string command is properly converted."""
+        calls = fake_run(0, "hello\n")
+
         result = safe_subprocess_run("echo hello", check=False)
+
         assert result.returncode == 0
-        assert result.stdout.strip() == "hello"
+        assert calls[0][0] == ["echo", "hello"]
 
-    def test_operation_logging(self, caplog):
+    def test_operation_logging(self, caplog, fake_run):
         """Test operation logging when enabled."""
+        fake_run(0, "test\n")
         caplog.set_level(logging.DEBUG, logger="autorepro.utils.error_handling")
         safe_subprocess_run(
             ["echo", "test"], operation="test_op", log_command=True, check=False
         )
 
-        assert "Running test_op: echo test" in caplog.text
+        _assert_all_in_log(caplog, "Running test_op: echo test")
 
-    def test_working_directory_parameter(self):
+    def test_working_directory_parameter(self, fake_run, tmp_path):
         """Test working directory parameter is handled correctly."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            result = safe_subprocess_run(["pwd"], cwd=temp_dir, check=False)
-            assert result.returncode == 0
-            assert temp_dir in result.stdout.strip()
+        calls = fake_run(0, f"{tmp_path}\n")
 
+        result = safe_subprocess_run(["pwd"], cwd=tmp_path, check=False)
+
+        assert result.returncode == 0
+        assert calls[0][1]["cwd"] == str(tmp_path)
 
+    @pytest.mark.slow
+    @pytest.mark.serial
+    def test_real_command_smoke(self):
+        """Test a real echo process still round-trips through the wrapper."""
+        result = safe_subprocess_run(["echo", "hello"], check=False)
+        assert result.returncode == 0
+        assert result.stdout.strip() == "hello"
+
+
+@pytest.mark.slow
+@pytest.mark.serial
 class TestSafeSubprocessCapture:
     """Test safe_subprocess_capture convenience function."""
 
@@ -186,47 +270,38 @@ class TestSafeFileOperation:
             # No file operations, should complete successfully
             pass
 
-    def test_os_error_handling(self):
-        """Test OSError is converted to FileOperationError."""
+    @pytest.mark.parametrize(
+        "exc,expected_substr",
+        [
+            pytest.param(OSError("test error"), "test operation failed", id="os_error"),
+            pytest.param(
+                PermissionError("permission denied"),
+                "test operation failed",
+                id="permission_error",
+            ),
+            pytest.param(
+                UnicodeDecodeError("utf-8", b"", 0, 1, "test"),
+                "test operation failed",
+                id="unicode_error",
+            ),
+            pytest.param(
+                ValueError("unexpected error"),
+                "test operation failed unexpectedly",
+                id="unexpected_error",
+            ),
+        ],
+    )
+    def test_error_handling(self, exc, expected_substr):
+        """Test errors raised inside the block become FileOperationError."""
         with pytest.raises(FileOperationError) as exc_info:
             with safe_file_operation("test operation", path="/test/path"):
-                raise OSError("test error")
+                raise exc
 
         error = exc_info.value
-        assert "test operation failed" in error.message
+        assert expected_substr in error.message
         assert error.path == Path("/test/path")
         assert error.operation == "test operation"
-        assert isinstance(error.cause, OSError)
-
-    def test_permission_error_handling(self):
-        """Test PermissionError is converted to FileOperationError."""
-        with pytest.raises(FileOperationError) as exc_info:
-            with safe_file_operation("test operation"):
-                raise PermissionError("permission denied")
-
-        error = exc_info.value
-        assert "test operation failed" in error.message
-        assert isinstance(error.cause, PermissionError)
-
-    def test_unicode_error_handling(self):
-        """Test UnicodeDecodeError is converted to FileOperationError."""
-        with pytest.raises(FileOperationError) as exc_info:
-            with safe_file_operation("test operation"):
-                raise UnicodeDecodeError("utf-8", b"", 0, 1, "test")
-
-        error = exc_info.value
-        assert "test operation failed" in error.message
-        assert isinstance(error.cause, UnicodeDecodeError)
-
-    def test_unexpected_error_handling(self):
-        """Test unexpected errors are converted to FileOperationError."""
-        with pytest.raises(FileOperationError) as exc_info:
-            with safe_file_operation("test operation"):
-                raise ValueError("unexpected error")
-
-        error = exc_info.value
-        assert "test operation failed unexpectedly" in error.message
-        assert isinstance(error.cause, ValueError)
+        assert isinstance(error.cause, type(exc))
 
     def test_operation_logging(self, caplog):
         """Test operation logging when enabled."""
@@ -234,45 +309,43 @@ class TestSafeFileOperation:
         with safe_file_operation("test operation", log_operations=True):
             pass
 
-        assert "Starting test operation" in caplog.text
-        assert "Completed test operation" in caplog.text
+        _assert_all_in_log(
+            caplog, "Starting test operation", "Completed test operation"
+        )
 
 
 class TestSafeFileWrappers:
     """Test safe file operation wrapper functions."""
 
-    def test_safe_write_file(self):
+    def test_safe_write_file(self, work_dir):
         """Test safe_write_file function."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            test_path = Path(temp_dir) / "test.txt"
-            content = "Hello, World!"
+        test_path = work_dir / "test.txt"
+        content = "Hello, World!"
 
-            safe_write_file(test_path, content)
+        safe_write_file(test_path, content)
 
-            assert test_path.exists()
-            assert test_path.read_text() == content
+        assert test_path.exists()
+        assert test_path.read_text() == content
 
-    def test_safe_write_file_creates_parent_directory(self):
+    def test_safe_write_file_creates_parent_directory(self, work_dir):
         """Test safe_write_file creates parent directories."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            test_path = Path(temp_dir) / "subdir" / "test.txt"
-            content = "Hello, World!"
+        test_path = work_dir / "subdir" / "test.txt"
+        content = "Hello, World!"
 
-            safe_write_file(test_path, content)
+        safe_write_file(test_path, content)
 
-            assert test_path.exists()
-            assert test_path.read_text() == content
+        assert test_path.exists()
+        assert test_path.read_text() == content
 
-    def test_safe_read_file_existing(self):
+    def test_safe_read_file_existing(self, work_dir):
         """Test safe_read_file with existing file."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            test_path = Path(temp_dir) / "test.txt"
-            content = "Hello, World!"
-            test_path.write_text(content)
+        test_path = work_dir / "test.txt"
+        content = "Hello, World!"
+        test_path.write_text(content)
 
-            result = safe_read_file(test_path)
+        result = safe_read_file(test_path)
 
-            assert result == content
+        assert result == content
 
     def test_safe_read_file_missing_with_default(self):
         """Test safe_read_file with missing file and default."""
@@ -290,40 +363,40 @@ class TestSafeFileWrappers:
         with pytest.raises(FileOperationError):
             safe_read_file(missing_path)
 
-    def test_safe_ensure_directory(self):
+    def test_safe_ensure_directory(self, work_dir):
         """Test safe_ensure_directory function."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            test_path = Path(temp_dir) / "subdir" / "nested"
+        test_path = work_dir / "subdir" / "nested"
 
-            safe_ensure_directory(test_path)
+        safe_ensure_directory(test_path)
 
-            assert test_path.exists()
-            assert test_path.is_dir()
+        assert test_path.exists()
+        assert test_path.is_dir()
 
-    def test_safe_ensure_directory_existing(self):
+    def test_safe_ensure_directory_existing(self, work_dir):
         """Test safe_ensure_directory with existing directory."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            test_path = Path(temp_dir)
+        test_path = work_dir
 
-            # Should not raise even if directory exists
-            safe_ensure_directory(test_path)
+        # Should not raise even if directory exists
+        safe_ensure_directory(test_path)
 
-            assert test_path.exists()
-            assert test_path.is_dir()
+        assert test_path.exists()
+        assert test_path.is_dir()
 
-    def test_file_wrapper_logging(self, caplog):
+    def test_file_wrapper_logging(self, caplog, work_dir):
         """Test file wrapper functions log operations when enabled."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            test_path = Path(temp_dir) / "test.txt"
+        test_path = work_dir / "test.txt"
 
-            caplog.set_level(logging.DEBUG, logger="autorepro.utils.error_handling")
-            safe_write_file(test_path, "test", log_operations=True)
-            safe_read_file(test_path, log_operations=True)
-
-            assert "Starting write file" in caplog.text
-            assert "Completed write file" in caplog.text
-            assert "Starting read file" in caplog.text
-            assert "Completed read file" in caplog.text
+        caplog.set_level(logging.DEBUG, logger="autorepro.utils.error_handling")
+        safe_write_file(test_path, "test", log_operations=True)
+        safe_read_file(test_path, log_operations=True)
+
+        _assert_all_in_log(
+            caplog,
+            "Starting write file",
+            "Completed write file",
+            "Starting read file",
+            "Completed read file",
+        )
 
 
 class TestErrorHandlingIntegration:
@@ -347,6 +420,7 @@ class TestErrorHandlingIntegration:
         assert "write file failed" in exc_info.value.message
         assert exc_info.value.path == Path("/test/path")
 
+    @pytest.mark.serial
     def test_error_message_consistency(self):
         """Test that error messages follow consistent format."""
         # Test subprocess error format
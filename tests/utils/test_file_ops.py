@@ -5,8 +5,10 @@ These tests validate the file operation utilities that replace duplicate pattern
 across the AutoRepro codebase.
 """
 
+import errno
 import json
-import tempfile
+import math
+import os
 from pathlib import Path
 from unittest.mock import patch
 
@@ -14,31 +16,33 @@ import pytest
 
 from autorepro.utils.file_ops import FileOperations, create_temp_file
 
+# Paths that never exist; read-only, shared by the missing-file tests
+_MISSING_TXT = Path("/nonexistent/file.txt")
+_MISSING_JSON = Path("/nonexistent/file.json")
+
 
 class TestFileOperations:
     """Test FileOperations utility class."""
 
-    def test_ensure_directory_creates_new_directory(self):
+    def test_ensure_directory_creates_new_directory(self, work_dir):
         """Test ensure_directory creates new directory with parents."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            target_path = Path(temp_dir) / "new" / "nested" / "dir"
+        target_path = work_dir / "new" / "nested" / "dir"
 
-            FileOperations.ensure_directory(target_path)
+        FileOperations.ensure_directory(target_path)
 
-            assert target_path.exists()
-            assert target_path.is_dir()
+        assert target_path.exists()
+        assert target_path.is_dir()
 
-    def test_ensure_directory_idempotent_with_existing(self):
+    def test_ensure_directory_idempotent_with_existing(self, work_dir):
         """Test ensure_directory is idempotent with existing directory."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            target_path = Path(temp_dir) / "existing"
-            target_path.mkdir()
+        target_path = work_dir / "existing"
+        target_path.mkdir()
 
-            # Should not raise error
-            FileOperations.ensure_directory(target_path)
+        # Should not raise error
+        FileOperations.ensure_directory(target_path)
 
-            assert target_path.exists()
-            assert target_path.is_dir()
+        assert target_path.exists()
+        assert target_path.is_dir()
 
     @patch("pathlib.Path.mkdir")
     def test_ensure_directory_handles_permission_error(self, mock_mkdir):
@@ -48,235 +52,299 @@ class TestFileOperations:
         with pytest.raises(OSError, match="Cannot create directory"):
             FileOperations.ensure_directory(Path("/fake/path"))
 
-    def test_atomic_write_creates_file_successfully(self):
+    def test_atomic_write_creates_file_successfully(self, work_dir):
         """Test atomic_write creates file with correct content."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            target_path = Path(temp_dir) / "test.txt"
-            content = "Hello, World!\nSecond line."
+        target_path = work_dir / "test.txt"
+        content = "Hello, World!\nSecond line."
 
-            FileOperations.atomic_write(target_path, content)
+        FileOperations.atomic_write(target_path, content)
 
-            assert target_path.exists()
-            assert target_path.read_text(encoding="utf-8") == content
+        assert target_path.exists()
+        assert target_path.read_text(encoding="utf-8") == content
 
-    def test_atomic_write_creates_parent_directories(self):
+    def test_atomic_write_creates_parent_directories(self, work_dir):
         """Test atomic_write creates parent directories if needed."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            target_path = Path(temp_dir) / "nested" / "dir" / "test.txt"
-            content = "Test content"
+        target_path = work_dir / "nested" / "dir" / "test.txt"
+        content = "Test content"
 
-            FileOperations.atomic_write(target_path, content)
+        FileOperations.atomic_write(target_path, content)
 
-            assert target_path.exists()
-            assert target_path.read_text(encoding="utf-8") == content
+        assert target_path.exists()
+        assert target_path.read_text(encoding="utf-8") == content
 
-    def test_atomic_write_overwrites_existing_file(self):
+    def test_atomic_write_overwrites_existing_file(self, work_dir):
         """Test atomic_write overwrites existing file atomically."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            target_path = Path(temp_dir) / "existing.txt"
-            target_path.write_text("Old content", encoding="utf-8")
+        target_path = work_dir / "existing.txt"
+        target_path.write_text("Old content", encoding="utf-8")
 
-            new_content = "New content"
-            FileOperations.atomic_write(target_path, new_content)
+        new_content = "New content"
+        FileOperations.atomic_write(target_path, new_content)
 
-            assert target_path.read_text(encoding="utf-8") == new_content
+        assert target_path.read_text(encoding="utf-8") == new_content
 
-    def test_atomic_write_uses_custom_encoding(self):
+    def test_atomic_write_uses_custom_encoding(self, work_dir):
         """Test atomic_write respects custom encoding parameter."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            target_path = Path(temp_dir) / "utf16.txt"
-            content = "Content with unicode: 你好"
+        target_path = work_dir / "utf16.txt"
+        content = "Content with unicode: 你好"
+
+        FileOperations.atomic_write(target_path, content, encoding="utf-16")
+
+        # Verify file was written with correct encoding
+        assert target_path.read_text(encoding="utf-16") == content
+
+    def test_atomic_write_single_write_call(self, work_dir, monkeypatch):
+        """Test atomic_write hands the whole encoded payload to one write()."""
+        writes = []
+        real_write = os.write
+
+        def recording_write(fd, data):
+            writes.append(len(data))
+            return real_write(fd, data)
+
+        monkeypatch.setattr(os, "write", recording_write)
+        content = "line\n" * 1000
+
+        FileOperations.atomic_write(work_dir / "test.txt", content)
+
+        assert writes == [len(content)]
+
+    def test_atomic_write_completes_short_writes(self, work_dir, monkeypatch):
+        """Test atomic_write keeps writing until a short write is drained."""
+        real_write = os.write
+        monkeypatch.setattr(os, "write", lambda fd, data: real_write(fd, data[:3]))
+        target_path = work_dir / "test.txt"
 
-            FileOperations.atomic_write(target_path, content, encoding="utf-16")
+        FileOperations.atomic_write(target_path, "Hello, World!")
 
-            # Verify file was written with correct encoding
-            assert target_path.read_text(encoding="utf-16") == content
+        assert target_path.read_text(encoding="utf-8") == "Hello, World!"
 
     @patch("autorepro.utils.file_ops.FileOperations.ensure_directory")
-    def test_atomic_write_cleans_up_temp_on_error(self, mock_ensure_dir):
+    def test_atomic_write_cleans_up_temp_on_error(self, mock_ensure_dir, work_dir):
         """Test atomic_write cleans up temp file on write error."""
         mock_ensure_dir.side_effect = OSError("Permission denied")
 
-        with tempfile.TemporaryDirectory() as temp_dir:
-            target_path = Path(temp_dir) / "test.txt"
+        # Missing parent, so atomic_write has to create it
+        target_path = work_dir / "missing" / "test.txt"
+
+        with pytest.raises(OSError, match="Failed to write file"):
+            FileOperations.atomic_write(target_path, "content")
+
+        # Verify no temp files left behind
+        temp_files = list(work_dir.rglob("*.tmp"))
+        assert len(temp_files) == 0
+
+    @patch("autorepro.utils.file_ops.FileOperations.ensure_directory")
+    def test_atomic_write_existing_parent_skips_mkdir(self, mock_ensure_dir, work_dir):
+        """Test atomic_write into an existing directory does not try to create it."""
+        target_path = work_dir / "test.txt"
+
+        FileOperations.atomic_write(target_path, "content")
+
+        assert target_path.read_text(encoding="utf-8") == "content"
+        mock_ensure_dir.assert_not_called()
+
+    def test_batch_atomic_writes_syncs_each_parent_once(self, work_dir):
+        """Test batch_atomic_writes fsyncs every file but each directory once."""
+        items = [
+            (work_dir / "a.log", "log"),
+            (work_dir / "a.jsonl", "{}\n"),
+            (work_dir / "sub" / "b.txt", "nested"),
+        ]
+
+        with patch("os.fsync", wraps=os.fsync) as fsync:
+            FileOperations.batch_atomic_writes(items)
+
+        # One per file, plus one for each of the two parent directories
+        assert fsync.call_count == len(items) + 2
+        for path, content in items:
+            assert path.read_text(encoding="utf-8") == content
 
-            with pytest.raises(OSError, match="Failed to write file"):
-                FileOperations.atomic_write(target_path, "content")
+    def test_batch_atomic_writes_tolerates_unsyncable_directory(self, work_dir):
+        """Test a directory fsync rejected by the filesystem does not fail."""
+        target_path = work_dir / "a.log"
+        unsupported = OSError(errno.EINVAL, "Invalid argument")
 
-            # Verify no temp files left behind
-            temp_files = list(Path(temp_dir).glob("*.tmp"))
-            assert len(temp_files) == 0
+        with patch("autorepro.utils.file_ops._fsync_dir", side_effect=unsupported):
+            FileOperations.batch_atomic_writes([(target_path, "log")])
 
-    def test_safe_read_text_reads_existing_file(self):
+        assert target_path.read_text(encoding="utf-8") == "log"
+
+    def test_safe_read_text_reads_existing_file(self, work_dir):
         """Test safe_read_text reads existing file successfully."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            test_path = Path(temp_dir) / "test.txt"
-            expected_content = "Line 1\nLine 2\nLine 3"
-            test_path.write_text(expected_content, encoding="utf-8")
+        test_path = work_dir / "test.txt"
+        expected_content = "Line 1\nLine 2\nLine 3"
+        test_path.write_text(expected_content, encoding="utf-8")
 
-            content = FileOperations.safe_read_text(test_path)
+        content = FileOperations.safe_read_text(test_path)
 
-            assert content == expected_content
+        assert content == expected_content
 
     def test_safe_read_text_returns_default_on_missing_file(self):
         """Test safe_read_text returns default for missing file."""
-        missing_path = Path("/nonexistent/file.txt")
         default_content = "Default content"
 
-        content = FileOperations.safe_read_text(missing_path, default=default_content)
+        content = FileOperations.safe_read_text(_MISSING_TXT, default=default_content)
 
         assert content == default_content
 
     def test_safe_read_text_raises_on_missing_file_no_default(self):
         """Test safe_read_text raises OSError for missing file when no default."""
-        missing_path = Path("/nonexistent/file.txt")
-
         with pytest.raises(OSError, match="Failed to read file"):
-            FileOperations.safe_read_text(missing_path)
+            FileOperations.safe_read_text(_MISSING_TXT)
 
-    def test_safe_read_text_uses_custom_encoding(self):
+    def test_safe_read_text_uses_custom_encoding(self, work_dir):
         """Test safe_read_text respects custom encoding."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            test_path = Path(temp_dir) / "utf16.txt"
-            content = "Unicode content: 你好"
-            test_path.write_text(content, encoding="utf-16")
+        test_path = work_dir / "utf16.txt"
+        content = "Unicode content: 你好"
+        test_path.write_text(content, encoding="utf-16")
 
-            read_content = FileOperations.safe_read_text(test_path, encoding="utf-16")
+        read_content = FileOperations.safe_read_text(test_path, encoding="utf-16")
 
-            assert read_content == content
+        assert read_content == content
 
-    def test_safe_read_json_reads_valid_json(self):
+    def test_safe_read_json_reads_valid_json(self, work_dir):
         """Test safe_read_json reads valid JSON file."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            json_path = Path(temp_dir) / "test.json"
-            test_data = {"key": "value", "number": 42, "list": [1, 2, 3]}
-            json_path.write_text(json.dumps(test_data), encoding="utf-8")
+        json_path = work_dir / "test.json"
+        test_data = {"key": "value", "number": 42, "list": [1, 2, 3]}
+        json_path.write_text(json.dumps(test_data), encoding="utf-8")
+
+        data = FileOperations.safe_read_json(json_path)
+
+        assert data == test_data
+
+    def test_safe_read_json_keeps_stdlib_semantics(self, work_dir):
+        """Test NaN and integers wider than 64 bits parse as json.loads does."""
+        json_path = work_dir / "test.json"
+        json_path.write_text(
+            '{"a": NaN, "big": 123456789012345678901234567890}', encoding="utf-8"
+        )
 
-            data = FileOperations.safe_read_json(json_path)
+        data = FileOperations.safe_read_json(json_path)
 
-            assert data == test_data
+        assert math.isnan(data["a"])
+        assert data["big"] == 123456789012345678901234567890
 
-    def test_safe_read_json_returns_default_on_invalid_json(self):
+    def test_safe_read_json_missing_file_error_is_oserror(self):
+        """Test a missing file raises OSError."""
+        with pytest.raises(OSError, match="Failed to read file"):
+            FileOperations.safe_read_json(_MISSING_JSON)
+
+    def test_safe_read_json_returns_default_on_invalid_json(self, work_dir):
         """Test safe_read_json returns default for invalid JSON."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            json_path = Path(temp_dir) / "invalid.json"
-            json_path.write_text("{ invalid json", encoding="utf-8")
+        json_path = work_dir / "invalid.json"
+        json_path.write_text("{ invalid json", encoding="utf-8")
 
-            default_data = {"default": True}
-            data = FileOperations.safe_read_json(json_path, default=default_data)
+        default_data = {"default": True}
+        data = FileOperations.safe_read_json(json_path, default=default_data)
 
-            assert data == default_data
+        assert data == default_data
 
     def test_safe_read_json_returns_default_on_missing_file(self):
         """Test safe_read_json returns default for missing file."""
-        missing_path = Path("/nonexistent/file.json")
         default_data = {"missing": True}
 
-        data = FileOperations.safe_read_json(missing_path, default=default_data)
+        data = FileOperations.safe_read_json(_MISSING_JSON, default=default_data)
 
         assert data == default_data
 
     def test_safe_read_json_raises_on_error_no_default(self):
         """Test safe_read_json raises error when no default provided."""
-        missing_path = Path("/nonexistent/file.json")
-
         with pytest.raises(OSError):
-            FileOperations.safe_read_json(missing_path)
+            FileOperations.safe_read_json(_MISSING_JSON)
 
-    def test_atomic_write_json_writes_formatted_json(self):
+    def test_atomic_write_json_writes_formatted_json(self, work_dir):
         """Test atomic_write_json writes properly formatted JSON."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            json_path = Path(temp_dir) / "output.json"
-            test_data = {"b_key": "value", "a_key": 42}
+        json_path = work_dir / "output.json"
+        test_data = {"b_key": "value", "a_key": 42}
 
-            FileOperations.atomic_write_json(json_path, test_data)
+        FileOperations.atomic_write_json(json_path, test_data)
 
-            content = json_path.read_text(encoding="utf-8")
+        content = json_path.read_text(encoding="utf-8")
 
-            # Verify formatting (indented, sorted keys, trailing newline)
-            assert content.endswith("\n")
-            assert '"a_key"' in content
-            assert '"b_key"' in content
-            # Verify it's valid JSON
-            parsed = json.loads(content)
-            assert parsed == test_data
+        # Verify formatting (indented, sorted keys, trailing newline)
+        assert content == '{\n  "a_key": 42,\n  "b_key": "value"\n}\n'
+        assert content.endswith("\n")
+        assert '"a_key"' in content
+        assert '"b_key"' in content
+        # Verify it's valid JSON
+        parsed = json.loads(content)
+        assert parsed == test_data
 
-    def test_atomic_write_json_custom_formatting(self):
+    def test_atomic_write_json_custom_formatting(self, work_dir):
         """Test atomic_write_json respects custom formatting parameters."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            json_path = Path(temp_dir) / "custom.json"
-            test_data = {"key": "value"}
+        json_path = work_dir / "custom.json"
+        test_data = {"key": "value"}
 
-            FileOperations.atomic_write_json(
-                json_path, test_data, indent=4, sort_keys=False, ensure_ascii=True
-            )
+        FileOperations.atomic_write_json(
+            json_path, test_data, indent=4, sort_keys=False, ensure_ascii=True
+        )
 
-            content = json_path.read_text(encoding="utf-8")
-            parsed = json.loads(content)
-            assert parsed == test_data
+        content = json_path.read_text(encoding="utf-8")
+        parsed = json.loads(content)
+        assert parsed == test_data
 
-    def test_atomic_write_json_handles_serialization_error(self):
+    def test_atomic_write_json_handles_serialization_error(self, work_dir):
         """Test atomic_write_json raises OSError on serialization failure."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            json_path = Path(temp_dir) / "error.json"
-            # Object that can't be JSON serialized
-            unserializable_data = {"func": lambda x: x}
+        json_path = work_dir / "error.json"
+        # Object that can't be JSON serialized
+        unserializable_data = {"func": lambda x: x}
 
-            with pytest.raises(OSError, match="Failed to serialize JSON data"):
-                FileOperations.atomic_write_json(json_path, unserializable_data)
+        with pytest.raises(OSError, match="Failed to serialize JSON data"):
+            FileOperations.atomic_write_json(json_path, unserializable_data)
 
 
 class TestCreateTempFile:
     """Test create_temp_file utility function."""
 
-    def test_create_temp_file_with_content(self):
+    # Files go in work_dir, so pytest reaps them; no per-test unlink needed
+
+    def test_create_temp_file_with_content(self, work_dir):
         """Test create_temp_file creates file with correct content."""
         content = "Temporary file content\nMultiple lines"
 
-        temp_path = create_temp_file(content)
+        temp_path = create_temp_file(content, dir=work_dir)
 
-        try:
-            assert temp_path.exists()
-            assert temp_path.read_text(encoding="utf-8") == content
-        finally:
-            # Cleanup
-            if temp_path.exists():
-                temp_path.unlink()
+        assert temp_path.parent == work_dir
+        assert temp_path.read_text(encoding="utf-8") == content
 
-    def test_create_temp_file_with_suffix(self):
+    def test_create_temp_file_with_suffix(self, work_dir):
         """Test create_temp_file creates file with correct suffix."""
         content = "JSON content"
         suffix = ".json"
 
-        temp_path = create_temp_file(content, suffix=suffix)
+        temp_path = create_temp_file(content, suffix=suffix, dir=work_dir)
 
-        try:
-            assert temp_path.exists()
-            assert str(temp_path).endswith(suffix)
-            assert temp_path.read_text(encoding="utf-8") == content
-        finally:
-            # Cleanup
-            if temp_path.exists():
-                temp_path.unlink()
+        assert temp_path.exists()
+        assert str(temp_path).endswith(suffix)
+        assert temp_path.read_text(encoding="utf-8") == content
 
-    def test_create_temp_file_with_custom_encoding(self):
+    def test_create_temp_file_with_custom_encoding(self, work_dir):
         """Test create_temp_file respects custom encoding."""
         content = "Unicode: 你好"
 
-        temp_path = create_temp_file(content, encoding="utf-16")
+        temp_path = create_temp_file(content, encoding="utf-16", dir=work_dir)
+
+        assert temp_path.exists()
+        assert temp_path.read_text(encoding="utf-16") == content
+
+    def test_create_temp_file_removed_on_write_error(self, work_dir, monkeypatch):
+        """Test create_temp_file does not leave a partial file behind."""
+
+        def failing_write(fd, data):
+            raise OSError("No space left on device")
+
+        monkeypatch.setattr(os, "write", failing_write)
+
+        with pytest.raises(OSError, match="No space left"):
+            create_temp_file("content", dir=work_dir)
 
-        try:
-            assert temp_path.exists()
-            assert temp_path.read_text(encoding="utf-16") == content
-        finally:
-            # Cleanup
-            if temp_path.exists():
-                temp_path.unlink()
+        assert list(work_dir.iterdir()) == []
 
     def test_create_temp_file_caller_responsible_for_cleanup(self):
         """Test create_temp_file doesn't auto-delete (caller responsible)."""
         content = "Persistent temp content"
 
+        # Default dir, as production callers use it
         temp_path = create_temp_file(content)
 
         # File should still exist after function returns
@@ -5,9 +5,13 @@ These tests validate the process execution utilities that replace duplicate subp
 patterns found across the AutoRepro codebase.
 """
 
+import dataclasses
+import os
 import subprocess
 from pathlib import Path
-from unittest.mock import MagicMock, patch
+from unittest.mock import patch
+
+import pytest
 
 from autorepro.utils.process import (
     ProcessResult,
@@ -17,6 +21,15 @@ from autorepro.utils.process import (
 )
 
 
+@dataclasses.dataclass(slots=True)
+class _Completed:
+    """The CompletedProcess fields ProcessRunner reads; stands in for MagicMock."""
+
+    returncode: int = 0
+    stdout: str | bytes = ""
+    stderr: str | bytes = ""
+
+
 class TestProcessResult:
     """Test ProcessResult data class."""
 
@@ -31,6 +44,11 @@ class TestProcessResult:
         assert result.stderr == "error"
         assert result.cmd == ["echo", "hello"]
 
+    def test_process_result_has_no_instance_dict(self):
+        """Test ProcessResult stores its fields in slots."""
+        result = ProcessResult(0, "", "", ["cmd"])
+        assert not hasattr(result, "__dict__")
+
     def test_success_property_true_for_zero_exit(self):
         """Test success property returns True for exit code 0."""
         result = ProcessResult(0, "", "", ["cmd"])
@@ -47,17 +65,27 @@ class TestProcessResult:
         assert result.cmd_str == "git status --porcelain"
 
 
+class TestSubprocessConfig:
+    """Test SubprocessConfig data class."""
+
+    def test_config_is_immutable(self):
+        """Test SubprocessConfig is frozen and slotted."""
+        config = SubprocessConfig(cmd=["echo"])
+
+        assert not hasattr(config, "__dict__")
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            config.cmd = ["other"]
+
+
 class TestProcessRunner:
     """Test ProcessRunner utility class."""
 
     @patch("subprocess.run")
     def test_run_with_capture_successful_command(self, mock_run):
         """Test run_with_capture handles successful command execution."""
-        mock_completed = MagicMock()
-        mock_completed.returncode = 0
-        mock_completed.stdout = "success output"
-        mock_completed.stderr = ""
-        mock_run.return_value = mock_completed
+        mock_run.return_value = _Completed(
+            returncode=0, stdout="success output", stderr=""
+        )
 
         result = ProcessRunner.run_with_capture(["echo", "hello"])
 
@@ -70,11 +98,9 @@ class TestProcessRunner:
     @patch("subprocess.run")
     def test_run_with_capture_failed_command(self, mock_run):
         """Test run_with_capture handles failed command execution."""
-        mock_completed = MagicMock()
-        mock_completed.returncode = 1
-        mock_completed.stdout = ""
-        mock_completed.stderr = "error output"
-        mock_run.return_value = mock_completed
+        mock_run.return_value = _Completed(
+            returncode=1, stdout="", stderr="error output"
+        )
 
         result = ProcessRunner.run_with_capture(["false"])
 
@@ -83,6 +109,31 @@ class TestProcessRunner:
         assert result.stdout == ""
         assert result.stderr == "error output"
 
+    @patch("subprocess.run")
+    def test_run_with_capture_decodes_bytes_output(self, mock_run):
+        """Test run_with_capture decodes captured bytes like text mode did."""
+        mock_run.return_value = _Completed(
+            returncode=0, stdout="caf\u00e9\r\nnext\n".encode(), stderr=b"bad \xff byte"
+        )
+
+        result = ProcessRunner.run_with_capture(["cmd"])
+
+        assert result.stdout == "caf\u00e9\nnext\n"
+        assert result.stderr == "bad \ufffd byte"
+
+    @patch("subprocess.run")
+    def test_run_with_capture_check_error_output_is_text(self, mock_run):
+        """Test CalledProcessError from check=True carries decoded output."""
+        mock_run.side_effect = subprocess.CalledProcessError(
+            1, ["false"], output=b"out\n", stderr=b"err\n"
+        )
+
+        with pytest.raises(subprocess.CalledProcessError) as exc_info:
+            ProcessRunner.run_with_capture(["false"], check=True)
+
+        assert exc_info.value.stdout == "out\n"
+        assert exc_info.value.stderr == "err\n"
+
     @patch("subprocess.run")
     def test_run_with_capture_timeout_handling(self, mock_run):
         """Test run_with_capture handles timeout correctly."""
@@ -122,11 +173,7 @@ class TestProcessRunner:
     def test_run_with_capture_string_command_conversion(self):
         """Test run_with_capture converts string commands to list."""
         with patch("subprocess.run") as mock_run:
-            mock_completed = MagicMock()
-            mock_completed.returncode = 0
-            mock_completed.stdout = "output"
-            mock_completed.stderr = ""
-            mock_run.return_value = mock_completed
+            mock_run.return_value = _Completed(returncode=0, stdout="output", stderr="")
 
             ProcessRunner.run_with_capture("echo hello world")
 
@@ -138,11 +185,7 @@ class TestProcessRunner:
     @patch("subprocess.run")
     def test_run_with_capture_passes_parameters_correctly(self, mock_run):
         """Test run_with_capture passes all parameters to subprocess.run."""
-        mock_completed = MagicMock()
-        mock_completed.returncode = 0
-        mock_completed.stdout = ""
-        mock_completed.stderr = ""
-        mock_run.return_value = mock_completed
+        mock_run.return_value = _Completed(returncode=0, stdout="", stderr="")
 
         env_vars = {"TEST_VAR": "test_value"}
         cwd_path = Path("/test/dir")
@@ -153,64 +196,70 @@ class TestProcessRunner:
 
         mock_run.assert_called_once()
         args, kwargs = mock_run.call_args
-        assert kwargs["cwd"] == str(cwd_path)
+        assert kwargs["cwd"] == os.fspath(cwd_path)
+        # env is forwarded as the same object, not a copy
+        assert kwargs["env"] is env_vars
         assert kwargs["env"] == env_vars
         assert kwargs["timeout"] == 30
         assert kwargs["check"] is True
         assert kwargs["capture_output"] is True
-        assert kwargs["text"] is True
-
-    @patch("autorepro.utils.process.ProcessRunner.run_with_capture")
-    def test_run_git_command_prepends_git(self, mock_run_with_capture):
-        """Test run_git_command prepends 'git' to command."""
-        mock_run_with_capture.return_value = ProcessResult(0, "", "", ["git", "status"])
-
-        ProcessRunner.run_git_command(["status", "--porcelain"])
-
-        mock_run_with_capture.assert_called_once_with(
-            ["git", "status", "--porcelain"], cwd=None, check=True
-        )
-
-    @patch("autorepro.utils.process.ProcessRunner.run_with_capture")
-    def test_run_git_command_passes_parameters(self, mock_run_with_capture):
-        """Test run_git_command passes cwd and check parameters."""
-        mock_run_with_capture.return_value = ProcessResult(0, "", "", ["git", "log"])
-        cwd_path = Path("/repo")
-
-        ProcessRunner.run_git_command(["log", "--oneline"], cwd=cwd_path, check=False)
-
-        mock_run_with_capture.assert_called_once_with(
-            ["git", "log", "--oneline"], cwd=cwd_path, check=False
-        )
-
-    @patch("autorepro.utils.process.ProcessRunner.run_with_capture")
-    def test_run_gh_command_uses_custom_gh_path(self, mock_run_with_capture):
-        """Test run_gh_command uses custom gh executable path."""
-        mock_run_with_capture.return_value = ProcessResult(
-            0, "", "", ["custom-gh", "pr", "list"]
-        )
-
-        ProcessRunner.run_gh_command(["pr", "list"], gh_path="custom-gh")
-
-        mock_run_with_capture.assert_called_once_with(
-            ["custom-gh", "pr", "list"], cwd=None, check=True
-        )
-
-    @patch("autorepro.utils.process.ProcessRunner.run_with_capture")
-    def test_run_python_command_uses_custom_executable(self, mock_run_with_capture):
-        """Test run_python_command uses custom Python executable."""
-        mock_run_with_capture.return_value = ProcessResult(
-            0, "", "", ["python3.9", "-c", "print('hello')"]
-        )
-
-        ProcessRunner.run_python_command(
-            ["-c", "print('hello')"], python_executable="python3.9"
-        )
-
-        mock_run_with_capture.assert_called_once_with(
-            ["python3.9", "-c", "print('hello')"], cwd=None, env=None, timeout=None
-        )
-
+        # Output is captured as bytes and decoded once by run_with_capture
+        assert "text" not in kwargs
+
+    @pytest.fixture
+    def run_with_capture(self):
+        """Patch ProcessRunner.run_with_capture for the command-helper tests."""
+        with patch.object(ProcessRunner, "run_with_capture") as mock:
+            mock.return_value = ProcessResult(0, "", "", ["cmd"])
+            yield mock
+
+    @pytest.mark.parametrize(
+        "method,tool,helper_args,helper_kwargs,forwarded",
+        [
+            pytest.param(
+                "run_git_command",
+                "git",
+                ["status", "--porcelain"],
+                {},
+                {"cwd": None, "check": True},
+                id="git",
+            ),
+            pytest.param(
+                "run_git_command",
+                "git",
+                ["log", "--oneline"],
+                {"cwd": Path("/repo"), "check": False},
+                {"cwd": Path("/repo"), "check": False},
+                id="git_parameters",
+            ),
+            pytest.param(
+                "run_gh_command",
+                "custom-gh",
+                ["pr", "list"],
+                {"gh_path": "custom-gh"},
+                {"cwd": None, "check": True},
+                id="gh_custom_path",
+            ),
+            pytest.param(
+                "run_python_command",
+                "python3.9",
+                ["-c", "print('hello')"],
+                {"python_executable": "python3.9"},
+                {"cwd": None, "env": None, "timeout": None},
+                id="python_custom_executable",
+            ),
+        ],
+    )
+    def test_command_helpers_prepend_tool(  # noqa: PLR0913
+        self, run_with_capture, method, tool, helper_args, helper_kwargs, forwarded
+    ):
+        """Test git/gh/python helpers prepend the tool and forward parameters."""
+        getattr(ProcessRunner, method)(helper_args, **helper_kwargs)
+
+        run_with_capture.assert_called_once_with([tool, *helper_args], **forwarded)
+
+    @pytest.mark.slow
+    @pytest.mark.serial
     def test_run_with_capture_integration_real_command(self):
         """Integration test with real command execution."""
         # Use a simple, cross-platform command
@@ -228,8 +277,7 @@ class TestSafeSubprocessRun:
     @patch("subprocess.run")
     def test_safe_subprocess_run_forwards_parameters(self, mock_run):
         """Test safe_subprocess_run forwards all parameters correctly."""
-        mock_completed = MagicMock()
-        mock_run.return_value = mock_completed
+        mock_run.return_value = _Completed()
 
         env_vars = {"TEST": "value"}
         cwd_path = Path("/test")
@@ -247,7 +295,7 @@ class TestSafeSubprocessRun:
 
         mock_run.assert_called_once_with(
             ["test-cmd", "arg"],
-            cwd=str(cwd_path),
+            cwd=os.fspath(cwd_path),
             env=env_vars,
             timeout=60,
             capture_output=False,
@@ -258,7 +306,7 @@ class TestSafeSubprocessRun:
     def test_safe_subprocess_run_string_command_conversion(self):
         """Test safe_subprocess_run converts string commands to list."""
         with patch("subprocess.run") as mock_run:
-            mock_run.return_value = MagicMock()
+            mock_run.return_value = _Completed()
 
             config = SubprocessConfig(cmd="echo hello world")
             safe_subprocess_run(config)
@@ -266,6 +314,8 @@ class TestSafeSubprocessRun:
             args, kwargs = mock_run.call_args
             assert args[0] == ["echo", "hello", "world"]
 
+    @pytest.mark.slow
+    @pytest.mark.serial
     def test_safe_subprocess_run_integration_real_command(self):
         """Integration test with real command execution."""
         config = SubprocessConfig(
@@ -5,52 +5,220 @@ Performance benchmarking script for AutoRepro CLI commands.
 Ensures refactoring improvements don't negatively impact performance.
 """
 
+import argparse
+import gc
+import io
 import json
+import os
 import statistics
 import subprocess
 import sys
+import tempfile
 import time
+from array import array
+from collections import Counter
+from collections.abc import Callable
+from concurrent.futures import Executor, ProcessPoolExecutor
+from contextlib import nullcontext, redirect_stderr, redirect_stdout
+from functools import lru_cache, partial
+from multiprocessing.util import Finalize
 from pathlib import Path
+from typing import IO
 
+from autorepro.cli import main as cli_main
 
-def run_command_with_timing(cmd: list[str], iterations: int = 10) -> dict[str, float]:
+try:
+    import orjson
+except ImportError:  # Optional: faster encoding in save_benchmark_results
+    orjson = None
+
+BASELINE_DIR = Path(__file__).resolve().parent
+REPO_ROOT = BASELINE_DIR.parents[1]
+# An absolute interpreter path (with close_fds=False and no cwd) lets subprocess
+# start the child with posix_spawn instead of fork+exec
+CLI_PREFIX = [sys.executable, "-m", "autorepro"]
+
+
+def _run_inprocess(argv: list[str]) -> None:
+    """Run the CLI in this interpreter, raising CalledProcessError on failure."""
+    buf = io.StringIO()
+    with redirect_stdout(buf), redirect_stderr(buf):
+        exit_code = cli_main(argv)
+    if exit_code != 0:
+        raise subprocess.CalledProcessError(
+            exit_code, [*CLI_PREFIX, *argv], stderr=buf.getvalue()
+        )
+
+
+def _run_subprocess(argv: list[str]) -> None:
+    """
+    Run the CLI in a fresh interpreter, paying its full startup cost.
+
+    The child inherits the working directory, which main() sets to REPO_ROOT.
+    """
+    # Only stderr is read (for failure reports), so stdout skips the pipe
+    subprocess.run(
+        [*CLI_PREFIX, *argv],
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.PIPE,
+        text=True,
+        check=True,
+        close_fds=False,
+    )
+
+
+@lru_cache(maxsize=1)
+def _repl_helper() -> tuple[subprocess.Popen, IO[bytes]]:
+    """
+    Start this process's long-lived helper interpreter (see --repl-bench).
+
+    Returns the helper and the temporary file collecting its stderr; a file
+    rather than a pipe, so an unread stream can never fill up and stall it.
+    """
+    stderr_log = tempfile.TemporaryFile()
+    helper = subprocess.Popen(
+        [sys.executable, __file__, "--repl-bench"],
+        stdin=subprocess.PIPE,
+        stdout=subprocess.PIPE,
+        stderr=stderr_log,
+        text=True,
+        cwd=REPO_ROOT,
+    )
+    # Unlike atexit, multiprocessing finalizers also run when a pool worker exits
+    Finalize(None, _close_repl_helper, exitpriority=0)
+    return helper, stderr_log
+
+
+def _close_repl_helper() -> None:
+    """Shut down this process's helper, if any: EOF ends its loop, then reap it."""
+    if _repl_helper.cache_info().currsize == 0:
+        return
+    helper, stderr_log = _repl_helper()
+    _repl_helper.cache_clear()
+    helper.stdin.close()
+    helper.wait()
+    stderr_log.close()
+
+
+def _run_persistent(argv: list[str]) -> None:
+    """Run the CLI in a warm helper interpreter, so only pipe I/O is added."""
+    helper, stderr_log = _repl_helper()
+    try:
+        helper.stdin.write(json.dumps(argv) + "\n")
+        helper.stdin.flush()
+        line = helper.stdout.readline()
+    except BrokenPipeError:
+        line = ""
+    if not line:
+        # The helper died; report its exit status and whatever it wrote
+        _repl_helper.cache_clear()
+        exit_code = helper.wait()
+        stderr_log.seek(0)
+        stderr = stderr_log.read().decode(errors="replace")
+        stderr_log.close()
+        raise subprocess.CalledProcessError(exit_code, helper.args, stderr=stderr)
+    exit_code, output = json.loads(line)
+    if exit_code != 0:
+        raise subprocess.CalledProcessError(
+            exit_code, [*CLI_PREFIX, *argv], stderr=output
+        )
+
+
+def _serve_repl_bench() -> None:
+    """Answer JSON argument lists on stdin with [exit_code, output] lines."""
+    for line in sys.stdin:
+        try:
+            _run_inprocess(json.loads(line))
+            reply = [0, ""]
+        except subprocess.CalledProcessError as e:
+            reply = [e.returncode, e.stderr]
+        print(json.dumps(reply), flush=True)
+
+
+# (runner, argv) pairs this process has already warmed up; each pool worker
+# has its own copy, so every worker warms every command it is handed
+_warmed: set[tuple[Callable[[list[str]], None], tuple[str, ...]]] = set()
+
+
+def _time_once(
+    argv: list[str], run: Callable[[list[str]], None], warmup: int = 0
+) -> int:
+    """
+    Run the CLI once and return its wall-clock duration in nanoseconds.
+
+    The first time this process sees ``argv``, it is first run ``warmup``
+    times untimed.
+    """
+    key = (run, tuple(argv))
+    if key not in _warmed:
+        for _ in range(warmup):
+            run(argv)
+        _warmed.add(key)
+    # Settle garbage from earlier runs now, so no collection lands in the sample
+    gc.collect()
+    gc.disable()
+    try:
+        start_ns = time.perf_counter_ns()
+        run(argv)
+        return time.perf_counter_ns() - start_ns
+    finally:
+        gc.enable()
+
+
+def run_command_with_timing(
+    cmd: list[str],
+    iterations: int = 10,
+    executor: Executor | None = None,
+    run: Callable[[list[str]], None] = _run_inprocess,
+    warmup: int = 2,
+) -> dict[str, float]:
     """
     Run a command multiple times and collect timing statistics.
 
+    Each process that times the command (this one, or every pool worker that
+    receives it) first runs it ``warmup`` times untimed, so cold page-cache
+    reads, parser construction and first-use imports do not skew the
+    samples; reported figures cover only the ``iterations`` timed runs.
+
     Args:
-        cmd: Command to execute as list of strings
+        cmd: CLI arguments to pass to autorepro, without the program name
         iterations: Number of iterations to run
+        executor: Optional executor to run the iterations concurrently; they
+            run one after another in this process when omitted
+        run: How to invoke the CLI; in-process by default so the timings
+            reflect the command itself rather than interpreter startup
+        warmup: Number of untimed runs per process before timing starts
 
     Returns:
         Dictionary with timing statistics
     """
-    times = []
-
-    for i in range(iterations):
-        start_time = time.perf_counter()
-        try:
-            subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                check=True,
-                cwd=Path(__file__).parent.parent.parent,
-            )
-            end_time = time.perf_counter()
-            times.append(end_time - start_time)
-        except subprocess.CalledProcessError as e:
-            print(f"❌ Command failed on iteration {i + 1}: {' '.join(cmd)}")
-            print(f"Exit code: {e.returncode}")
-            print(f"Stderr: {e.stderr}")
-            raise
-
+    runner = map if executor is None else executor.map
+    # Unboxed 64-bit samples, sized up front and filled by index
+    times_ns = array("q", [0]) * iterations
+    completed = 0
+
+    try:
+        time_once = partial(_time_once, run=run, warmup=warmup)
+        for elapsed_ns in runner(time_once, [cmd] * iterations):
+            times_ns[completed] = elapsed_ns
+            completed += 1
+    except subprocess.CalledProcessError as e:
+        print(f"❌ Command failed on iteration {completed + 1}: {' '.join(cmd)}")
+        print(f"Exit code: {e.returncode}")
+        print(f"Stderr: {e.stderr}")
+        raise
+
+    # Exact integer samples; converted to seconds only for the reported figures
+    median_ns = statistics.median(times_ns)
     return {
-        "mean": statistics.mean(times),
-        "median": statistics.median(times),
-        "min": min(times),
-        "max": max(times),
-        "stdev": statistics.stdev(times) if len(times) > 1 else 0.0,
-        "times": times,
+        "mean": statistics.mean(times_ns) * 1e-9,
+        "median": median_ns * 1e-9,
+        "min": min(times_ns) * 1e-9,
+        "max": max(times_ns) * 1e-9,
+        "stdev": statistics.stdev(times_ns) * 1e-9 if len(times_ns) > 1 else 0.0,
+        # Median absolute deviation: a spread that a single outlier cannot inflate
+        "mad": statistics.median(abs(t - median_ns) for t in times_ns) * 1e-9,
+        "times": [t * 1e-9 for t in times_ns],
     }
 
 
@@ -66,33 +234,38 @@ def format_stats(stats: dict[str, float], command_name: str) -> str:
     )
 
 
-def benchmark_scan_commands() -> dict[str, dict[str, float]]:
+def benchmark_scan_commands(
+    executor: Executor | None = None,
+    run: Callable[[list[str]], None] = _run_inprocess,
+) -> dict[str, dict[str, float]]:
     """Benchmark scan command variants."""
     print("📊 Benchmarking scan commands...")
 
     commands = {
-        "scan_default": ["python", "-m", "autorepro", "scan"],
-        "scan_json": ["python", "-m", "autorepro", "scan", "--json"],
-        "scan_quiet": ["python", "-m", "autorepro", "scan", "--quiet"],
+        "scan_default": ["scan"],
+        "scan_json": ["scan", "--json"],
+        "scan_quiet": ["scan", "--quiet"],
     }
 
     results = {}
     for name, cmd in commands.items():
         print(f"  Running {name}...")
-        results[name] = run_command_with_timing(cmd, iterations=15)
+        results[name] = run_command_with_timing(
+            cmd, iterations=15, executor=executor, run=run
+        )
 
     return results
 
 
-def benchmark_plan_commands() -> dict[str, dict[str, float]]:
+def benchmark_plan_commands(
+    executor: Executor | None = None,
+    run: Callable[[list[str]], None] = _run_inprocess,
+) -> dict[str, dict[str, float]]:
     """Benchmark plan command variants."""
     print("📊 Benchmarking plan commands...")
 
     commands = {
         "plan_simple": [
-            "python",
-            "-m",
-            "autorepro",
             "plan",
             "--desc",
             "test issue",
@@ -100,9 +273,6 @@ def benchmark_plan_commands() -> dict[str, dict[str, float]]:
             "-",
         ],
         "plan_complex": [
-            "python",
-            "-m",
-            "autorepro",
             "plan",
             "--desc",
             "pytest failing with npm test errors in CI environment",
@@ -110,9 +280,6 @@ def benchmark_plan_commands() -> dict[str, dict[str, float]]:
             "-",
         ],
         "plan_json": [
-            "python",
-            "-m",
-            "autorepro",
             "plan",
             "--desc",
             "jest tests failing",
@@ -122,9 +289,6 @@ def benchmark_plan_commands() -> dict[str, dict[str, float]]:
             "-",
         ],
         "plan_with_keywords": [
-            "python",
-            "-m",
-            "autorepro",
             "plan",
             "--desc",
             "python pytest unittest tox poetry failing",
@@ -136,46 +300,50 @@ def benchmark_plan_commands() -> dict[str, dict[str, float]]:
     results = {}
     for name, cmd in commands.items():
         print(f"  Running {name}...")
-        results[name] = run_command_with_timing(cmd, iterations=12)
+        results[name] = run_command_with_timing(
+            cmd, iterations=12, executor=executor, run=run
+        )
 
     return results
 
 
-def benchmark_init_commands() -> dict[str, dict[str, float]]:
+def benchmark_init_commands(
+    executor: Executor | None = None,
+    run: Callable[[list[str]], None] = _run_inprocess,
+) -> dict[str, dict[str, float]]:
     """Benchmark init command variants."""
     print("📊 Benchmarking init commands...")
 
     commands = {
-        "init_dry_run": ["python", "-m", "autorepro", "init", "--dry-run"],
-        "init_with_out": ["python", "-m", "autorepro", "init", "--out", "-"],
+        "init_dry_run": ["init", "--dry-run"],
+        "init_with_out": ["init", "--out", "-"],
     }
 
     results = {}
     for name, cmd in commands.items():
         print(f"  Running {name}...")
-        results[name] = run_command_with_timing(cmd, iterations=15)
+        results[name] = run_command_with_timing(
+            cmd, iterations=15, executor=executor, run=run
+        )
 
     return results
 
 
-def benchmark_exec_commands() -> dict[str, dict[str, float]]:
+def benchmark_exec_commands(
+    executor: Executor | None = None,
+    run: Callable[[list[str]], None] = _run_inprocess,
+) -> dict[str, dict[str, float]]:
     """Benchmark exec command variants."""
     print("📊 Benchmarking exec commands...")
 
     commands = {
         "exec_dry_run": [
-            "python",
-            "-m",
-            "autorepro",
             "exec",
             "--desc",
             "pytest failing",
             "--dry-run",
         ],
         "exec_index": [
-            "python",
-            "-m",
-            "autorepro",
             "exec",
             "--desc",
             "npm test",
@@ -188,35 +356,59 @@ def benchmark_exec_commands() -> dict[str, dict[str, float]]:
     results = {}
     for name, cmd in commands.items():
         print(f"  Running {name}...")
-        results[name] = run_command_with_timing(cmd, iterations=10)
+        results[name] = run_command_with_timing(
+            cmd, iterations=10, executor=executor, run=run
+        )
 
     return results
 
 
-def benchmark_help_commands() -> dict[str, dict[str, float]]:
+def benchmark_help_commands(
+    executor: Executor | None = None,
+    run: Callable[[list[str]], None] = _run_inprocess,
+) -> dict[str, dict[str, float]]:
     """Benchmark help command variants."""
     print("📊 Benchmarking help commands...")
 
     commands = {
-        "help_main": ["python", "-m", "autorepro", "--help"],
-        "help_plan": ["python", "-m", "autorepro", "plan", "--help"],
-        "version": ["python", "-m", "autorepro", "--version"],
+        "help_main": ["--help"],
+        "help_plan": ["plan", "--help"],
+        "version": ["--version"],
     }
 
     results = {}
     for name, cmd in commands.items():
         print(f"  Running {name}...")
-        results[name] = run_command_with_timing(cmd, iterations=20)
+        results[name] = run_command_with_timing(
+            cmd, iterations=20, executor=executor, run=run
+        )
 
     return results
 
 
+# Without baselines, use absolute thresholds: (exclusive lower bound, status),
+# slowest first
+ABSOLUTE_THRESHOLDS = ((0.5, "⚠️  SLOW (>0.5s)"), (0.2, "⚡ MODERATE"))
+
+
+def _absolute_status(median_time: float) -> str:
+    """Classify a median time against ABSOLUTE_THRESHOLDS."""
+    for lower_bound, status in ABSOLUTE_THRESHOLDS:
+        if median_time > lower_bound:
+            return status
+    return "✅ GOOD"
+
+
 def analyze_performance_regression(
     results: dict[str, dict[str, float]], baseline_times: dict[str, float] = None
 ) -> dict[str, str]:
     """
     Analyze results for performance regression.
 
+    Commands are judged by their median, and a slowdown only counts as a
+    regression when it also exceeds three median absolute deviations, so a
+    single GC pause or scheduling hiccup does not fail the run.
+
     Args:
         results: Current benchmark results
         baseline_times: Optional baseline times to compare against
@@ -224,30 +416,30 @@ def analyze_performance_regression(
     Returns:
         Analysis results with status for each command
     """
+    if not baseline_times:
+        return {
+            command_name: _absolute_status(stats["median"])
+            for command_name, stats in results.items()
+        }
+
     analysis = {}
 
     for command_name, stats in results.items():
-        mean_time = stats["mean"]
+        median_time = stats["median"]
 
-        # Performance thresholds
-        status = "✅ GOOD"
-
-        if baseline_times and command_name in baseline_times:
+        if command_name in baseline_times:
             baseline = baseline_times[command_name]
-            change_pct = ((mean_time - baseline) / baseline) * 100
+            change_pct = ((median_time - baseline) / baseline) * 100
+            beyond_noise = abs(median_time - baseline) > 3 * stats["mad"]
 
-            if change_pct > 10:
+            if change_pct > 10 and beyond_noise:
                 status = f"❌ SLOWER ({change_pct:+.1f}%)"
             elif change_pct < -5:
                 status = f"🚀 FASTER ({change_pct:+.1f}%)"
             else:
                 status = f"✅ STABLE ({change_pct:+.1f}%)"
         else:
-            # Without baselines, use absolute thresholds
-            if mean_time > 0.5:
-                status = "⚠️  SLOW (>0.5s)"
-            elif mean_time > 0.2:
-                status = "⚡ MODERATE"
+            status = _absolute_status(median_time)
 
         analysis[command_name] = status
 
@@ -256,7 +448,7 @@ def analyze_performance_regression(
 
 def save_benchmark_results(results: dict[str, dict[str, dict[str, float]]]) -> None:
     """Save benchmark results to JSON file for future comparisons."""
-    output_file = Path(__file__).parent / "benchmark_results.json"
+    output_file = BASELINE_DIR / "benchmark_results.json"
 
     # Prepare results for JSON serialization
     json_results = {}
@@ -270,37 +462,117 @@ def save_benchmark_results(results: dict[str, dict[str, dict[str, float]]]) -> N
                 "min": stats["min"],
                 "max": stats["max"],
                 "stdev": stats["stdev"],
+                "mad": stats["mad"],
             }
 
-    with open(output_file, "w") as f:
-        json.dump(json_results, f, indent=2)
+    # orjson's OPT_INDENT_2 output has the same layout as json.dump(indent=2)
+    if orjson is not None:
+        output_file.write_bytes(orjson.dumps(json_results, option=orjson.OPT_INDENT_2))
+    else:
+        with open(output_file, "w") as f:
+            json.dump(json_results, f, indent=2)
 
     print(f"💾 Benchmark results saved to: {output_file}")
 
 
-def main():
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    """Parse benchmark command-line options."""
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument(
+        "--serial",
+        action="store_true",
+        help="run iterations one at a time, pinned to one CPU, for accurate "
+        "absolute timings (default: run them in parallel, which suits relative "
+        "comparisons)",
+    )
+    mode = parser.add_mutually_exclusive_group()
+    mode.add_argument(
+        "--subprocess",
+        action="store_true",
+        help="spawn 'python -m autorepro' per iteration to include interpreter "
+        "startup (default: call the CLI in-process)",
+    )
+    mode.add_argument(
+        "--persistent",
+        action="store_true",
+        help="send each iteration to a long-lived helper interpreter, isolating "
+        "runs from this process without paying startup every time",
+    )
+    # Internal: the helper mode behind --persistent
+    parser.add_argument("--repl-bench", action="store_true", help=argparse.SUPPRESS)
+    return parser.parse_args(argv)
+
+
+def _select_runner(args: argparse.Namespace) -> Callable[[list[str]], None]:
+    """Return how each benchmark iteration should invoke the CLI."""
+    # Every mode runs the commands from the repository root
+    os.chdir(REPO_ROOT)
+    if args.subprocess:
+        return _run_subprocess
+    if args.persistent:
+        return _run_persistent
+    return _run_inprocess
+
+
+def _pin_to_benchmark_cpu() -> None:
+    """
+    Pin this process to one CPU so timings are not disturbed by core migration.
+
+    Uses AUTOREPRO_BENCH_CPU when set, otherwise the lowest CPU currently
+    allowed. Child processes inherit the mask, so spawned commands and the
+    --persistent helper run on the same core. No-op where the OS lacks
+    sched_setaffinity.
+    """
+    if not hasattr(os, "sched_setaffinity"):
+        return
+    cpu = os.environ.get("AUTOREPRO_BENCH_CPU")
+    os.sched_setaffinity(0, {int(cpu) if cpu else min(os.sched_getaffinity(0))})
+
+
+def run_all_benchmarks(
+    run: Callable[[list[str]], None] = _run_inprocess, serial: bool = False
+) -> dict[str, dict[str, dict[str, float]]]:
+    """Run every benchmark category, spreading iterations over a pool unless serial."""
+    if serial:
+        _pin_to_benchmark_cpu()
+        pool = nullcontext()
+    else:
+        # Iterations are independent of each other, so they spread across cores
+        pool = ProcessPoolExecutor(max_workers=os.cpu_count())
+    with pool as executor:
+        return {
+            "scan": benchmark_scan_commands(executor, run),
+            "plan": benchmark_plan_commands(executor, run),
+            "init": benchmark_init_commands(executor, run),
+            "exec": benchmark_exec_commands(executor, run),
+            "help": benchmark_help_commands(executor, run),
+        }
+
+
+def main(argv: list[str] | None = None):
     """Run comprehensive performance benchmarks."""
+    args = parse_args(argv)
+    if args.repl_bench:
+        _serve_repl_bench()
+        return
+
     print("🚀 AutoRepro Performance Benchmark Suite")
     print("=" * 80)
     print("Running comprehensive performance tests after refactoring...")
     print("Each command is executed multiple times for statistical accuracy.")
+    if not args.serial:
+        print("Iterations run in parallel; pass --serial for absolute timings.")
     print()
 
     # Run all benchmark categories
-    all_results = {
-        "scan": benchmark_scan_commands(),
-        "plan": benchmark_plan_commands(),
-        "init": benchmark_init_commands(),
-        "exec": benchmark_exec_commands(),
-        "help": benchmark_help_commands(),
-    }
+    all_results = run_all_benchmarks(_select_runner(args), serial=args.serial)
 
     print()
     print("📈 PERFORMANCE RESULTS")
     print("=" * 80)
 
     # Display results by category
-    overall_status = []
+    overall_status: Counter[str] = Counter()
 
     for category, results in all_results.items():
         print(f"\n📊 {category.upper()} Commands:")
@@ -314,22 +586,22 @@ def main():
 
             # Track overall status
             if "❌" in status:
-                overall_status.append("REGRESSION")
+                overall_status["REGRESSION"] += 1
             elif "🚀" in status:
-                overall_status.append("IMPROVED")
+                overall_status["IMPROVED"] += 1
             else:
-                overall_status.append("STABLE")
+                overall_status["STABLE"] += 1
 
     # Summary
     print()
     print("📋 PERFORMANCE SUMMARY")
     print("=" * 80)
 
-    regression_count = overall_status.count("REGRESSION")
-    improved_count = overall_status.count("IMPROVED")
-    stable_count = overall_status.count("STABLE")
+    regression_count = overall_status["REGRESSION"]
+    improved_count = overall_status["IMPROVED"]
+    stable_count = overall_status["STABLE"]
 
-    print(f"Commands analyzed: {len(overall_status)}")
+    print(f"Commands analyzed: {overall_status.total()}")
     print(f"Performance regressions: {regression_count}")
     print(f"Performance improvements: {improved_count}")
     print(f"Stable performance: {stable_count}")